@@ -1,19 +1,35 @@
 """
 Minimal in-memory TTL cache for analysis results.
+
+When REDIS_URL is set (and the redis package is installed), analysis results are
+stored in Redis instead so every worker process sees the same cache. Without Redis,
+CACHE_DB_PATH points the shared caches at a local SQLite file, which every worker on
+the instance shares and which survives worker restarts.
 """
+import json
+import logging
+import os
+import sqlite3
+import threading
 import time
 from typing import Any, Optional
 
+logger = logging.getLogger(__name__)
+
 
 class TTLCache:
     """
     Minimal Time-To-Live cache with dict storage of {key: (expires_at, value)}.
     Purges expired entries on get/set operations.
+    
+    Thread-safe: gunicorn gthread workers and io_executor share one instance, so
+    every access to the storage (including the purge) happens under a lock.
     """
     
     def __init__(self):
         """Initialize TTL cache with empty storage."""
         self._storage = {}
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -25,20 +41,22 @@ class TTLCache:
         Returns:
             Cached value if found and not expired, otherwise None.
         """
-        # Purge expired entries
-        self._purge_expired()
-        
-        if key not in self._storage:
-            return None
-        
-        expires_at, value = self._storage[key]
-        
-        # Check if this specific entry is expired
-        if time.time() > expires_at:
-            del self._storage[key]
-            return None
-        
-        return value
+        with self._lock:
+            # Purge expired entries
+            self._purge_expired_locked()
+            
+            entry = self._storage.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value = entry
+            
+            # Check if this specific entry is expired
+            if time.time() > expires_at:
+                del self._storage[key]
+                return None
+            
+            return value
     
     def set(self, key: str, value: Any, ttl: int) -> None:
         """
@@ -49,11 +67,12 @@ class TTLCache:
             value: Value to cache.
             ttl: Time-to-live in seconds.
         """
-        # Purge expired entries
-        self._purge_expired()
-        
-        expires_at = time.time() + ttl
-        self._storage[key] = (expires_at, value)
+        with self._lock:
+            # Purge expired entries
+            self._purge_expired_locked()
+            
+            expires_at = time.time() + ttl
+            self._storage[key] = (expires_at, value)
     
     def delete(self, key: str) -> None:
         """
@@ -62,11 +81,21 @@ class TTLCache:
         Args:
             key: Cache key to delete.
         """
-        if key in self._storage:
-            del self._storage[key]
+        with self._lock:
+            self._storage.pop(key, None)
+    
+    def clear(self) -> None:
+        """Remove all entries from cache."""
+        with self._lock:
+            self._storage.clear()
     
     def _purge_expired(self) -> None:
         """Remove all expired entries from storage."""
+        with self._lock:
+            self._purge_expired_locked()
+    
+    def _purge_expired_locked(self) -> None:
+        """Remove all expired entries from storage; caller holds self._lock."""
         current_time = time.time()
         expired_keys = [
             key for key, (expires_at, _) in self._storage.items()
@@ -76,5 +105,213 @@ class TTLCache:
             del self._storage[key]
 
 
+class RedisCache:
+    """
+    Redis-backed cache with the same get/set/delete API as TTLCache.
+    Values are stored as JSON with SETEX, so they must be JSON-serializable.
+    """
+    
+    def __init__(self, client, prefix: str = 'analysis:'):
+        """
+        Initialize Redis cache.
+        
+        Args:
+            client: redis.Redis client (sharing a connection pool).
+            prefix: Key prefix to namespace entries.
+        """
+        self._client = client
+        self._prefix = prefix
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve value from cache.
+        
+        Args:
+            key: Cache key.
+        
+        Returns:
+            Cached value if found and not expired, otherwise None.
+        """
+        raw = self._client.get(self._prefix + key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+    
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """
+        Store value in cache with TTL.
+        
+        Args:
+            key: Cache key.
+            value: Value to cache (JSON-serializable).
+            ttl: Time-to-live in seconds.
+        """
+        self._client.setex(self._prefix + key, ttl, json.dumps(value))
+    
+    def delete(self, key: str) -> None:
+        """
+        Delete entry from cache.
+        
+        Args:
+            key: Cache key to delete.
+        """
+        self._client.delete(self._prefix + key)
+    
+    def clear(self) -> None:
+        """Remove all entries under this cache's prefix."""
+        keys = list(self._client.scan_iter(match=self._prefix + '*'))
+        if keys:
+            self._client.delete(*keys)
+
+
+class SQLiteCache:
+    """
+    SQLite-backed cache with the same get/set/delete API as TTLCache.
+    Values are stored as JSON, so they must be JSON-serializable (as with RedisCache).
+    
+    All caches share one table keyed by prefix + key. The database runs in WAL mode so
+    readers in other worker processes don't block on a writer; keep the file on local
+    disk, since WAL does not work over network shares such as /home on App Service.
+    """
+    
+    def __init__(self, path: str, prefix: str = 'analysis:'):
+        """
+        Initialize SQLite cache.
+        
+        Args:
+            path: Database file path (created on first use).
+            prefix: Key prefix to namespace entries.
+        """
+        self._path = path
+        self._prefix = prefix
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Open the connection lazily, and again after a fork (gunicorn workers)."""
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self._path, timeout=5, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache '
+                '(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)')
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve value from cache.
+        
+        Args:
+            key: Cache key.
+        
+        Returns:
+            Cached value if found and not expired, otherwise None.
+        """
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT value FROM cache WHERE key = ? AND expires_at > ?',
+                (self._prefix + key, time.time())
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+    
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """
+        Store value in cache with TTL, purging expired entries.
+        
+        Args:
+            key: Cache key.
+            value: Value to cache (JSON-serializable).
+            ttl: Time-to-live in seconds.
+        """
+        payload = json.dumps(value)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute('DELETE FROM cache WHERE expires_at <= ?', (now,))
+            conn.execute(
+                'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                (self._prefix + key, payload, now + ttl)
+            )
+    
+    def delete(self, key: str) -> None:
+        """
+        Delete entry from cache.
+        
+        Args:
+            key: Cache key to delete.
+        """
+        with self._lock:
+            self._connection().execute('DELETE FROM cache WHERE key = ?', (self._prefix + key,))
+    
+    def clear(self) -> None:
+        """Remove all entries under this cache's prefix."""
+        with self._lock:
+            self._connection().execute(
+                'DELETE FROM cache WHERE substr(key, 1, ?) = ?',
+                (len(self._prefix), self._prefix)
+            )
+
+
+_redis_client = None
+
+
+def get_redis_client():
+    """
+    Shared redis.Redis client (one connection pool per process) for REDIS_URL.
+    
+    Returns:
+        redis.Redis client, or None if REDIS_URL is unset or redis is not installed.
+    """
+    global _redis_client
+    if _redis_client is not None:
+        return _redis_client
+    
+    redis_url = os.getenv('REDIS_URL')
+    if not redis_url:
+        return None
+    
+    try:
+        import redis
+    except ImportError:
+        logger.warning("REDIS_URL is set but the redis package is not installed; using in-process storage")
+        return None
+    
+    pool = redis.ConnectionPool.from_url(redis_url)
+    _redis_client = redis.Redis(connection_pool=pool)
+    return _redis_client
+
+
+def create_shared_cache(prefix: str):
+    """
+    Cache shared by all worker processes when Redis or CACHE_DB_PATH is configured.
+    
+    Args:
+        prefix: Key prefix for this cache's entries.
+    
+    Returns:
+        RedisCache when REDIS_URL is configured, SQLiteCache when CACHE_DB_PATH is set,
+        otherwise an in-process TTLCache.
+    """
+    client = get_redis_client()
+    if client is not None:
+        logger.info(f"Cache '{prefix}' backed by Redis")
+        return RedisCache(client, prefix=prefix)
+    
+    db_path = os.getenv('CACHE_DB_PATH')
+    if db_path:
+        logger.info(f"Cache '{prefix}' backed by SQLite at {db_path}")
+        return SQLiteCache(db_path, prefix=prefix)
+    
+    return TTLCache()
+
+
 # Module-level instance
-analysis_cache = TTLCache()
+analysis_cache = create_shared_cache('analysis:')
@@ -1,9 +1,10 @@
 
 from flask import Blueprint, request, session, redirect, url_for, current_app, flash, jsonify
 import msal
-import requests
+from app.services.graph_session import http_session
 import logging
 import secrets
+import time
 from app.services.activity_logger import logger as activity_logger
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
@@ -49,26 +50,26 @@ def get_msal_app():
 def login():
     """Start Microsoft authentication"""
     try:
-        print(f"\n=== DEBUG /auth/login ===")
-        print(f"Session before check: {dict(session)}")
-        print(f"Has access_token: {bool(session.get('access_token'))}")
-        print(f"Has user_email: {bool(session.get('user_email'))}")
+        logger.debug("=== DEBUG /auth/login ===")
+        logger.debug("Session keys before check: %s", list(session.keys()))
+        logger.debug("Has access_token: %s", bool(session.get('access_token')))
+        logger.debug("Has user_email: %s", bool(session.get('user_email')))
         
         # Check if already logged in
         if session.get('access_token') and session.get('user_email'):
             logger.info("User already authenticated, redirecting to home")
-            print(f"DEBUG: Already authenticated, redirecting to index")
-            print(f"DEBUG: url_for('index') = {url_for('index')}")
+            logger.debug("Already authenticated, redirecting to index")
+            logger.debug("url_for('index') = %s", url_for('index'))
             return redirect(url_for('index'))
         
-        print(f"DEBUG: Clearing session")
+        logger.debug("Clearing session")
         # Clear any existing session data to prevent conflicts
         session.clear()
         
         # CSRF protection: generate state token
         state = secrets.token_urlsafe(32)
         session["oauth_state"] = state
-        print(f"DEBUG: Generated OAuth state token")
+        logger.debug("Generated OAuth state token")
         
         # Create auth URL with all required scopes for file access
         # Note: MSAL automatically adds offline_access - do NOT include it explicitly
@@ -86,14 +87,13 @@ def login():
             
         auth_url = msal_app.get_authorization_request_url(**auth_params)
         
-        print(f"DEBUG: REDIRECT_URI configured: {current_app.config['REDIRECT_URI']}")
-        print(f"DEBUG: Auth URL: {auth_url}")
+        logger.debug("REDIRECT_URI configured: %s", current_app.config['REDIRECT_URI'])
+        logger.debug("Auth URL: %s", auth_url)
         logger.info("Redirecting to Microsoft login")
         return redirect(auth_url)
         
     except Exception as e:
         logger.error(f"Login error: {str(e)}")
-        print(f"DEBUG ERROR in login: {str(e)}")
         flash('Authentication error occurred. Please try again.', 'error')
         return redirect('/')
 
@@ -101,26 +101,22 @@ def login():
 def redirect_handler():
     """Handle Microsoft redirect"""
     try:
-        print(f"\n{'='*80}")
-        print(f"=== DEBUG /auth/redirect CALLED ===")
-        print(f"{'='*80}")
-        print(f"Query params: {dict(request.args)}")
-        print(f"Session keys before processing: {list(session.keys())}")
-        print(f"Session ID (if available): {session.get('_id', 'NO SESSION ID')}")
-        print(f"Request URL: {request.url}")
-        print(f"Request headers: {dict(request.headers)}")
+        logger.debug("=== DEBUG /auth/redirect CALLED ===")
+        logger.debug("Query params: %s", dict(request.args))
+        logger.debug("Session keys before processing: %s", list(session.keys()))
+        logger.debug("Session ID (if available): %s", session.get('_id', 'NO SESSION ID'))
+        logger.debug("Request URL: %s", request.url)
         
         # CSRF protection: verify state token
         received_state = request.args.get('state')
         stored_state = session.get('oauth_state')
         
-        print(f"DEBUG: State received: {received_state[:20]}..." if received_state else "DEBUG: No state received")
-        print(f"DEBUG: State stored: {stored_state[:20]}..." if stored_state else "DEBUG: No state stored")
-        print(f"DEBUG: State matches: {received_state == stored_state}")
+        logger.debug("State received: %s, stored: %s", bool(received_state), bool(stored_state))
+        logger.debug("State matches: %s", received_state == stored_state)
         
         if not received_state or received_state != stored_state:
             logger.error("OAuth state mismatch - possible CSRF attack")
-            print(f"DEBUG: CSRF state validation failed")
+            logger.debug("CSRF state validation failed")
             session.clear()
             flash('Invalid authentication state. Please try again.', 'error')
             return redirect('/')
@@ -130,22 +126,22 @@ def redirect_handler():
         error = request.args.get('error')
         error_description = request.args.get('error_description')
         
-        print(f"DEBUG: code present: {bool(code)}")
-        print(f"DEBUG: error: {error}")
+        logger.debug("code present: %s", bool(code))
+        logger.debug("error: %s", error)
         
         if error:
             logger.error(f"OAuth error: {error} - {error_description}")
-            print(f"DEBUG: OAuth error received")
+            logger.debug("OAuth error received")
             flash(f'Login failed: {error_description or error}', 'error')
             return redirect('/')
             
         if not code:
             logger.error("No authorization code received")
-            print(f"DEBUG: No code in redirect")
+            logger.debug("No code in redirect")
             flash('Login failed: No authorization code received', 'error')
             return redirect('/')
         
-        print(f"DEBUG: Exchanging code for token")
+        logger.debug("Exchanging code for token")
         # Exchange code for token - MSAL automatically includes offline_access for refresh token
         msal_app = get_msal_app()
         result = msal_app.acquire_token_by_authorization_code(
@@ -154,43 +150,42 @@ def redirect_handler():
             redirect_uri=current_app.config['REDIRECT_URI']
         )
         
-        print(f"DEBUG: Token result keys: {list(result.keys())}")
-        print(f"DEBUG: Has access_token: {bool(result.get('access_token'))}")
+        logger.debug("Token result keys: %s", list(result.keys()))
+        logger.debug("Has access_token: %s", bool(result.get('access_token')))
         
         if 'access_token' not in result:
             error_desc = result.get('error_description', 'Token acquisition failed')
             logger.error(f"Token acquisition failed: {error_desc}")
-            print(f"DEBUG: Token acquisition failed: {error_desc}")
             flash(f'Authentication failed: {error_desc}', 'error')
             return redirect('/')
         
-        print(f"DEBUG: Getting user info from Graph API")
+        logger.debug("Getting user info from Graph API")
         # Get user info
         headers = {'Authorization': f"Bearer {result['access_token']}"}
-        user_response = requests.get('https://graph.microsoft.com/v1.0/me', headers=headers)
+        user_response = http_session.get('https://graph.microsoft.com/v1.0/me', headers=headers)
         
-        print(f"DEBUG: User info response status: {user_response.status_code}")
+        logger.debug("User info response status: %s", user_response.status_code)
         
         if user_response.status_code != 200:
             logger.error(f"Failed to get user info: {user_response.status_code}")
-            print(f"DEBUG: Failed to get user info")
+            logger.debug("Failed to get user info")
             flash('Failed to get user information', 'error')
             return redirect('/')
         
         user_info = user_response.json()
         email = user_info.get('mail') or user_info.get('userPrincipalName', '')
         
-        print(f"DEBUG: User email: {email}")
+        logger.debug("User email: %s", email)
         
         # Check domain restriction (allow peakmade.com)
         if not email.lower().endswith('@peakmade.com'):
             logger.warning(f"Domain restriction: {email} not allowed")
-            print(f"DEBUG: Domain restriction failed for {email}")
+            logger.debug("Domain restriction failed for %s", email)
             flash('Access denied. Only @peakmade.com email addresses are allowed.', 'error')
             session.clear()
             return redirect('/')
         
-        print(f"DEBUG: Setting session data")
+        logger.debug("Setting session data")
         # Store tokens and expiration (refresh_token enables silent renewal)
         session['access_token'] = result['access_token']
         session['refresh_token'] = result.get('refresh_token')  # Will be None if offline_access not granted
@@ -201,11 +196,11 @@ def redirect_handler():
         token_expires_at = datetime.now(tz.utc) + timedelta(seconds=expires_in)
         session['token_expires_at'] = token_expires_at.isoformat()
         
-        # Store login time for absolute session timeout (security requirement)
-        session['login_time'] = datetime.now(tz.utc).isoformat()
-        print(f"DEBUG: Login time set: {session['login_time']}")
-        print(f"DEBUG: Token expires at: {token_expires_at} (in {expires_in} seconds)")
-        print(f"DEBUG: Refresh token available: {bool(result.get('refresh_token'))}")
+        # Store login time (epoch seconds) for absolute session timeout (security requirement)
+        session['login_time_ts'] = int(time.time())
+        logger.debug("Login time set: %s", session['login_time_ts'])
+        logger.debug("Token expires at: %s (in %s seconds)", token_expires_at, expires_in)
+        logger.debug("Refresh token available: %s", bool(result.get('refresh_token')))
         
         # Construct full name from first and last name if available
         given_name = user_info.get('givenName', '')
@@ -218,68 +213,54 @@ def redirect_handler():
         
         session['user_name'] = user_name
         session['user_email'] = email
+        session['user_email_lc'] = email.lower()  # pre-normalized for per-request access checks
         
         # Check admin status and cache in session
         from app.utils.admin_utils import is_admin
         admin_status = is_admin(email)
         session['is_admin'] = admin_status
-        print(f"DEBUG: Admin status for {email}: {admin_status}")
+        session['admin_check_email'] = email  # admin_required keeps this in sync with the shared admin cache
+        logger.debug("Admin status for %s: %s", email, admin_status)
         
-        print(f"DEBUG: Session keys after setting: {list(session.keys())}")
-        print(f"DEBUG: Verifying session values:")
-        print(f"  - access_token present: {bool(session.get('access_token'))}")
-        print(f"  - user_email: {session.get('user_email')}")
-        print(f"  - user_name: {session.get('user_name')}")
-        print(f"  - is_admin: {session.get('is_admin')}")
+        logger.debug("Session keys after setting: %s", list(session.keys()))
+        logger.debug("Verifying session values:")
+        logger.debug("  - access_token present: %s", bool(session.get('access_token')))
+        logger.debug("  - user_email: %s", session.get('user_email'))
+        logger.debug("  - user_name: %s", session.get('user_name'))
+        logger.debug("  - is_admin: %s", session.get('is_admin'))
         
         # CRITICAL: Force save the session
         session.modified = True
-        print(f"DEBUG: session.modified set to True to force save")
+        logger.debug("session.modified set to True to force save")
         
         # Log the user login to SharePoint
-        print(f"\n{'*'*60}")
-        print(f"DEBUG: ATTEMPTING TO LOG LOGIN TO SHAREPOINT")
-        print(f"DEBUG: Email: {email}")
-        print(f"DEBUG: Display Name: {user_name}")
-        print(f"{'*'*60}")
+        logger.debug("Logging login to SharePoint for %s (%s)", email, user_name)
         
         try:
             login_result = activity_logger.log_login(
                 user_email=email,
                 user_display_name=user_name
             )
-            print(f"\n{'*'*60}")
-            print(f"DEBUG: LOGIN LOGGING RESULT: {login_result}")
-            print(f"{'*'*60}\n")
+            logger.debug("Login logging result: %s", login_result)
         except Exception as e:
-            print(f"\n{'*'*60}")
-            print(f"DEBUG: EXCEPTION CALLING log_login(): {e}")
-            import traceback
-            traceback.print_exc()
-            print(f"{'*'*60}\n")
+            logger.exception("Exception calling log_login(): %s", e)
         
         logger.info(f"Authentication successful for {email}")
         flash(f"Welcome, {user_name}!", 'success')
         
         # Redirect to intended page or homepage
         next_url = session.pop('next_url', '/')
-        print(f"DEBUG: Redirecting to next_url: {next_url}")
-        print(f"DEBUG: url_for('index') would be: {url_for('index')}")
-        print(f"DEBUG: Final session state before redirect:")
-        print(f"  - Session keys: {list(session.keys())}")
-        print(f"  - access_token: {session.get('access_token')[:20]}..." if session.get('access_token') else "  - access_token: None")
-        print(f"  - user_email: {session.get('user_email')}")
-        print(f"{'='*80}")
-        print(f"=== REDIRECT HANDLER COMPLETE - REDIRECTING NOW ===")
-        print(f"{'='*80}\n")
+        logger.debug("Redirecting to next_url: %s", next_url)
+        logger.debug("url_for('index') would be: %s", url_for('index'))
+        logger.debug("Final session state before redirect:")
+        logger.debug("  - Session keys: %s", list(session.keys()))
+        logger.debug("  - user_email: %s", session.get('user_email'))
+        logger.debug("=== REDIRECT HANDLER COMPLETE - REDIRECTING NOW ===")
         
         return redirect(next_url)
         
     except Exception as e:
-        logger.error(f"Auth redirect error: {str(e)}")
-        print(f"DEBUG ERROR in redirect_handler: {str(e)}")
-        import traceback
-        print(f"DEBUG Traceback: {traceback.format_exc()}")
+        logger.exception(f"Auth redirect error: {str(e)}")
         flash('Authentication error occurred. Please try again.', 'error')
         session.clear()
         return redirect('/')
@@ -299,9 +280,9 @@ def logout():
             activity_logger.log_end_session(user_email=user_email, user_display_name=user_name)
             # Log Logout activity
             activity_logger.log_logout(user_email=user_email, user_display_name=user_name)
-            print(f"DEBUG: Logged End Session and Logout for {user_email}")
+            logger.debug("Logged End Session and Logout for %s", user_email)
         except Exception as e:
-            print(f"DEBUG: Failed to log logout activities: {e}")
+            logger.warning("Failed to log logout activities: %s", e)
             # Non-critical - don't block logout
         
         # Flask-Session automatically handles session file deletion when session.clear() is called
@@ -312,7 +293,7 @@ def logout():
         # Use Azure Easy Auth logout with relative path redirect
         # This logs user out of the app only, not their entire Microsoft account
         # The logged_out parameter will trigger account picker on re-login
-        print(f"DEBUG: User {user_email} logged out, redirecting to Easy Auth logout")
+        logger.debug("User %s logged out, redirecting to Easy Auth logout", user_email)
         
         flash('You have been logged out successfully.', 'info')
         logout_url = '/.auth/logout?post_logout_redirect_uri=/auth/login?logged_out=true'
@@ -320,7 +301,6 @@ def logout():
         
     except Exception as e:
         logger.error(f"Logout error: {str(e)}")
-        print(f"DEBUG ERROR in logout: {str(e)}")
         session.clear()
         return redirect('/')
 
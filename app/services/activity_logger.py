@@ -4,10 +4,14 @@ Logs user activities to SharePoint list for auditing and tracking
 """
 
 import os
-import requests
+import logging
+from app.services.graph_session import http_session
 from datetime import datetime
 from flask import session
 
+# Module logger (the name 'logger' is taken by the ActivityLogger instance below)
+_log = logging.getLogger(__name__)
+
 
 class ActivityLogger:
     def log_start_session(self, user_email=None, user_display_name=None):
@@ -52,20 +56,18 @@ class ActivityLogger:
 
     def _log_activity_type(self, activity_type, user_email=None, user_display_name=None):
         """Helper to log a generic activity type with standard fields"""
-        print(f"\n{'='*60}")
-        print(f"[ActivityLogger] LOGGING ACTIVITY TYPE: {activity_type}")
-        print(f"[ActivityLogger] Input params - email: {user_email}, display_name: {user_display_name}")
-        print(f"{'='*60}")
+        _log.debug("[ActivityLogger] LOGGING ACTIVITY TYPE: %s", activity_type)
+        _log.debug("[ActivityLogger] Input params - email: %s, display_name: %s", user_email, user_display_name)
         try:
             # Get user info from session if not provided
             if not user_email:
                 user = session.get('user', {})
                 user_email = user.get('email') or session.get('user_email', 'unknown@unknown.com')
-                print(f"[ActivityLogger] Extracted email from session: {user_email}")
+                _log.debug("[ActivityLogger] Extracted email from session: %s", user_email)
             if not user_display_name:
                 user = session.get('user', {})
                 user_display_name = user.get('name') or session.get('user_name', 'Unknown User')
-                print(f"[ActivityLogger] Extracted display name from session: {user_display_name}")
+                _log.debug("[ActivityLogger] Extracted display name from session: %s", user_display_name)
             is_admin = session.get('is_admin', False)
             user_role = 'Admin' if is_admin else 'User'
             timestamp = datetime.utcnow().isoformat() + 'Z'
@@ -82,49 +84,40 @@ class ActivityLogger:
                     'Env': app_env
                 }
             }
-            print(f"[ActivityLogger] DEBUG: {activity_type} log data prepared:")
-            print(f"[ActivityLogger]   - Title: {user_email}")
-            print(f"[ActivityLogger]   - UserEmail: {user_email}")
-            print(f"[ActivityLogger]   - UserName: {user_display_name}")
-            print(f"[ActivityLogger]   - LoginTimestamp: {timestamp}")
-            print(f"[ActivityLogger]   - UserRole: {user_role}")
-            print(f"[ActivityLogger]   - ActivityType: {activity_type}")
-            print(f"[ActivityLogger]   - Application: Contract Analyzer")
-            print(f"[ActivityLogger]   - Env: {app_env}")
+            _log.debug("[ActivityLogger] %s log data prepared:", activity_type)
+            _log.debug("[ActivityLogger]   - Title: %s", user_email)
+            _log.debug("[ActivityLogger]   - UserEmail: %s", user_email)
+            _log.debug("[ActivityLogger]   - UserName: %s", user_display_name)
+            _log.debug("[ActivityLogger]   - LoginTimestamp: %s", timestamp)
+            _log.debug("[ActivityLogger]   - UserRole: %s", user_role)
+            _log.debug("[ActivityLogger]   - ActivityType: %s", activity_type)
+            _log.debug("[ActivityLogger]   - Application: Contract Analyzer")
+            _log.debug("[ActivityLogger]   - Env: %s", app_env)
             headers = self._get_headers()
             if not headers:
-                print(f"[ActivityLogger] ✗✗✗ ERROR: Failed to get authorization headers")
-                print(f"{'='*60}\n")
+                _log.error("[ActivityLogger] ✗✗✗ ERROR: Failed to get authorization headers")
                 return False
             site_id = os.getenv('O365_SITE_ID')
-            print(f"[ActivityLogger] DEBUG: Site ID from env: {site_id}")
-            print(f"[ActivityLogger] DEBUG: Log List ID: {self.log_list_id}")
+            _log.debug("[ActivityLogger] Site ID from env: %s", site_id)
+            _log.debug("[ActivityLogger] Log List ID: %s", self.log_list_id)
             if not site_id:
-                print(f"[ActivityLogger] ✗✗✗ ERROR: O365_SITE_ID not found in environment")
-                print(f"{'='*60}\n")
+                _log.error("[ActivityLogger] ✗✗✗ ERROR: O365_SITE_ID not found in environment")
                 return False
             endpoint = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{self.log_list_id}/items"
-            print(f"[ActivityLogger] DEBUG: Posting to endpoint: {endpoint}")
-            response = requests.post(endpoint, headers=headers, json=log_data)
-            print(f"[ActivityLogger] STEP 6: Processing response...")
-            print(f"[ActivityLogger] Response status code: {response.status_code}")
+            _log.debug("[ActivityLogger] Posting to endpoint: %s", endpoint)
+            response = http_session.post(endpoint, headers=headers, json=log_data)
+            _log.debug("[ActivityLogger] STEP 6: Processing response...")
+            _log.debug("[ActivityLogger] Response status code: %s", response.status_code)
             if response.status_code == 201:
-                print(f"[ActivityLogger] ✓✓✓ {activity_type.upper()} LOGGED SUCCESSFULLY")
-                print(f"[ActivityLogger] Response body: {response.text[:500]}")
-                print(f"{'='*60}\n")
+                _log.debug("[ActivityLogger] ✓✓✓ %s LOGGED SUCCESSFULLY", activity_type.upper())
+                _log.debug("[ActivityLogger] Response body: %s", response.text[:500])
                 return True
             else:
-                print(f"[ActivityLogger] ✗✗✗ FAILED TO LOG {activity_type.upper()}")
-                print(f"[ActivityLogger] Status: {response.status_code}")
-                print(f"[ActivityLogger] Response: {response.text}")
-                print(f"{'='*60}\n")
+                _log.warning("[ActivityLogger] ✗✗✗ FAILED TO LOG %s (status %s)", activity_type.upper(), response.status_code)
+                _log.debug("[ActivityLogger] Response: %s", response.text)
                 return False
-        except Exception as e:
-            print(f"[ActivityLogger] ✗✗✗ EXCEPTION LOGGING {activity_type.upper()}: {e}")
-            print(f"[ActivityLogger] Exception type: {type(e).__name__}")
-            import traceback
-            traceback.print_exc()
-            print(f"{'='*60}\n")
+        except Exception:
+            _log.exception("[ActivityLogger] ✗✗✗ EXCEPTION LOGGING %s", activity_type.upper())
             return False
     """Service for logging user activities to SharePoint"""
     
@@ -138,14 +131,11 @@ class ActivityLogger:
         try:
             # Get access token from session (same pattern as other services)
             access_token = session.get('access_token')
-            print(f"[ActivityLogger] DEBUG: Session keys: {list(session.keys())}")
-            print(f"[ActivityLogger] DEBUG: Has access_token: {bool(access_token)}")
-            if access_token:
-                print(f"[ActivityLogger] DEBUG: Token length: {len(access_token)}")
-                print(f"[ActivityLogger] DEBUG: Token prefix: {access_token[:20]}...")
+            _log.debug("[ActivityLogger] Session keys: %s", list(session.keys()))
+            _log.debug("[ActivityLogger] Has access_token: %s", bool(access_token))
             
             if not access_token:
-                print(f"[ActivityLogger] ERROR: No access token in session")
+                _log.debug("[ActivityLogger] No access token in session")
                 return None
             
             headers = {
@@ -153,12 +143,10 @@ class ActivityLogger:
                 'Content-Type': 'application/json',
                 'Accept': 'application/json'
             }
-            print(f"[ActivityLogger] DEBUG: Headers created successfully")
+            _log.debug("[ActivityLogger] Headers created successfully")
             return headers
-        except Exception as e:
-            print(f"[ActivityLogger] ERROR: Exception getting headers: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            _log.exception("[ActivityLogger] ✗✗✗ ERROR: Exception getting headers")
             return None
     
     def log_analysis(self, contract_name=None, status='Success', user_email=None, user_display_name=None):
@@ -174,25 +162,23 @@ class ActivityLogger:
         Returns:
             bool: True if logged successfully, False otherwise
         """
-        print(f"\n{'='*60}")
-        print(f"[ActivityLogger] START LOGGING ATTEMPT")
-        print(f"{'='*60}")
+        _log.debug("[ActivityLogger] START LOGGING ATTEMPT")
         
         try:
             # Get user info from session if not provided
-            print(f"[ActivityLogger] DEBUG: Getting user info...")
-            print(f"[ActivityLogger] DEBUG: Provided user_email: {user_email}")
-            print(f"[ActivityLogger] DEBUG: Provided user_display_name: {user_display_name}")
+            _log.debug("[ActivityLogger] Getting user info...")
+            _log.debug("[ActivityLogger] Provided user_email: %s", user_email)
+            _log.debug("[ActivityLogger] Provided user_display_name: %s", user_display_name)
             
             if not user_email:
                 user = session.get('user', {})
                 user_email = user.get('email') or session.get('user_email', 'unknown@unknown.com')
-                print(f"[ActivityLogger] DEBUG: Extracted user_email from session: {user_email}")
+                _log.debug("[ActivityLogger] Extracted user_email from session: %s", user_email)
             
             if not user_display_name:
                 user = session.get('user', {})
                 user_display_name = user.get('name') or session.get('user_name', 'Unknown User')
-                print(f"[ActivityLogger] DEBUG: Extracted user_display_name from session: {user_display_name}")
+                _log.debug("[ActivityLogger] Extracted user_display_name from session: %s", user_display_name)
             
             # Prepare the log entry data using Graph API format
             # IMPORTANT: Must use INTERNAL field names from SharePoint, not display names
@@ -214,59 +200,54 @@ class ActivityLogger:
             
             log_data = {'fields': fields}
             
-            print(f"[ActivityLogger] DEBUG: Log data prepared:")
-            print(f"[ActivityLogger]   - Title: {fields.get('Title')}")
-            print(f"[ActivityLogger]   - UserEmail: {user_email}")
-            print(f"[ActivityLogger]   - UserDisplayName: {user_display_name}")
-            print(f"[ActivityLogger]   - Contractname: {fields.get('Contractname', 'N/A')}")
-            print(f"[ActivityLogger]   - TimeofAnalysis: {fields.get('TimeofAnalysis', 'N/A')}")
-            print(f"[ActivityLogger]   - AnalysisSuccessorFail: {fields.get('AnalysisSuccessorFail', 'N/A')}")
+            _log.debug("[ActivityLogger] Log data prepared:")
+            _log.debug("[ActivityLogger]   - Title: %s", fields.get('Title'))
+            _log.debug("[ActivityLogger]   - UserEmail: %s", user_email)
+            _log.debug("[ActivityLogger]   - UserDisplayName: %s", user_display_name)
+            _log.debug("[ActivityLogger]   - Contractname: %s", fields.get('Contractname', 'N/A'))
+            _log.debug("[ActivityLogger]   - TimeofAnalysis: %s", fields.get('TimeofAnalysis', 'N/A'))
+            _log.debug("[ActivityLogger]   - AnalysisSuccessorFail: %s", fields.get('AnalysisSuccessorFail', 'N/A'))
             
             # Get authorization headers
-            print(f"[ActivityLogger] DEBUG: Getting authorization headers...")
+            _log.debug("[ActivityLogger] Getting authorization headers...")
             headers = self._get_headers()
             if not headers:
-                print("[ActivityLogger] ERROR: Failed to get authorization headers")
+                _log.error("[ActivityLogger] ✗✗✗ ERROR: Failed to get authorization headers")
                 return False
             
             # Get site ID from environment
-            print(f"[ActivityLogger] DEBUG: Getting site ID from environment...")
+            _log.debug("[ActivityLogger] Getting site ID from environment...")
             site_id = os.getenv('O365_SITE_ID')
-            print(f"[ActivityLogger] DEBUG: Site ID: {site_id}")
-            print(f"[ActivityLogger] DEBUG: Log List ID: {self.log_list_id}")
+            _log.debug("[ActivityLogger] Site ID: %s", site_id)
+            _log.debug("[ActivityLogger] Log List ID: %s", self.log_list_id)
             
             if not site_id:
-                print("[ActivityLogger] ERROR: O365_SITE_ID not found in environment")
+                _log.error("[ActivityLogger] ✗✗✗ ERROR: O365_SITE_ID not found in environment")
                 return False
             
             # Use Microsoft Graph API endpoint for list items (compatible with Graph API token)
             endpoint = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{self.log_list_id}/items"
             
-            print(f"[ActivityLogger] DEBUG: Endpoint URL: {endpoint}")
-            print(f"[ActivityLogger] DEBUG: Sending POST request...")
+            _log.debug("[ActivityLogger] Endpoint URL: %s", endpoint)
+            _log.debug("[ActivityLogger] Sending POST request...")
             
             # Send POST request to create log entry
-            response = requests.post(endpoint, json=log_data, headers=headers, timeout=10)
+            response = http_session.post(endpoint, json=log_data, headers=headers, timeout=10)
             
-            print(f"[ActivityLogger] DEBUG: Response status: {response.status_code}")
-            print(f"[ActivityLogger] DEBUG: Response headers: {dict(response.headers)}")
-            print(f"[ActivityLogger] DEBUG: Response body: {response.text[:500]}")
+            _log.debug("[ActivityLogger] Response status: %s", response.status_code)
+            _log.debug("[ActivityLogger] Response headers: %s", dict(response.headers))
+            _log.debug("[ActivityLogger] Response body: %s", response.text[:500])
             
             if response.status_code in [200, 201]:
-                print(f"[ActivityLogger] ✓✓✓ SUCCESS! Logged analysis for: {contract_name}")
-                print(f"{'='*60}\n")
+                _log.debug("[ActivityLogger] ✓✓✓ SUCCESS! Logged analysis for: %s", contract_name)
                 return True
             else:
-                print(f"[ActivityLogger] ✗✗✗ FAILED! Status: {response.status_code}")
-                print(f"[ActivityLogger] Full response: {response.text}")
-                print(f"{'='*60}\n")
+                _log.warning("[ActivityLogger] ✗✗✗ FAILED TO LOG ANALYSIS (status %s)", response.status_code)
+                _log.debug("[ActivityLogger] Full response: %s", response.text)
                 return False
                 
-        except Exception as e:
-            print(f"[ActivityLogger] ✗✗✗ EXCEPTION: {e}")
-            import traceback
-            traceback.print_exc()
-            print(f"{'='*60}\n")
+        except Exception:
+            _log.exception("[ActivityLogger] ✗✗✗ EXCEPTION LOGGING ANALYSIS")
             return False
     
     def log_analysis_start(self, contract_name, user_email=None, user_display_name=None):
@@ -292,29 +273,27 @@ class ActivityLogger:
         Returns:
             bool: True if logged successfully, False otherwise
         """
-        print(f"\n{'='*60}")
-        print(f"[ActivityLogger] LOGGING USER LOGIN - METHOD CALLED")
-        print(f"[ActivityLogger] Input params - email: {user_email}, display_name: {user_display_name}")
-        print(f"{'='*60}")
+        _log.debug("[ActivityLogger] LOGGING USER LOGIN - METHOD CALLED")
+        _log.debug("[ActivityLogger] Input params - email: %s, display_name: %s", user_email, user_display_name)
         
         try:
-            print(f"[ActivityLogger] STEP 1: Getting user info...")
+            _log.debug("[ActivityLogger] STEP 1: Getting user info...")
             # Get user info from session if not provided
             if not user_email:
                 user = session.get('user', {})
                 user_email = user.get('email') or session.get('user_email', 'unknown@unknown.com')
-                print(f"[ActivityLogger] Extracted email from session: {user_email}")
+                _log.debug("[ActivityLogger] Extracted email from session: %s", user_email)
             
             if not user_display_name:
                 user = session.get('user', {})
                 user_display_name = user.get('name') or session.get('user_name', 'Unknown User')
-                print(f"[ActivityLogger] Extracted display name from session: {user_display_name}")
+                _log.debug("[ActivityLogger] Extracted display name from session: %s", user_display_name)
             
             # Get user role (admin or user)
             is_admin = session.get('is_admin', False)
             user_role = 'Admin' if is_admin else 'User'
             
-            print(f"[ActivityLogger] STEP 2: Preparing log data...")
+            _log.debug("[ActivityLogger] STEP 2: Preparing log data...")
             # Prepare the log entry for Innovation Use Log
             timestamp = datetime.utcnow().isoformat() + 'Z'
             app_env = os.getenv('APP_ENV', 'Unknown')
@@ -331,66 +310,57 @@ class ActivityLogger:
                 }
             }
             
-            print(f"[ActivityLogger] DEBUG: Login log data prepared:")
-            print(f"[ActivityLogger]   - Title: {user_email}")
-            print(f"[ActivityLogger]   - UserEmail: {user_email}")
-            print(f"[ActivityLogger]   - UserName: {user_display_name}")
-            print(f"[ActivityLogger]   - LoginTimestamp: {timestamp}")
-            print(f"[ActivityLogger]   - UserRole: {user_role}")
-            print(f"[ActivityLogger]   - ActivityType: Login")
-            print(f"[ActivityLogger]   - Application: Contract Analyzer")
-            print(f"[ActivityLogger] Full log_data JSON: {log_data}")
-            
-            print(f"[ActivityLogger] STEP 3: Getting authorization headers...")
+            _log.debug("[ActivityLogger] Login log data prepared:")
+            _log.debug("[ActivityLogger]   - Title: %s", user_email)
+            _log.debug("[ActivityLogger]   - UserEmail: %s", user_email)
+            _log.debug("[ActivityLogger]   - UserName: %s", user_display_name)
+            _log.debug("[ActivityLogger]   - LoginTimestamp: %s", timestamp)
+            _log.debug("[ActivityLogger]   - UserRole: %s", user_role)
+            _log.debug("[ActivityLogger]   - ActivityType: Login")
+            _log.debug("[ActivityLogger]   - Application: Contract Analyzer")
+            _log.debug("[ActivityLogger] Full log_data JSON: %s", log_data)
+            
+            _log.debug("[ActivityLogger] STEP 3: Getting authorization headers...")
             # Get authorization headers
             headers = self._get_headers()
             if not headers:
-                print("[ActivityLogger] ✗✗✗ ERROR: Failed to get authorization headers")
-                print(f"{'='*60}\n")
+                _log.error("[ActivityLogger] ✗✗✗ ERROR: Failed to get authorization headers")
                 return False
-            print(f"[ActivityLogger] ✓ Headers obtained successfully")
+            _log.debug("[ActivityLogger] ✓ Headers obtained successfully")
             
-            print(f"[ActivityLogger] STEP 4: Getting site ID from environment...")
+            _log.debug("[ActivityLogger] STEP 4: Getting site ID from environment...")
             # Get site ID from environment variable
             site_id = os.getenv('O365_SITE_ID')
-            print(f"[ActivityLogger] DEBUG: Site ID from env: {site_id}")
-            print(f"[ActivityLogger] DEBUG: Log List ID: {self.log_list_id}")
+            _log.debug("[ActivityLogger] Site ID from env: %s", site_id)
+            _log.debug("[ActivityLogger] Log List ID: %s", self.log_list_id)
             
             if not site_id:
-                print("[ActivityLogger] ✗✗✗ ERROR: O365_SITE_ID not found in environment")
-                print(f"{'='*60}\n")
+                _log.error("[ActivityLogger] ✗✗✗ ERROR: O365_SITE_ID not found in environment")
                 return False
-            print(f"[ActivityLogger] ✓ Site ID obtained: {site_id}")
+            _log.debug("[ActivityLogger] ✓ Site ID obtained: %s", site_id)
             
-            print(f"[ActivityLogger] STEP 5: Posting to SharePoint...")
+            _log.debug("[ActivityLogger] STEP 5: Posting to SharePoint...")
             # Post to SharePoint list
             endpoint = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{self.log_list_id}/items"
-            print(f"[ActivityLogger] DEBUG: Posting to endpoint: {endpoint}")
-            print(f"[ActivityLogger] DEBUG: Log list ID: {self.log_list_id}")
+            _log.debug("[ActivityLogger] Posting to endpoint: %s", endpoint)
+            _log.debug("[ActivityLogger] Log list ID: %s", self.log_list_id)
             
-            response = requests.post(endpoint, headers=headers, json=log_data)
+            response = http_session.post(endpoint, headers=headers, json=log_data)
             
-            print(f"[ActivityLogger] STEP 6: Processing response...")
-            print(f"[ActivityLogger] Response status code: {response.status_code}")
+            _log.debug("[ActivityLogger] STEP 6: Processing response...")
+            _log.debug("[ActivityLogger] Response status code: %s", response.status_code)
             
             if response.status_code == 201:
-                print(f"[ActivityLogger] ✓✓✓ LOGIN LOGGED SUCCESSFULLY")
-                print(f"[ActivityLogger] Response body: {response.text[:500]}")
-                print(f"{'='*60}\n")
+                _log.debug("[ActivityLogger] ✓✓✓ LOGIN LOGGED SUCCESSFULLY")
+                _log.debug("[ActivityLogger] Response body: %s", response.text[:500])
                 return True
             else:
-                print(f"[ActivityLogger] ✗✗✗ FAILED TO LOG LOGIN")
-                print(f"[ActivityLogger] Status: {response.status_code}")
-                print(f"[ActivityLogger] Response: {response.text}")
-                print(f"{'='*60}\n")
+                _log.warning("[ActivityLogger] ✗✗✗ FAILED TO LOG LOGIN (status %s)", response.status_code)
+                _log.debug("[ActivityLogger] Response: %s", response.text)
                 return False
                 
-        except Exception as e:
-            print(f"[ActivityLogger] ✗✗✗ EXCEPTION LOGGING LOGIN: {e}")
-            print(f"[ActivityLogger] Exception type: {type(e).__name__}")
-            import traceback
-            traceback.print_exc()
-            print(f"{'='*60}\n")
+        except Exception:
+            _log.exception("[ActivityLogger] ✗✗✗ EXCEPTION LOGGING LOGIN")
             return False
     
     def log_logout(self, user_email=None, user_display_name=None):
@@ -404,29 +374,27 @@ class ActivityLogger:
         Returns:
             bool: True if logged successfully, False otherwise
         """
-        print(f"\n{'='*60}")
-        print(f"[ActivityLogger] LOGGING USER LOGOUT - METHOD CALLED")
-        print(f"[ActivityLogger] Input params - email: {user_email}, display_name: {user_display_name}")
-        print(f"{'='*60}")
+        _log.debug("[ActivityLogger] LOGGING USER LOGOUT - METHOD CALLED")
+        _log.debug("[ActivityLogger] Input params - email: %s, display_name: %s", user_email, user_display_name)
         
         try:
-            print(f"[ActivityLogger] STEP 1: Getting user info...")
+            _log.debug("[ActivityLogger] STEP 1: Getting user info...")
             # Get user info from session if not provided (before session is cleared)
             if not user_email:
                 user = session.get('user', {})
                 user_email = user.get('email') or session.get('user_email', 'unknown@unknown.com')
-                print(f"[ActivityLogger] Extracted email from session: {user_email}")
+                _log.debug("[ActivityLogger] Extracted email from session: %s", user_email)
             
             if not user_display_name:
                 user = session.get('user', {})
                 user_display_name = user.get('name') or session.get('user_name', 'Unknown User')
-                print(f"[ActivityLogger] Extracted display name from session: {user_display_name}")
+                _log.debug("[ActivityLogger] Extracted display name from session: %s", user_display_name)
             
             # Get user role (admin or user)
             is_admin = session.get('is_admin', False)
             user_role = 'Admin' if is_admin else 'User'
             
-            print(f"[ActivityLogger] STEP 2: Preparing log data...")
+            _log.debug("[ActivityLogger] STEP 2: Preparing log data...")
             # Prepare the log entry for Innovation Use Log
             timestamp = datetime.utcnow().isoformat() + 'Z'
             app_env = os.getenv('APP_ENV', 'Unknown')
@@ -443,64 +411,55 @@ class ActivityLogger:
                 }
             }
             
-            print(f"[ActivityLogger] DEBUG: Logout log data prepared:")
-            print(f"[ActivityLogger]   - Title: {user_email}")
-            print(f"[ActivityLogger]   - UserEmail: {user_email}")
-            print(f"[ActivityLogger]   - UserName: {user_display_name}")
-            print(f"[ActivityLogger]   - LoginTimestamp: {timestamp}")
-            print(f"[ActivityLogger]   - UserRole: {user_role}")
-            print(f"[ActivityLogger]   - ActivityType: Logout")
-            print(f"[ActivityLogger]   - Application: Contract Analyzer")
+            _log.debug("[ActivityLogger] Logout log data prepared:")
+            _log.debug("[ActivityLogger]   - Title: %s", user_email)
+            _log.debug("[ActivityLogger]   - UserEmail: %s", user_email)
+            _log.debug("[ActivityLogger]   - UserName: %s", user_display_name)
+            _log.debug("[ActivityLogger]   - LoginTimestamp: %s", timestamp)
+            _log.debug("[ActivityLogger]   - UserRole: %s", user_role)
+            _log.debug("[ActivityLogger]   - ActivityType: Logout")
+            _log.debug("[ActivityLogger]   - Application: Contract Analyzer")
             
-            print(f"[ActivityLogger] STEP 3: Getting authorization headers...")
+            _log.debug("[ActivityLogger] STEP 3: Getting authorization headers...")
             # Get authorization headers
             headers = self._get_headers()
             if not headers:
-                print("[ActivityLogger] ✗✗✗ ERROR: Failed to get authorization headers")
-                print(f"{'='*60}\n")
+                _log.error("[ActivityLogger] ✗✗✗ ERROR: Failed to get authorization headers")
                 return False
-            print(f"[ActivityLogger] ✓ Headers obtained successfully")
+            _log.debug("[ActivityLogger] ✓ Headers obtained successfully")
             
-            print(f"[ActivityLogger] STEP 4: Getting site ID from environment...")
+            _log.debug("[ActivityLogger] STEP 4: Getting site ID from environment...")
             # Get site ID from environment variable
             site_id = os.getenv('O365_SITE_ID')
-            print(f"[ActivityLogger] DEBUG: Site ID from env: {site_id}")
-            print(f"[ActivityLogger] DEBUG: Log List ID: {self.log_list_id}")
+            _log.debug("[ActivityLogger] Site ID from env: %s", site_id)
+            _log.debug("[ActivityLogger] Log List ID: %s", self.log_list_id)
             
             if not site_id:
-                print("[ActivityLogger] ✗✗✗ ERROR: O365_SITE_ID not found in environment")
-                print(f"{'='*60}\n")
+                _log.error("[ActivityLogger] ✗✗✗ ERROR: O365_SITE_ID not found in environment")
                 return False
-            print(f"[ActivityLogger] ✓ Site ID obtained: {site_id}")
+            _log.debug("[ActivityLogger] ✓ Site ID obtained: %s", site_id)
             
-            print(f"[ActivityLogger] STEP 5: Posting to SharePoint...")
+            _log.debug("[ActivityLogger] STEP 5: Posting to SharePoint...")
             # Post to SharePoint list
             endpoint = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{self.log_list_id}/items"
-            print(f"[ActivityLogger] DEBUG: Posting to endpoint: {endpoint}")
+            _log.debug("[ActivityLogger] Posting to endpoint: %s", endpoint)
             
-            response = requests.post(endpoint, headers=headers, json=log_data)
+            response = http_session.post(endpoint, headers=headers, json=log_data)
             
-            print(f"[ActivityLogger] STEP 6: Processing response...")
-            print(f"[ActivityLogger] Response status code: {response.status_code}")
+            _log.debug("[ActivityLogger] STEP 6: Processing response...")
+            _log.debug("[ActivityLogger] Response status code: %s", response.status_code)
             
             if response.status_code == 201:
-                print(f"[ActivityLogger] ✓✓✓ LOGOUT LOGGED SUCCESSFULLY")
-                print(f"[ActivityLogger] Response body: {response.text[:500]}")
-                print(f"{'='*60}\n")
+                _log.debug("[ActivityLogger] ✓✓✓ LOGOUT LOGGED SUCCESSFULLY")
+                _log.debug("[ActivityLogger] Response body: %s", response.text[:500])
                 return True
             else:
-                print(f"[ActivityLogger] ✗✗✗ FAILED TO LOG LOGOUT")
-                print(f"[ActivityLogger] Status: {response.status_code}")
-                print(f"[ActivityLogger] Response: {response.text}")
-                print(f"{'='*60}\n")
+                _log.warning("[ActivityLogger] ✗✗✗ FAILED TO LOG LOGOUT (status %s)", response.status_code)
+                _log.debug("[ActivityLogger] Response: %s", response.text)
                 return False
                 
-        except Exception as e:
-            print(f"[ActivityLogger] ✗✗✗ EXCEPTION LOGGING LOGOUT: {e}")
-            print(f"[ActivityLogger] Exception type: {type(e).__name__}")
-            import traceback
-            traceback.print_exc()
-            print(f"{'='*60}\n")
+        except Exception:
+            _log.exception("[ActivityLogger] ✗✗✗ EXCEPTION LOGGING LOGOUT")
             return False
 
 
@@ -3,6 +3,7 @@ Analysis orchestrator - coordinates the full contract analysis workflow.
 Combines LLM analysis with SharePoint preferred standards.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -11,6 +12,13 @@ logger = logging.getLogger(__name__)
 # Chunk size for large contracts (in characters)
 CHUNK_SIZE = 14_000  # ~14k chars per chunk to stay well under token limits
 
+# Standards analyzed concurrently (shared across requests to stay within LLM rate limits)
+MAX_CONCURRENT_STANDARDS = 8
+_standards_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_STANDARDS,
+    thread_name_prefix='standard-analysis'
+)
+
 
 def _chunk_text(text: str, chunk_size: int = CHUNK_SIZE) -> List[str]:
     """
@@ -102,6 +110,192 @@ def _analyze_standard_with_chunks(
     }
 
 
+def _analyze_standard(
+    text: str,
+    standard: str,
+    preferred: Dict[str, str],
+    llm_client_analyze
+) -> dict:
+    """
+    Analyze one standard and attach its suggestion source.
+    
+    Args:
+        text: Full contract text.
+        standard: Standard to analyze.
+        preferred: Dictionary of preferred clauses from SharePoint.
+        llm_client_analyze: Function to call for LLM analysis.
+    
+    Returns:
+        Analysis result dictionary with a 'source' key.
+    """
+    # Check if this is a SharePoint preferred standard or custom standard
+    is_preferred_standard = standard in preferred
+    
+    try:
+        # Analyze with LLM (handles chunking internally)
+        result = _analyze_standard_with_chunks(text, standard, llm_client_analyze)
+        
+        if not result['found']:
+            # Standard not found in contract
+            if is_preferred_standard:
+                # Use SharePoint clause directly (don't use AI suggestion)
+                logger.info(f"Using SharePoint preferred clause for: {standard}")
+                result['suggestion'] = preferred[standard]
+                result['source'] = 'sharepoint'
+            else:
+                # Custom standard - keep AI-generated suggestion
+                logger.info(f"Using AI-generated suggestion for custom standard: {standard}")
+                result['source'] = 'ai'
+        else:
+            # Standard found - mark source appropriately
+            result['source'] = 'sharepoint' if is_preferred_standard else 'ai'
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"Failed to analyze standard '{standard}': {e}")
+        
+        # Use preferred clause if available, otherwise provide error message
+        if is_preferred_standard:
+            return {
+                'found': False,
+                'excerpt': None,
+                'location': None,
+                'suggestion': preferred[standard],
+                'source': 'sharepoint'
+            }
+        return {
+            'found': False,
+            'excerpt': None,
+            'location': None,
+            'suggestion': "Unable to analyze this standard due to a technical error.",
+            'source': 'error'
+        }
+
+
+def _check_grammar(text: str, file_path: Optional[str]) -> dict:
+    """
+    Spelling (Word COM, when a file path is available) and AI grammar check.
+    
+    Args:
+        text: The contract text to check.
+        file_path: Optional path to .docx file for Word COM API spelling checking.
+    
+    Returns:
+        Grammar results dict as described in analyze_contract.
+    """
+    logger.debug("STARTING GRAMMAR/SPELLING CHECK")
+    logger.info("Starting grammar/spelling check...")
+    
+    spelling_errors = []
+    grammar_errors = []
+    
+    try:
+        # Step 1: Word COM API for spelling errors (preferred for accuracy)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[DEBUG] file_path parameter: %s", file_path)
+            logger.debug("[DEBUG] file_path type: %s", type(file_path))
+            if file_path:
+                file_path_obj = Path(file_path)
+                logger.debug("[DEBUG] Path object created: %s", file_path_obj)
+                logger.debug("[DEBUG] Path exists: %s", file_path_obj.exists())
+                logger.debug("[DEBUG] Path is_file: %s", file_path_obj.is_file())
+                if file_path_obj.exists():
+                    logger.debug("[DEBUG] File size: %s bytes", file_path_obj.stat().st_size)
+                    logger.debug("[DEBUG] File extension: %s", file_path_obj.suffix)
+            else:
+                logger.debug("[DEBUG] file_path is None or empty")
+        
+        if file_path and Path(file_path).exists():
+            from app.services.word_grammar_checker import check_spelling_with_word
+            logger.debug("[SPELLING CHECK] Using Word COM API for file: %s", file_path)
+            spelling_result = check_spelling_with_word(str(file_path))
+            logger.debug("[SPELLING CHECK] Word COM API returned: %s", spelling_result)
+            spelling_errors = spelling_result.get('errors', [])
+            logger.debug("[SPELLING CHECK] Word COM API check complete: %s spelling errors found", len(spelling_errors))
+            logger.debug("[SPELLING CHECK] Raw counts: %s", spelling_result.get('raw_counts', {}))
+        else:
+            logger.debug("[SPELLING CHECK] No file path provided or file doesn't exist, skipping Word COM check")
+            if file_path:
+                logger.debug("[SPELLING CHECK] file_path was: %s", file_path)
+        
+        # Step 2: AI Grammar Check (for legal contract grammar analysis)
+        logger.debug("[GRAMMAR CHECK] Starting AI-powered grammar analysis...")
+        try:
+            from app.services.llm_client import check_grammar
+            
+            # Call AI grammar check
+            grammar_response = check_grammar(text, max_words=3000)
+            logger.debug("[GRAMMAR CHECK] AI response received: %s chars", len(grammar_response))
+            logger.debug("[GRAMMAR CHECK] AI response preview: %s...", grammar_response[:200])
+            
+            # Parse AI response
+            import json
+            import re
+            
+            # Extract JSON from response (handle markdown code blocks)
+            json_match = re.search(r'```(?:json)?\s*(\[.*?\])\s*```', grammar_response, re.DOTALL)
+            if json_match:
+                json_str = json_match.group(1)
+                logger.debug("[GRAMMAR CHECK] Extracted JSON from code block")
+            else:
+                # Try to find raw JSON array
+                json_match = re.search(r'(\[.*\])', grammar_response, re.DOTALL)
+                if json_match:
+                    json_str = json_match.group(1)
+                    logger.debug("[GRAMMAR CHECK] Extracted raw JSON array")
+                else:
+                    json_str = '[]'
+                    logger.debug("[GRAMMAR CHECK] No JSON found, using empty array")
+            
+            logger.debug("[GRAMMAR CHECK] Parsing JSON: %s...", json_str[:200])
+            ai_grammar_issues = json.loads(json_str)
+            logger.debug("[GRAMMAR CHECK] Parsed %s issues from AI response", len(ai_grammar_issues))
+            
+            # Convert AI format to our standard format
+            for issue in ai_grammar_issues:
+                grammar_errors.append({
+                    'type': 'grammar',
+                    'error_text': issue.get('error_text', ''),
+                    'location': issue.get('location', 'See context'),
+                    'suggestion': issue.get('suggestion', ''),
+                    'explanation': issue.get('issue', ''),
+                    'severity': issue.get('severity', 'medium')
+                })
+            
+            logger.debug("[GRAMMAR CHECK] AI analysis complete: %s grammar issues found", len(grammar_errors))
+            
+        except Exception:
+            logger.exception("[GRAMMAR CHECK] AI analysis failed")
+            # Continue with spelling results even if AI fails
+        
+        # Combine results
+        all_errors = spelling_errors + grammar_errors
+        grammar_results = {
+            'issues_found': len(all_errors) > 0,
+            'error_count': len(all_errors),
+            'spelling_count': len(spelling_errors),
+            'grammar_count': len(grammar_errors),
+            'errors': all_errors,
+            'method': 'word_com_and_ai'
+        }
+        logger.debug("[GRAMMAR/SPELLING CHECK] Total: %s issues (%s spelling, %s grammar)", len(all_errors), len(spelling_errors), len(grammar_errors))
+        
+    except Exception as e:
+        logger.exception("[GRAMMAR CHECK] Grammar/spelling check failed")
+        grammar_results = {
+            'issues_found': False,
+            'error_count': 0,
+            'spelling_count': 0,
+            'grammar_count': 0,
+            'errors': [],
+            'error_message': str(e),
+            'method': 'failed'
+        }
+    
+    return grammar_results
+
+
 def analyze_contract(
     text: str,
     standards: List[str],
@@ -157,176 +351,27 @@ def analyze_contract(
     # Import here to avoid circular dependency
     from app.services.llm_client import analyze_standard
     
-    results = {}
-    
-    for i, standard in enumerate(standards, 1):
+    def analyze_one(numbered_standard):
+        i, standard = numbered_standard
         logger.info(f"Analyzing standard {i}/{len(standards)}: {standard}")
-        
-        # Check if this is a SharePoint preferred standard or custom standard
-        is_preferred_standard = standard in preferred
-        
-        try:
-            # Analyze with LLM (handles chunking internally)
-            result = _analyze_standard_with_chunks(text, standard, analyze_standard)
-            
-            if not result['found']:
-                # Standard not found in contract
-                if is_preferred_standard:
-                    # Use SharePoint clause directly (don't use AI suggestion)
-                    logger.info(f"Using SharePoint preferred clause for: {standard}")
-                    result['suggestion'] = preferred[standard]
-                    result['source'] = 'sharepoint'
-                else:
-                    # Custom standard - keep AI-generated suggestion
-                    logger.info(f"Using AI-generated suggestion for custom standard: {standard}")
-                    result['source'] = 'ai'
-            else:
-                # Standard found - mark source appropriately
-                result['source'] = 'sharepoint' if is_preferred_standard else 'ai'
-            
-            results[standard] = result
-            
-        except Exception as e:
-            logger.error(f"Failed to analyze standard '{standard}': {e}")
-            
-            # Use preferred clause if available, otherwise provide error message
-            if is_preferred_standard:
-                results[standard] = {
-                    'found': False,
-                    'excerpt': None,
-                    'location': None,
-                    'suggestion': preferred[standard],
-                    'source': 'sharepoint'
-                }
-            else:
-                results[standard] = {
-                    'found': False,
-                    'excerpt': None,
-                    'location': None,
-                    'suggestion': "Unable to analyze this standard due to a technical error.",
-                    'source': 'error'
-                }
+        return _analyze_standard(text, standard, preferred, analyze_standard)
+    
+    # The grammar/spelling check is independent of the standards, so it runs on the same
+    # pool while they are analyzed
+    grammar_future = _standards_executor.submit(_check_grammar, text, file_path) if check_grammar else None
+    
+    # Fan the per-standard LLM calls out over the shared pool; map keeps input order
+    results = dict(zip(
+        standards,
+        _standards_executor.map(analyze_one, enumerate(standards, 1))
+    ))
     
     logger.info(
         f"Analysis complete: {len(results)} standards analyzed, "
         f"{sum(1 for r in results.values() if r['found'])} found"
     )
-    # Grammar and spelling check (optional)
-    grammar_results = None
-    if check_grammar:
-        print("\n" + "="*70)
-        print("STARTING GRAMMAR/SPELLING CHECK")
-        print("="*70)
-        logger.info("Starting grammar/spelling check...")
-        
-        spelling_errors = []
-        grammar_errors = []
-        
-        try:
-            # Step 1: Word COM API for spelling errors (preferred for accuracy)
-            print(f"[DEBUG] file_path parameter: {file_path}")
-            print(f"[DEBUG] file_path type: {type(file_path)}")
-            if file_path:
-                file_path_obj = Path(file_path)
-                print(f"[DEBUG] Path object created: {file_path_obj}")
-                print(f"[DEBUG] Path exists: {file_path_obj.exists()}")
-                print(f"[DEBUG] Path is_file: {file_path_obj.is_file()}")
-                if file_path_obj.exists():
-                    print(f"[DEBUG] File size: {file_path_obj.stat().st_size} bytes")
-                    print(f"[DEBUG] File extension: {file_path_obj.suffix}")
-            else:
-                print(f"[DEBUG] file_path is None or empty")
-            
-            if file_path and Path(file_path).exists():
-                from app.services.word_grammar_checker import check_spelling_with_word
-                print(f"[SPELLING CHECK] Using Word COM API for file: {file_path}")
-                spelling_result = check_spelling_with_word(str(file_path))
-                print(f"[SPELLING CHECK] Word COM API returned: {spelling_result}")
-                spelling_errors = spelling_result.get('errors', [])
-                print(f"[SPELLING CHECK] Word COM API check complete: {len(spelling_errors)} spelling errors found")
-                print(f"[SPELLING CHECK] Raw counts: {spelling_result.get('raw_counts', {})}")
-            else:
-                print(f"[SPELLING CHECK] No file path provided or file doesn't exist, skipping Word COM check")
-                if file_path:
-                    print(f"[SPELLING CHECK] file_path was: {file_path}")
-            
-            # Step 2: AI Grammar Check (for legal contract grammar analysis)
-            print(f"\n[GRAMMAR CHECK] Starting AI-powered grammar analysis...")
-            try:
-                from app.services.llm_client import check_grammar
-                
-                # Call AI grammar check
-                grammar_response = check_grammar(text, max_words=3000)
-                print(f"[GRAMMAR CHECK] AI response received: {len(grammar_response)} chars")
-                print(f"[GRAMMAR CHECK] AI response preview: {grammar_response[:200]}...")
-                
-                # Parse AI response
-                import json
-                import re
-                
-                # Extract JSON from response (handle markdown code blocks)
-                json_match = re.search(r'```(?:json)?\s*(\[.*?\])\s*```', grammar_response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                    print(f"[GRAMMAR CHECK] Extracted JSON from code block")
-                else:
-                    # Try to find raw JSON array
-                    json_match = re.search(r'(\[.*\])', grammar_response, re.DOTALL)
-                    if json_match:
-                        json_str = json_match.group(1)
-                        print(f"[GRAMMAR CHECK] Extracted raw JSON array")
-                    else:
-                        json_str = '[]'
-                        print(f"[GRAMMAR CHECK] No JSON found, using empty array")
-                
-                print(f"[GRAMMAR CHECK] Parsing JSON: {json_str[:200]}...")
-                ai_grammar_issues = json.loads(json_str)
-                print(f"[GRAMMAR CHECK] Parsed {len(ai_grammar_issues)} issues from AI response")
-                
-                # Convert AI format to our standard format
-                for issue in ai_grammar_issues:
-                    grammar_errors.append({
-                        'type': 'grammar',
-                        'error_text': issue.get('error_text', ''),
-                        'location': issue.get('location', 'See context'),
-                        'suggestion': issue.get('suggestion', ''),
-                        'explanation': issue.get('issue', ''),
-                        'severity': issue.get('severity', 'medium')
-                    })
-                
-                print(f"[GRAMMAR CHECK] AI analysis complete: {len(grammar_errors)} grammar issues found")
-                
-            except Exception as ai_error:
-                logger.warning(f"AI grammar check failed: {ai_error}")
-                print(f"[GRAMMAR CHECK] AI analysis failed: {ai_error}")
-                # Continue with spelling results even if AI fails
-            
-            # Combine results
-            all_errors = spelling_errors + grammar_errors
-            grammar_results = {
-                'issues_found': len(all_errors) > 0,
-                'error_count': len(all_errors),
-                'spelling_count': len(spelling_errors),
-                'grammar_count': len(grammar_errors),
-                'errors': all_errors,
-                'method': 'word_com_and_ai'
-            }
-            print(f"[GRAMMAR/SPELLING CHECK] Total: {len(all_errors)} issues ({len(spelling_errors)} spelling, {len(grammar_errors)} grammar)")
-            
-        except Exception as e:
-            logger.error(f"Grammar/spelling check failed: {e}")
-            print(f"[GRAMMAR CHECK] ✗ ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-            grammar_results = {
-                'issues_found': False,
-                'error_count': 0,
-                'spelling_count': 0,
-                'grammar_count': 0,
-                'errors': [],
-                'error_message': str(e),
-                'method': 'failed'
-            }
+    # Grammar/spelling check ran alongside the standards; collect it
+    grammar_results = grammar_future.result() if grammar_future is not None else None
     
     # Return both standards analysis and grammar results
     return {
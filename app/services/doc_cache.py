@@ -0,0 +1,161 @@
+"""
+Short-lived local cache of downloaded contract documents.
+
+analyze_contract_route downloads a contract and apply_suggestions_action used to
+download the same file again minutes later. The analyzed copy is kept on local disk
+per (user, contract), so the apply step edits exactly the document that was analyzed
+without another Graph download. Keying by user means a copy fetched with one user's
+delegated token is never handed to another user.
+
+Entries live in this worker process only; a miss (another worker, expired, evicted)
+just means the caller downloads as before.
+"""
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Same lifetime as the analysis results the apply step works from
+DOC_CACHE_TTL_SECONDS = 1800
+DOC_CACHE_MAX_FILES = 50
+
+# (user_email, contract_id) -> (path, expires_at), least recently used first
+_entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+_lock = threading.Lock()
+_cache_dir: Optional[Path] = None
+_cache_dir_pid: Optional[int] = None
+
+
+def _directory() -> Path:
+    """Per-process cache directory, created on first use (and again after a fork). Call with _lock held."""
+    global _cache_dir, _cache_dir_pid
+    if _cache_dir is None or _cache_dir_pid != os.getpid():
+        # Entries inherited from a parent process point into its directory, not ours
+        _entries.clear()
+        _cache_dir = Path(tempfile.mkdtemp(prefix='contract_docs_'))
+        _cache_dir_pid = os.getpid()
+        atexit.register(shutil.rmtree, _cache_dir, ignore_errors=True)
+    return _cache_dir
+
+
+def _evict(now: float) -> list:
+    """Drop expired entries, then the least recently used beyond the cap. Call with _lock held."""
+    evicted = [key for key, (_, expires_at) in _entries.items() if expires_at <= now]
+    while len(_entries) - len(evicted) > DOC_CACHE_MAX_FILES:
+        evicted.append(next(key for key in _entries if key not in evicted))
+    return [_entries.pop(key)[0] for key in evicted]
+
+
+def _unlink_all(paths) -> None:
+    for path in paths:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to remove cached document %s: %s", path, e)
+
+
+def put(
+    user_email: Optional[str],
+    contract_id: str,
+    source: Union[Path, str, BinaryIO],
+    suffix: str = '.docx',
+    ttl: int = DOC_CACHE_TTL_SECONDS
+) -> bool:
+    """
+    Keep a downloaded contract document for a later get().
+
+    Args:
+        user_email: User whose token downloaded the document; nothing is cached without one.
+        contract_id: The SharePoint list item ID.
+        source: Path of a downloaded temp file (moved into the cache on success), or a
+            seekable binary file object (copied; the caller still owns and closes it).
+        suffix: File extension for file objects; taken from the path otherwise.
+        ttl: Time-to-live in seconds.
+
+    Returns:
+        True if the document was cached. On False a source path is left where it was.
+    """
+    if not user_email:
+        return False
+
+    with _lock:
+        directory = _directory()
+
+    try:
+        if isinstance(source, (str, Path)):
+            source = Path(source)
+            target = directory / f"{uuid.uuid4().hex}{source.suffix}"
+            shutil.move(str(source), str(target))
+        else:
+            target = directory / f"{uuid.uuid4().hex}{suffix}"
+            source.seek(0)
+            with open(target, 'wb') as f:
+                shutil.copyfileobj(source, f)
+    except OSError as e:
+        logger.warning("Could not cache document for contract %s: %s", contract_id, e)
+        return False
+
+    now = time.time()
+    with _lock:
+        replaced = _entries.pop((user_email, contract_id), None)
+        _entries[(user_email, contract_id)] = (target, now + ttl)
+        stale = _evict(now)
+
+    _unlink_all(stale + ([replaced[0]] if replaced else []))
+    logger.debug("Cached document for contract %s", contract_id)
+    return True
+
+
+def get(user_email: Optional[str], contract_id: str) -> Optional[Path]:
+    """
+    Copy of a cached contract document, if this user's copy is still cached.
+
+    Args:
+        user_email: The requesting user.
+        contract_id: The SharePoint list item ID.
+
+    Returns:
+        Path of a new temp file the caller owns (and unlinks, as with
+        sp_download.download_contract), or None on a miss.
+    """
+    if not user_email:
+        return None
+
+    now = time.time()
+    with _lock:
+        stale = _evict(now)
+        entry = _entries.get((user_email, contract_id))
+        if entry is not None:
+            _entries.move_to_end((user_email, contract_id))
+    _unlink_all(stale)
+
+    if entry is None:
+        return None
+
+    cached_path = entry[0]
+    copy_path = cached_path.with_name(f"{uuid.uuid4().hex}{cached_path.suffix}")
+    try:
+        shutil.copyfile(cached_path, copy_path)
+    except OSError as e:
+        # Evicted by another thread between the lookup and the copy
+        logger.debug("Cached document for contract %s unavailable: %s", contract_id, e)
+        copy_path.unlink(missing_ok=True)
+        return None
+    return copy_path
+
+
+def clear() -> None:
+    """Remove every cached document."""
+    with _lock:
+        paths = [path for path, _ in _entries.values()]
+        _entries.clear()
+    _unlink_all(paths)
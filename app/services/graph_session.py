@@ -0,0 +1,15 @@
+"""
+Shared HTTP session for Microsoft Graph / SharePoint calls
+
+One pooled requests.Session per worker process, so calls to graph.microsoft.com
+reuse keep-alive TCP/TLS connections instead of handshaking on every request.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection-level retries only (idempotent methods; HTTP error statuses are returned as-is)
+_retry = Retry(total=3, backoff_factor=0.2, status_forcelist=None, raise_on_status=False)
+
+http_session = requests.Session()
+http_session.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=_retry))
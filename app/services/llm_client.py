@@ -201,17 +201,16 @@ def _get_client() -> OpenAI:
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
         # Debug logging for API key configuration
-        print(f"DEBUG llm_client: Initializing OpenAI client")
-        print(f"DEBUG llm_client: API key present: {bool(api_key)}")
-        print(f"DEBUG llm_client: API key length: {len(api_key) if api_key else 0}")
-        print(f"DEBUG llm_client: API key prefix: {api_key[:20] if api_key else 'N/A'}...")
+        logger.debug("Initializing OpenAI client")
+        logger.debug("API key present: %s", bool(api_key))
+        logger.debug("API key length: %s", len(api_key) if api_key else 0)
         
         try:
             client = OpenAI(api_key=api_key)
-            print(f"DEBUG llm_client: OpenAI client created successfully")
+            logger.debug("OpenAI client created successfully")
             logger.info("OpenAI client initialized successfully")
         except Exception as e:
-            print(f"DEBUG llm_client: Failed to create OpenAI client: {type(e).__name__} - {str(e)}")
+            logger.debug("Failed to create OpenAI client: %s - %s", type(e).__name__, str(e))
             logger.error(f"Failed to create OpenAI client: {type(e).__name__} - {str(e)}")
             raise
     return client
@@ -326,20 +325,9 @@ def _call_openai(system_prompt: str, user_prompt: str, model: str) -> str:
         logger.error("OpenAI API request timed out")
         raise RuntimeError("AI analysis request timed out")
     except Exception as e:
-        # Enhanced error logging for debugging
-        import traceback
         error_type = type(e).__name__
         error_msg = str(e)
-        stack_trace = traceback.format_exc()
-        
-        logger.error(f"OpenAI API call failed: {error_type}")
-        logger.error(f"Error message: {error_msg}")
-        logger.error(f"Stack trace:\n{stack_trace}")
-        
-        print(f"DEBUG llm_client: OpenAI API Error Details:")
-        print(f"  Type: {error_type}")
-        print(f"  Message: {error_msg}")
-        print(f"  Full trace:\n{stack_trace}")
+        logger.exception("OpenAI API call failed: %s: %s", error_type, error_msg)
         
         raise RuntimeError(f"AI analysis service error: {error_type} - {error_msg}")
 
@@ -375,25 +363,25 @@ def analyze_standard(text: str, standard: str) -> dict:
         )
         
         # === ENHANCED DEBUGGING ===
-        print(f"\n[AI DEBUG] Analyzing standard: {standard}")
-        print(f"[AI DEBUG] Contract text length: {len(contract_text_sample)} chars")
+        logger.debug("[AI DEBUG] Analyzing standard: %s", standard)
+        logger.debug("[AI DEBUG] Contract text length: %s chars", len(contract_text_sample))
         
         # Show first 500 chars of what AI receives
         preview = contract_text_sample[:500].replace('\n', '\\n')
-        print(f"[AI DEBUG] First 500 chars sent to AI: {preview}...")
+        logger.debug("[AI DEBUG] First 500 chars sent to AI: %s...", preview)
         
         # Check for numbering in the text being sent
         has_numbers = any(f"{i}." in contract_text_sample for i in range(1, 10))
         has_roman = any(roman in contract_text_sample for roman in ["I.", "II.", "III.", "IV.", "V."])
         has_section = "Section" in contract_text_sample
         
-        print(f"[AI DEBUG] Numbering in text: decimal={has_numbers}, roman={has_roman}, section={has_section}")
+        logger.debug("[AI DEBUG] Numbering in text: decimal=%s, roman=%s, section=%s", has_numbers, has_roman, has_section)
         
         # Call OpenAI with strict JSON response format
         logger.info(f"Analyzing standard: {standard}")
         response_text = _call_openai(SYSTEM_PROMPT, user_prompt, model)
         
-        print(f"[AI DEBUG] AI response received: {len(response_text)} chars")
+        logger.debug("[AI DEBUG] AI response received: %s chars", len(response_text))
         
         # Parse and validate JSON response
         try:
@@ -409,13 +397,13 @@ def analyze_standard(text: str, standard: str) -> dict:
         duration = time.time() - start_time
         
         # === ENHANCED DEBUGGING ===
-        print(f"[AI DEBUG] Analysis result for '{standard}':")
-        print(f"[AI DEBUG]   - found: {result['found']}")
-        print(f"[AI DEBUG]   - location: {result.get('location', 'None')}")
+        logger.debug("[AI DEBUG] Analysis result for '%s':", standard)
+        logger.debug("[AI DEBUG]   - found: %s", result['found'])
+        logger.debug("[AI DEBUG]   - location: %s", result.get('location', 'None'))
         if result.get('location'):
             location_preview = result['location'][:100]
-            print(f"[AI DEBUG]   - location preview: '{location_preview}'")
-        print(f"[AI DEBUG]   - duration: {duration:.2f}s")
+            logger.debug("[AI DEBUG]   - location preview: '%s'", location_preview)
+        logger.debug("[AI DEBUG]   - duration: %.2fs", duration)
         
         logger.info(
             f"Analysis complete: standard={standard}, found={result['found']}, "
@@ -525,7 +513,7 @@ If no significant grammar issues found, return an empty array: []
 Contract text:
 {sample_text}"""
         
-        print(f"[AI GRAMMAR] Sending {len(sample_text)} chars to AI for grammar analysis...")
+        logger.debug("[AI GRAMMAR] Sending %s chars to AI for grammar analysis...", len(sample_text))
         
         response = client.chat.completions.create(
             model=os.getenv('OPENAI_MODEL', 'gpt-4o-mini'),
@@ -547,9 +535,7 @@ Contract text:
         return response.choices[0].message.content
         
     except Exception as e:
-        logger.error(f"AI grammar check failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"AI grammar check failed: {e}")
         raise RuntimeError(f"AI grammar check error: {str(e)}")
 
 
@@ -2,11 +2,35 @@
 SharePoint service for uploading contracts using Microsoft Graph API
 """
 import os
-import requests
+import re
+import copy
 import base64
+import logging
 from datetime import datetime
 import msal
 import uuid
+from flask import g
+from app.services.graph_session import http_session
+from app.services.sp_upload import DOCX_MIMETYPE
+
+logger = logging.getLogger(__name__)
+
+# Files up to this size go up in a single PUT; larger ones use a Graph upload session
+SIMPLE_UPLOAD_LIMIT = 4 * 1024 * 1024
+
+# Upload session slice size (Graph requires a multiple of 320 KiB)
+UPLOAD_CHUNK_SIZE = 16 * 320 * 1024
+
+# (connect, read) timeouts for the contract upload's Graph calls; file PUTs wait
+# longer for Graph to acknowledge each body or slice
+GRAPH_TIMEOUT = (5, 30)
+GRAPH_UPLOAD_TIMEOUT = (5, 120)
+
+# Characters Windows/SharePoint don't allow in file names: < > : " / \ | ? *
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Stage suffix on stored contract filenames (e.g. Lease_uploaded.docx -> Lease)
+_FILENAME_STAGE_SUFFIX_RE = re.compile(r'_(uploaded|edited|completed)$')
 
 class SharePointService:
     def __init__(self):
@@ -20,6 +44,10 @@ class SharePointService:
         self.access_token = None
         self.token_expires_at = None  # Track when token expires
         
+        # ContractID -> contract lookups for the current request; only the
+        # request-scoped copies from get_sharepoint_service() get a dict
+        self._contract_cache = None
+        
         # Microsoft Graph API base URL
         self.graph_url = "https://graph.microsoft.com/v1.0"
         
@@ -56,13 +84,13 @@ class SharePointService:
                 # Use UTC time to match Microsoft's token expiration
                 self.token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in - 300)  # Refresh 5 min early
                 
-                print(f"Token acquired, expires at: {self.token_expires_at} UTC")
+                logger.debug("Token acquired, expires at: %s UTC", self.token_expires_at)
                 return result["access_token"]
             else:
                 raise Exception(f"Failed to get access token: {result}")
                 
         except Exception as e:
-            print(f"Error getting access token: {str(e)}")
+            logger.error("Error getting access token: %s", str(e))
             raise
     
     def _ensure_valid_token(self):
@@ -86,11 +114,11 @@ class SharePointService:
                     self.token_expires_at = datetime.fromisoformat(expires_at_str).replace(tzinfo=None)
                     
                     time_left = (self.token_expires_at - datetime.utcnow()).total_seconds() / 60
-                    print(f"Token valid, {time_left:.1f} minutes remaining")
+                    logger.debug("Token valid, %.1f minutes remaining", time_left)
                     
         except AuthRequired:
             # Fall back to old behavior if session-based refresh fails
-            print("Token expired or missing, falling back to app-only auth...")
+            logger.debug("Token expired or missing, falling back to app-only auth...")
             self.access_token = self._get_access_token()
             # Site ID might also need refresh after token refresh
             if self.site_id is None:
@@ -105,7 +133,7 @@ class SharePointService:
                 'Authorization': f'Bearer {self.access_token}'
             }
             
-            response = requests.get(site_url, headers=headers)
+            response = http_session.get(site_url, headers=headers)
             
             if response.status_code == 200:
                 site_data = response.json()
@@ -114,15 +142,74 @@ class SharePointService:
                 raise Exception(f"Failed to get site ID: {response.status_code} - {response.text}")
                 
         except Exception as e:
-            print(f"Error getting site ID: {str(e)}")
+            logger.error("Error getting site ID: %s", str(e))
             raise
     
-    def upload_contract(self, file_content, file_name, submitter_name, contract_name, submitter_email, business_approver_email, date_requested, contract_type, business_terms, additional_notes):
+    def _put_drive_file(self, unique_filename, file_content, token, content_type='application/octet-stream'):
+        """
+        Upload bytes or a binary file-like object to the ContractFiles library root
+        
+        Streams are never read into memory as a whole: small ones are handed to
+        requests as the PUT body, larger ones are sent through a Graph upload
+        session in UPLOAD_CHUNK_SIZE slices with Content-Range headers.
+        
+        Args:
+            content_type: Content-Type sent with a simple (non-session) upload
+        
+        Returns:
+            requests.Response: Response whose JSON is the uploaded driveItem on success
+        """
+        item_path = f"{self.graph_url}/drives/{self.drive_id}/root:/{unique_filename}:"
+        headers = {
+            'Authorization': f'Bearer {token}',
+            'Content-Type': content_type
+        }
+        
+        if isinstance(file_content, (bytes, bytearray)):
+            return http_session.put(f"{item_path}/content", headers=headers, data=file_content, timeout=GRAPH_UPLOAD_TIMEOUT)
+        
+        # Size the stream without reading it
+        file_content.seek(0, os.SEEK_END)
+        total_size = file_content.tell()
+        file_content.seek(0)
+        
+        if total_size <= SIMPLE_UPLOAD_LIMIT:
+            return http_session.put(f"{item_path}/content", headers=headers, data=file_content, timeout=GRAPH_UPLOAD_TIMEOUT)
+        
+        logger.debug("Large file (%s bytes), using upload session...", total_size)
+        session_response = http_session.post(
+            f"{item_path}/createUploadSession",
+            headers={'Authorization': f'Bearer {token}'},
+            json={'item': {'@microsoft.graph.conflictBehavior': 'replace'}},
+            timeout=GRAPH_TIMEOUT
+        )
+        if session_response.status_code != 200:
+            return session_response
+        upload_url = session_response.json()['uploadUrl']
+        
+        # The upload URL is pre-authenticated; Graph rejects an Authorization header on it
+        offset = 0
+        while offset < total_size:
+            chunk = file_content.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            end = offset + len(chunk) - 1
+            response = http_session.put(upload_url, headers={
+                'Content-Length': str(len(chunk)),
+                'Content-Range': f'bytes {offset}-{end}/{total_size}'
+            }, data=chunk, timeout=GRAPH_UPLOAD_TIMEOUT)
+            if response.status_code not in [200, 201, 202]:
+                return response
+            offset = end + 1
+        
+        return response
+    
+    def upload_contract(self, file_content, file_name, submitter_name, contract_name, submitter_email, business_approver_email, date_requested, contract_type, business_terms, additional_notes, access_token=None):
         """
         Upload a contract file to SharePoint ContractFiles library and create metadata record
         
         Args:
-            file_content (bytes): The file content to upload
+            file_content (bytes or file-like): The file content, or a binary stream to upload without buffering
             file_name (str): Original filename
             submitter_name (str): Name of the person submitting
             contract_name (str): Name/title of the contract
@@ -132,18 +219,23 @@ class SharePointService:
             contract_type (str): Type of contract
             business_terms (list): List of selected business terms
             additional_notes (str): Additional notes
+            access_token (str): Delegated token already validated by the caller; background
+                jobs pass it so the session is neither refreshed nor written outside the request
             
         Returns:
             dict: Upload result with success status and file URL
         """
         try:
-            # Ensure token is valid before making API calls
-            self._ensure_valid_token()
+            if access_token:
+                self.access_token = access_token
+            else:
+                # Ensure token is valid before making API calls
+                self._ensure_valid_token()
             
-            print(f"\n=== DEBUG upload_contract ===")
-            print(f"Contract Name: {contract_name}")
-            print(f"File Name: {file_name}")
-            print(f"Submitter: {submitter_name} ({submitter_email})")
+            logger.debug("=== DEBUG upload_contract ===")
+            logger.debug("Contract Name: %s", contract_name)
+            logger.debug("File Name: %s", file_name)
+            logger.debug("Submitter: %s (%s)", submitter_name, submitter_email)
             
             # Generate unique contract ID
             contract_id = str(uuid.uuid4())[:8].upper()
@@ -151,12 +243,11 @@ class SharePointService:
             
             # Use original uploaded filename (without extension) for naming
             # Extract base name without extension
-            import re
             base_filename = file_name.rsplit('.', 1)[0] if '.' in file_name else file_name
             
             # Sanitize filename (remove invalid characters)
             # Invalid characters for Windows/SharePoint: < > : " / \ | ? *
-            safe_filename = re.sub(r'[<>:"/\\|?*]', '_', base_filename)
+            safe_filename = _INVALID_FILENAME_CHARS_RE.sub('_', base_filename)
             safe_filename = safe_filename.strip()
             
             # Replace spaces with underscores for cleaner filenames
@@ -168,39 +259,30 @@ class SharePointService:
             # Truncate if necessary
             if len(safe_filename) > max_basename_length:
                 safe_filename = safe_filename[:max_basename_length].rstrip('_')
-                print(f"Filename truncated to fit 100 character limit")
+                logger.debug("Filename truncated to fit 100 character limit")
             
             # Generate filename: OriginalFilename_uploaded.docx
             unique_filename = f"{safe_filename}_uploaded.docx"
             
-            print(f"Contract ID: {contract_id}")
-            print(f"Unique Filename: {unique_filename} ({len(unique_filename)} chars)")
+            logger.debug("Contract ID: %s", contract_id)
+            logger.debug("Unique Filename: %s (%s chars)", unique_filename, len(unique_filename))
             
             # Upload file to ContractFiles library (root, not in Contracts subfolder)
-            upload_url = f"{self.graph_url}/drives/{self.drive_id}/root:/{unique_filename}:/content"
-            
-            print(f"Upload URL: {upload_url}")
-            
-            # Use delegated user token from session so file shows correct creator
+            # Use delegated user token so file shows correct creator
             from flask import session
-            delegated_token = session.get('access_token')
+            delegated_token = access_token or session.get('access_token')
             upload_token = delegated_token if delegated_token else self.access_token
             
             if delegated_token:
-                print(f"✓ Using delegated user token for upload (will show {submitter_email} as creator)")
+                logger.debug("✓ Using delegated user token for upload (will show %s as creator)", submitter_email)
             else:
-                print(f"⚠ No delegated token, using app token (will show 'SharePoint App')")
-            
-            headers = {
-                'Authorization': f'Bearer {upload_token}',
-                'Content-Type': 'application/octet-stream'
-            }
+                logger.warning("⚠ No delegated token, using app token (will show 'SharePoint App')")
             
             # Upload the file
-            print(f"Uploading file to SharePoint...")
-            response = requests.put(upload_url, headers=headers, data=file_content)
+            logger.debug("Uploading file to SharePoint...")
+            response = self._put_drive_file(unique_filename, file_content, upload_token)
             
-            print(f"Upload response status: {response.status_code}")
+            logger.debug("Upload response status: %s", response.status_code)
             
             if response.status_code in [200, 201]:
                 file_info = response.json()
@@ -209,12 +291,12 @@ class SharePointService:
                 document_url = file_info.get('webUrl', '')
                 file_id = file_info.get('id')
                 
-                print(f"✓ File uploaded successfully!")
-                print(f"Document URL: {document_url}")
-                print(f"File ID: {file_id}")
-                print(f"✓ File uploaded with delegated token - {submitter_email} will be shown as creator")
+                logger.debug("✓ File uploaded successfully!")
+                logger.debug("Document URL: %s", document_url)
+                logger.debug("File ID: %s", file_id)
+                logger.debug("✓ File uploaded with delegated token - %s will be shown as creator", submitter_email)
                 
-                print(f"Now creating metadata record in Uploaded Contracts list...")
+                logger.debug("Now creating metadata record in Uploaded Contracts list...")
                 
                 # Create metadata record in "Uploaded Contracts" list
                 metadata_result = self._create_contract_metadata(
@@ -228,12 +310,13 @@ class SharePointService:
                     business_terms=business_terms,
                     additional_notes=additional_notes,
                     document_url=document_url,
-                    file_name=unique_filename
+                    file_name=unique_filename,
+                    ensure_token=not access_token
                 )
                 
-                print(f"Metadata creation result: {metadata_result['success']}")
+                logger.debug("Metadata creation result: %s", metadata_result['success'])
                 if not metadata_result['success']:
-                    print(f"Metadata error: {metadata_result.get('error', 'Unknown error')}")
+                    logger.debug("Metadata error: %s", metadata_result.get('error', 'Unknown error'))
                 
                 return {
                     'success': True,
@@ -246,7 +329,7 @@ class SharePointService:
                 }
             else:
                 error_msg = f"Upload failed with status {response.status_code}: {response.text}"
-                print(f"✗ {error_msg}")
+                logger.error("✗ %s", error_msg)
                 return {
                     'success': False,
                     'error': error_msg,
@@ -255,9 +338,7 @@ class SharePointService:
                 
         except Exception as e:
             error_msg = f"Error uploading file to SharePoint: {str(e)}"
-            print(f"✗ EXCEPTION in upload_contract: {error_msg}")
-            import traceback
-            print(f"Traceback:\n{traceback.format_exc()}")
+            logger.exception("✗ EXCEPTION in upload_contract: %s", error_msg)
             return {
                 'success': False,
                 'error': error_msg,
@@ -278,18 +359,18 @@ class SharePointService:
         try:
             from flask import session
             
-            print(f"\n=== DEBUG _update_file_creator ===")
-            print(f"File ID: {file_id}")
-            print(f"User Email: {user_email}")
+            logger.debug("=== DEBUG _update_file_creator ===")
+            logger.debug("File ID: %s", file_id)
+            logger.debug("User Email: %s", user_email)
             
             # Use delegated user token from session instead of app token
             # App tokens don't have permission to update file metadata
             delegated_token = session.get('access_token')
             if not delegated_token:
-                print(f"✗ No delegated token in session, cannot update file creator")
+                logger.error("✗ No delegated token in session, cannot update file creator")
                 return False
             
-            print(f"✓ Using delegated user token from session")
+            logger.debug("✓ Using delegated user token from session")
             
             # First, get the user's ID from their email
             user_lookup_url = f"{self.graph_url}/users/{user_email}"
@@ -298,24 +379,24 @@ class SharePointService:
                 'Content-Type': 'application/json'
             }
             
-            user_response = requests.get(user_lookup_url, headers=headers)
+            user_response = http_session.get(user_lookup_url, headers=headers)
             
             if user_response.status_code != 200:
-                print(f"✗ Failed to lookup user: {user_response.status_code} - {user_response.text}")
+                logger.error("✗ Failed to lookup user: %s - %s", user_response.status_code, user_response.text)
                 return False
             
             user_data = user_response.json()
             user_id = user_data.get('id')
             user_display_name = user_data.get('displayName')
-            print(f"✓ Found user: {user_display_name} (ID: {user_id})")
+            logger.debug("✓ Found user: %s (ID: %s)", user_display_name, user_id)
             
             # Get the list item associated with this drive item
             # Files in document libraries have associated list items
             list_item_url = f"{self.graph_url}/drives/{self.drive_id}/items/{file_id}/listItem"
-            list_item_response = requests.get(list_item_url, headers=headers)
+            list_item_response = http_session.get(list_item_url, headers=headers)
             
             if list_item_response.status_code != 200:
-                print(f"✗ Failed to get list item: {list_item_response.status_code} - {list_item_response.text}")
+                logger.error("✗ Failed to get list item: %s - %s", list_item_response.status_code, list_item_response.text)
                 return False
             
             list_item_data = list_item_response.json()
@@ -323,8 +404,8 @@ class SharePointService:
             parent_ref = list_item_data.get('parentReference', {})
             list_id = parent_ref.get('id')  # Get the actual list ID from parent reference
             
-            print(f"✓ Found list item ID: {list_item_id}")
-            print(f"✓ Found list ID: {list_id}")
+            logger.debug("✓ Found list item ID: %s", list_item_id)
+            logger.debug("✓ Found list ID: %s", list_id)
             
             # For "Modified By" to show correctly, we need to update the file metadata
             # using the delegated user token. Simply making any update with the user's token
@@ -340,43 +421,42 @@ class SharePointService:
                 '_ModifiedByUser': user_email  # Custom tracking field
             }
             
-            print(f"Updating file metadata with user token to set Modified By...")
-            update_response = requests.patch(update_url, headers=headers, json=update_data)
+            logger.debug("Updating file metadata with user token to set Modified By...")
+            update_response = http_session.patch(update_url, headers=headers, json=update_data)
             
             if update_response.status_code == 200:
-                print(f"✓ Successfully updated file - Modified By should now show {user_display_name}")
+                logger.debug("✓ Successfully updated file - Modified By should now show %s", user_display_name)
                 return True
             else:
-                print(f"✗ Failed to update: {update_response.status_code} - {update_response.text}")
+                logger.error("✗ Failed to update: %s - %s", update_response.status_code, update_response.text)
                 # This is not a critical failure - file is uploaded, just attribution is wrong
                 # So we'll log but not fail the upload
                 return False
                 
         except Exception as e:
-            print(f"✗ Exception updating file creator: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("✗ Exception updating file creator: %s", e)
             # Non-critical - don't fail the upload
             return False
     
     def _create_contract_metadata(self, contract_id, contract_name, submitter_name, submitter_email, 
                                 business_approver_email, date_requested, contract_type, business_terms, 
-                                additional_notes, document_url, file_name):
+                                additional_notes, document_url, file_name, ensure_token=True):
         """Create a record in the 'Uploaded Contracts' SharePoint list"""
         try:
-            # Ensure token is valid before making API calls
-            self._ensure_valid_token()
+            if ensure_token:
+                # Ensure token is valid before making API calls
+                self._ensure_valid_token()
             
-            print(f"\n=== DEBUG _create_contract_metadata ===")
-            print(f"Contract Name: {contract_name}")
-            print(f"Submitter: {submitter_name} ({submitter_email})")
-            print(f"Business Approver: {business_approver_email}")
-            print(f"Document URL: {document_url}")
+            logger.debug("=== DEBUG _create_contract_metadata ===")
+            logger.debug("Contract Name: %s", contract_name)
+            logger.debug("Submitter: %s (%s)", submitter_name, submitter_email)
+            logger.debug("Business Approver: %s", business_approver_email)
+            logger.debug("Document URL: %s", document_url)
             
             # Use the specific list ID from environment variable
             uploaded_contracts_list_id = os.getenv('SP_LIST_ID')  # 916e17ce-131a-4866-91c5-46cd36433ed2
             
-            print(f"List ID: {uploaded_contracts_list_id}")
+            logger.debug("List ID: %s", uploaded_contracts_list_id)
             
             if not uploaded_contracts_list_id:
                 raise Exception("SP_LIST_ID not found in environment variables")
@@ -394,14 +474,14 @@ class SharePointService:
             # Convert business terms list to properly formatted SharePoint choice values
             business_terms_array = [business_terms_mapping.get(term.lower(), term) for term in business_terms] if business_terms else []
             
-            print(f"Current DateTime: {current_datetime}")
-            print(f"Date Requested: {date_requested}")
-            print(f"Business Terms Array: {business_terms_array}")
+            logger.debug("Current DateTime: %s", current_datetime)
+            logger.debug("Date Requested: %s", date_requested)
+            logger.debug("Business Terms Array: %s", business_terms_array)
             
             # Truncate document URL to 255 characters (SharePoint hyperlink field limit)
             truncated_doc_url = document_url[:255] if len(document_url) > 255 else document_url
             if len(document_url) > 255:
-                print(f"⚠️ Document URL truncated from {len(document_url)} to 255 characters")
+                logger.warning("⚠️ Document URL truncated from %s to 255 characters", len(document_url))
             
             # Create list item data matching the SharePoint list structure
             # Field names must match SharePoint internal column names exactly
@@ -426,29 +506,29 @@ class SharePointService:
                 }
             }
             
-            print(f"List item data fields: {list(list_item_data['fields'].keys())}")
-            print(f"Site ID being used: {self.site_id}")
-            print(f"Full payload: {list_item_data}")
+            logger.debug("List item data fields: %s", list(list_item_data['fields'].keys()))
+            logger.debug("Site ID being used: %s", self.site_id)
+            logger.debug("Full payload: %s", list_item_data)
             
             # Create the list item
             create_item_url = f"{self.graph_url}/sites/{self.site_id}/lists/{uploaded_contracts_list_id}/items"
             
-            print(f"POST URL: {create_item_url}")
+            logger.debug("POST URL: %s", create_item_url)
             
             headers = {
                 'Authorization': f'Bearer {self.access_token}',
                 'Content-Type': 'application/json'
             }
             
-            print(f"Sending POST request to SharePoint...")
-            response = requests.post(create_item_url, headers=headers, json=list_item_data)
+            logger.debug("Sending POST request to SharePoint...")
+            response = http_session.post(create_item_url, headers=headers, json=list_item_data, timeout=GRAPH_TIMEOUT)
             
-            print(f"Response Status: {response.status_code}")
-            print(f"Response Body: {response.text}")
+            logger.debug("Response Status: %s", response.status_code)
+            logger.debug("Response Body: %s", response.text)
             
             if response.status_code == 201:
                 list_item = response.json()
-                print(f"✓ Successfully created metadata record with ID: {list_item['id']}")
+                logger.debug("✓ Successfully created metadata record with ID: %s", list_item['id'])
                 return {
                     'success': True,
                     'list_item_id': list_item['id'],
@@ -456,7 +536,7 @@ class SharePointService:
                 }
             else:
                 error_msg = f"Failed to create list item: {response.status_code} - {response.text}"
-                print(f"✗ {error_msg}")
+                logger.error("✗ %s", error_msg)
                 return {
                     'success': False,
                     'error': error_msg,
@@ -465,9 +545,7 @@ class SharePointService:
                 
         except Exception as e:
             error_msg = f"Error creating contract metadata: {str(e)}"
-            print(f"✗ EXCEPTION: {error_msg}")
-            import traceback
-            print(f"Traceback:\n{traceback.format_exc()}")
+            logger.exception("✗ EXCEPTION: %s", error_msg)
             return {
                 'success': False,
                 'error': error_msg,
@@ -484,18 +562,18 @@ class SharePointService:
                 'Authorization': f'Bearer {self.access_token}'
             }
             
-            response = requests.get(drive_url, headers=headers)
+            response = http_session.get(drive_url, headers=headers)
             
             if response.status_code == 200:
                 drive_info = response.json()
-                print(f"Successfully connected to SharePoint drive: {drive_info.get('name', 'ContractFiles')}")
+                logger.debug("Successfully connected to SharePoint drive: %s", drive_info.get('name', 'ContractFiles'))
                 return True
             else:
-                print(f"Error connecting to SharePoint: {response.status_code} - {response.text}")
+                logger.error("Error connecting to SharePoint: %s - %s", response.status_code, response.text)
                 return False
                 
         except Exception as e:
-            print(f"Error testing SharePoint connection: {str(e)}")
+            logger.error("Error testing SharePoint connection: %s", str(e))
             return False
     
     def upload_to_contract_files(self, file, filename, user_email=None):
@@ -519,14 +597,14 @@ class SharePointService:
             safe_filename = safe_filename.replace(' ', '_')
             safe_filename = safe_filename.replace(':', '-')  # Replace colons specifically
             
-            print(f"\n=== DEBUG upload_to_contract_files ===")
-            print(f"Original Filename: {filename}")
-            print(f"Sanitized Filename: {safe_filename}")
+            logger.debug("=== DEBUG upload_to_contract_files ===")
+            logger.debug("Original Filename: %s", filename)
+            logger.debug("Sanitized Filename: %s", safe_filename)
             
             # Upload file to ContractFiles library root
             upload_url = f"{self.graph_url}/drives/{self.drive_id}/root:/{safe_filename}:/content"
             
-            print(f"Upload URL: {upload_url}")
+            logger.debug("Upload URL: %s", upload_url)
             
             # Use delegated user token from session so file shows correct creator
             from flask import session
@@ -534,37 +612,29 @@ class SharePointService:
             upload_token = delegated_token if delegated_token else self.access_token
             
             if delegated_token and user_email:
-                print(f"✓ Using delegated user token for upload (will show {user_email} as creator)")
+                logger.debug("✓ Using delegated user token for upload (will show %s as creator)", user_email)
             else:
-                print(f"⚠ Using app token (will show 'SharePoint App')")
-            
-            headers = {
-                'Authorization': f'Bearer {upload_token}',
-                'Content-Type': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-            }
-            
-            # Read file content
-            file_content = file.read()
-            print(f"File size: {len(file_content)} bytes")
+                logger.warning("⚠ Using app token (will show 'SharePoint App')")
             
-            # Upload file
-            response = requests.put(upload_url, headers=headers, data=file_content)
+            # Stream the upload (werkzeug has already spooled large files to disk)
+            # instead of reading the whole document into memory
+            response = self._put_drive_file(safe_filename, file.stream, upload_token, content_type=DOCX_MIMETYPE)
             
-            print(f"Upload Response Status: {response.status_code}")
+            logger.debug("Upload Response Status: %s", response.status_code)
             
             if response.status_code in [200, 201]:
                 file_info = response.json()
                 document_url = file_info.get('webUrl', '')
                 file_id = file_info.get('id')
                 
-                print(f"✓ File uploaded successfully!")
-                print(f"Document URL: {document_url}")
-                print(f"File ID: {file_id}")
+                logger.debug("✓ File uploaded successfully!")
+                logger.debug("Document URL: %s", document_url)
+                logger.debug("File ID: %s", file_id)
                 
                 if user_email:
-                    print(f"✓ File uploaded with delegated token - {user_email} will be shown as creator")
+                    logger.debug("✓ File uploaded with delegated token - %s will be shown as creator", user_email)
                 else:
-                    print(f"⚠ No user_email provided, file may show as 'SharePoint App'")
+                    logger.warning("⚠ No user_email provided, file may show as 'SharePoint App'")
                 
                 return {
                     'success': True,
@@ -576,7 +646,7 @@ class SharePointService:
                 }
             else:
                 error_msg = f"Upload failed with status {response.status_code}: {response.text}"
-                print(f"✗ {error_msg}")
+                logger.error("✗ %s", error_msg)
                 return {
                     'success': False,
                     'error': error_msg,
@@ -585,9 +655,7 @@ class SharePointService:
                 
         except Exception as e:
             error_msg = f"Error uploading file to ContractFiles: {str(e)}"
-            print(f"✗ EXCEPTION: {error_msg}")
-            import traceback
-            print(f"Traceback:\n{traceback.format_exc()}")
+            logger.exception("✗ EXCEPTION: %s", error_msg)
             return {
                 'success': False,
                 'error': error_msg,
@@ -612,8 +680,7 @@ class SharePointService:
             base_name = filename.rsplit('.', 1)[0] if '.' in filename else filename
             
             # Remove _uploaded, _edited, or _completed suffix if present
-            import re
-            base_name = re.sub(r'_(uploaded|edited|completed)$', '', base_name)
+            base_name = _FILENAME_STAGE_SUFFIX_RE.sub('', base_name)
             
             completed_filename = f"{base_name}_completed.docx"
             
@@ -629,7 +696,7 @@ class SharePointService:
                 'Authorization': f'Bearer {self.access_token}'
             }
             
-            response = requests.get(file_url, headers=headers)
+            response = http_session.get(file_url, headers=headers)
             
             if response.status_code == 200:
                 file_info = response.json()
@@ -638,7 +705,7 @@ class SharePointService:
                 return ''
                 
         except Exception as e:
-            print(f"Error checking for completed document: {str(e)}")
+            logger.error("Error checking for completed document: %s", str(e))
             return ''
     
     def get_contract_files(self, limit=50, user_email=None, is_admin=False):
@@ -661,12 +728,12 @@ class SharePointService:
             uploaded_contracts_list_id = os.getenv('SP_LIST_ID')  # 916e17ce-131a-4866-91c5-46cd36433ed2
             
             if not uploaded_contracts_list_id:
-                print("SP_LIST_ID not found in environment variables")
+                logger.debug("SP_LIST_ID not found in environment variables")
                 return []
             
-            print(f"\n=== DEBUG get_contract_files ===")
-            print(f"User Email: {user_email}")
-            print(f"Is Admin: {is_admin}")
+            logger.debug("=== DEBUG get_contract_files ===")
+            logger.debug("User Email: %s", user_email)
+            logger.debug("Is Admin: %s", is_admin)
             
             headers = {
                 'Authorization': f'Bearer {self.access_token}'
@@ -677,21 +744,22 @@ class SharePointService:
             # Items will be sorted client-side if needed
             items_url = f"{self.graph_url}/sites/{self.site_id}/lists/{uploaded_contracts_list_id}/items?$expand=fields&$top={limit}"
             
-            response = requests.get(items_url, headers=headers)
+            response = http_session.get(items_url, headers=headers)
             
-            print(f"SharePoint API response: {response.status_code}")
+            logger.debug("SharePoint API response: %s", response.status_code)
             
             if response.status_code == 200:
                 items_data = response.json()
                 contract_list = []
+                user_email_lc = user_email.lower() if user_email else None
                 
                 for item in items_data.get('value', []):
                     fields = item.get('fields', {})
                     
                     # Filter by user email if not admin
-                    if not is_admin and user_email:
+                    if not is_admin and user_email_lc:
                         item_submitter = fields.get('SubmitterEmail', '').lower()
-                        if item_submitter != user_email.lower():
+                        if item_submitter != user_email_lc:
                             continue  # Skip this item
                     
                     filename = fields.get('filename', 'Unknown')
@@ -726,16 +794,14 @@ class SharePointService:
                 # Sort by DateSubmitted (most recent first) - client-side since field is not indexed
                 contract_list.sort(key=lambda x: x['date_submitted'], reverse=True)
                 
-                print(f"Returning {len(contract_list)} contracts")
+                logger.debug("Returning %s contracts", len(contract_list))
                 return contract_list
             else:
-                print(f"Error retrieving contract records: {response.status_code} - {response.text}")
+                logger.error("Error retrieving contract records: %s - %s", response.status_code, response.text)
                 return []
                 
         except Exception as e:
-            print(f"Error retrieving contract records: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error retrieving contract records: %s", str(e))
             return []
     
     def get_contract_by_id(self, contract_id):
@@ -749,6 +815,9 @@ class SharePointService:
             dict: Contract information with 'fields' key containing SharePoint fields,
                   or None if not found
         """
+        if self._contract_cache is not None and contract_id in self._contract_cache:
+            return self._contract_cache[contract_id]
+        
         try:
             # Ensure token is valid before making API calls
             self._ensure_valid_token()
@@ -756,11 +825,11 @@ class SharePointService:
             uploaded_contracts_list_id = os.getenv('SP_LIST_ID')
             
             if not uploaded_contracts_list_id:
-                print("SP_LIST_ID not found in environment variables")
+                logger.debug("SP_LIST_ID not found in environment variables")
                 return None
             
-            print(f"\n=== DEBUG get_contract_by_id ===")
-            print(f"Contract ID: {contract_id}")
+            logger.debug("=== DEBUG get_contract_by_id ===")
+            logger.debug("Contract ID: %s", contract_id)
             
             headers = {
                 'Authorization': f'Bearer {self.access_token}',
@@ -776,9 +845,9 @@ class SharePointService:
                 '$filter': f"fields/ContractID eq '{contract_id}'"
             }
             
-            response = requests.get(items_url, headers=headers, params=params)
+            response = http_session.get(items_url, headers=headers, params=params)
             
-            print(f"SharePoint API response: {response.status_code}")
+            logger.debug("SharePoint API response: %s", response.status_code)
             
             if response.status_code == 200:
                 items_data = response.json()
@@ -796,6 +865,7 @@ class SharePointService:
                         'name': fields.get('Title', 'Unknown'),
                         'submitter_name': fields.get('SubmitterName', 'Unknown'),
                         'submitter_email': fields.get('SubmitterEmail', ''),
+                        'submitter_email_lc': fields.get('SubmitterEmail', '').lower(),  # for access checks
                         'business_approver_email': fields.get('BusinessApproverEmail', ''),
                         'date_submitted': fields.get('DateSubmitted', ''),
                         'date_requested': fields.get('DateRequested', ''),
@@ -808,21 +878,26 @@ class SharePointService:
                         'fields': fields  # Include raw fields for download service
                     }
                     
-                    print(f"Contract found: {contract['name']}")
+                    logger.debug("Contract found: %s", contract['name'])
+                    if self._contract_cache is not None:
+                        self._contract_cache[contract_id] = contract
                     return contract
                 else:
-                    print(f"No contract found with ContractID: {contract_id}")
+                    logger.debug("No contract found with ContractID: %s", contract_id)
                     return None
             else:
-                print(f"Error retrieving contract: {response.status_code} - {response.text}")
+                logger.error("Error retrieving contract: %s - %s", response.status_code, response.text)
                 return None
                 
         except Exception as e:
-            print(f"Error retrieving contract by ID: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error retrieving contract by ID: %s", str(e))
             return None
     
+    def _forget_cached_contracts(self):
+        """Drop this request's contract lookups after a list item is modified"""
+        if self._contract_cache is not None:
+            self._contract_cache.clear()
+    
     def get_field_choices(self, field_name):
         """
         Get the choice options for a specific field in the SharePoint list
@@ -840,11 +915,11 @@ class SharePointService:
             uploaded_contracts_list_id = os.getenv('SP_LIST_ID')
             
             if not uploaded_contracts_list_id:
-                print("SP_LIST_ID not found in environment variables")
+                logger.debug("SP_LIST_ID not found in environment variables")
                 return []
             
-            print(f"\n=== DEBUG get_field_choices ===")
-            print(f"Field: {field_name}")
+            logger.debug("=== DEBUG get_field_choices ===")
+            logger.debug("Field: %s", field_name)
             
             headers = {
                 'Authorization': f'Bearer {self.access_token}',
@@ -854,7 +929,7 @@ class SharePointService:
             # Get all columns for the list
             columns_url = f"{self.graph_url}/sites/{self.site_id}/lists/{uploaded_contracts_list_id}/columns"
             
-            response = requests.get(columns_url, headers=headers)
+            response = http_session.get(columns_url, headers=headers)
             
             if response.status_code == 200:
                 columns = response.json().get('value', [])
@@ -865,22 +940,20 @@ class SharePointService:
                         # Check if it's a choice field
                         if 'choice' in column:
                             choices = column['choice'].get('choices', [])
-                            print(f"✓ Found {len(choices)} choices for {field_name}: {choices}")
+                            logger.debug("✓ Found %s choices for %s: %s", len(choices), field_name, choices)
                             return choices
                         else:
-                            print(f"⚠ Field {field_name} is not a choice field")
+                            logger.warning("⚠ Field %s is not a choice field", field_name)
                             return []
                 
-                print(f"⚠ Field {field_name} not found in list")
+                logger.warning("⚠ Field %s not found in list", field_name)
                 return []
             else:
-                print(f"✗ Error fetching columns: {response.status_code} - {response.text}")
+                logger.error("✗ Error fetching columns: %s - %s", response.status_code, response.text)
                 return []
                 
         except Exception as e:
-            print(f"Error fetching field choices: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error fetching field choices: %s", str(e))
             return []
     
     def update_contract_field(self, item_id, field_name, value):
@@ -902,14 +975,14 @@ class SharePointService:
             uploaded_contracts_list_id = os.getenv('SP_LIST_ID')
             
             if not uploaded_contracts_list_id:
-                print("SP_LIST_ID not found in environment variables")
+                logger.debug("SP_LIST_ID not found in environment variables")
                 return False
             
-            print(f"\n=== DEBUG update_contract_field ===")
-            print(f"Item ID: {item_id}")
-            print(f"Field: {field_name}")
-            print(f"Value: {value}")
-            print(f"Value type: {type(value)}")
+            logger.debug("=== DEBUG update_contract_field ===")
+            logger.debug("Item ID: %s", item_id)
+            logger.debug("Field: %s", field_name)
+            logger.debug("Value: %s", value)
+            logger.debug("Value type: %s", type(value))
             
             headers = {
                 'Authorization': f'Bearer {self.access_token}',
@@ -928,23 +1001,22 @@ class SharePointService:
             if isinstance(value, list) and field_name == 'BusinessTerms':
                 payload[f'{field_name}@odata.type'] = 'Collection(Edm.String)'
             
-            print(f"Payload: {payload}")
+            logger.debug("Payload: %s", payload)
             
-            response = requests.patch(update_url, headers=headers, json=payload)
+            response = http_session.patch(update_url, headers=headers, json=payload)
             
-            print(f"Update response: {response.status_code}")
+            logger.debug("Update response: %s", response.status_code)
             
             if response.status_code == 200:
-                print(f"✓ Successfully updated {field_name} to '{value}'")
+                logger.debug("✓ Successfully updated %s to '%s'", field_name, value)
+                self._forget_cached_contracts()
                 return True
             else:
-                print(f"✗ Error updating field: {response.status_code} - {response.text}")
+                logger.error("✗ Error updating field: %s - %s", response.status_code, response.text)
                 return False
                 
         except Exception as e:
-            print(f"Error updating contract field: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error updating contract field: %s", str(e))
             return False
     
     def update_enhanced_document_link(self, item_id, drive_item):
@@ -985,11 +1057,11 @@ class SharePointService:
             if not file_id or not file_name:
                 raise ValueError("drive_item missing 'id' or 'name' property")
             
-            print(f"\n=== DEBUG update_enhanced_document_link ===")
-            print(f"Item ID: {item_id}")
-            print(f"File ID: {file_id}")
-            print(f"File Name: {file_name}")
-            print(f"Original webUrl length: {len(web_url)} chars")
+            logger.debug("=== DEBUG update_enhanced_document_link ===")
+            logger.debug("Item ID: %s", item_id)
+            logger.debug("File ID: %s", file_id)
+            logger.debug("File Name: %s", file_name)
+            logger.debug("Original webUrl length: %s chars", len(web_url))
             
             # Construct a shorter direct link using the drive and file ID
             # Format: https://{tenant}.sharepoint.com/sites/{site}/ContractFiles/{filename}
@@ -1000,15 +1072,15 @@ class SharePointService:
             # Build shorter URL: {site_url}/ContractFiles/{filename}
             enhanced_url = f"{site_url}/ContractFiles/{file_name}"
             
-            print(f"Constructed shorter URL: {enhanced_url}")
-            print(f"Shorter URL length: {len(enhanced_url)} characters")
+            logger.debug("Constructed shorter URL: %s", enhanced_url)
+            logger.debug("Shorter URL length: %s characters", len(enhanced_url))
             
             # One-time debug: Show why previous attempts with Doc.aspx URLs failed
-            print(f"\n⚠ URL Length Check:")
-            print(f"  Original webUrl length: {len(web_url)} chars (Doc.aspx viewer)")
-            print(f"  Constructed URL length: {len(enhanced_url)} chars (direct link)")
-            print(f"  SharePoint limit: 255 chars (Single line of text)")
-            print(f"  Status: {'✓ PASS' if len(enhanced_url) <= 255 else '✗ FAIL - URL TOO LONG'}")
+            logger.warning("⚠ URL Length Check:")
+            logger.debug("  Original webUrl length: %s chars (Doc.aspx viewer)", len(web_url))
+            logger.debug("  Constructed URL length: %s chars (direct link)", len(enhanced_url))
+            logger.debug("  SharePoint limit: 255 chars (Single line of text)")
+            logger.debug("  Status: %s", '✓ PASS' if len(enhanced_url) <= 255 else '✗ FAIL - URL TOO LONG')
             
             # Check 255 character limit for "Single line of text" field type
             if len(enhanced_url) > 255:
@@ -1019,7 +1091,7 @@ class SharePointService:
                     f"The direct link format is shorter than Doc.aspx viewer, but still too long. "
                     f"Consider changing the SharePoint field type to 'Hyperlink' instead of 'Single line of text'."
                 )
-                print(f"✗ {error_msg}")
+                logger.error("✗ %s", error_msg)
                 raise ValueError(error_msg)
             
             headers = {
@@ -1035,44 +1107,59 @@ class SharePointService:
                 "EnhancedDocumentLink": enhanced_url
             }
             
-            print(f"PATCH URL: {update_url}")
-            print(f"Payload keys: {list(payload.keys())}")
+            logger.debug("PATCH URL: %s", update_url)
+            logger.debug("Payload keys: %s", list(payload.keys()))
             
-            response = requests.patch(update_url, headers=headers, json=payload)
+            response = http_session.patch(update_url, headers=headers, json=payload)
             
-            print(f"Response status: {response.status_code}")
+            logger.debug("Response status: %s", response.status_code)
             
             # Log short response snippet (without sensitive data)
             if response.status_code not in (200, 204):
                 response_preview = response.text[:200] if response.text else "(empty)"
-                print(f"Response preview: {response_preview}")
+                logger.debug("Response preview: %s", response_preview)
             
             # Map status codes per requirements
             if response.status_code in (200, 204):
-                print(f"✓ Successfully updated EnhancedDocumentLink")
+                logger.debug("✓ Successfully updated EnhancedDocumentLink")
+                self._forget_cached_contracts()
                 return
             elif response.status_code == 401:
-                print(f"✗ 401 Unauthorized - Session expired")
+                logger.error("✗ 401 Unauthorized - Session expired")
                 raise PermissionError("SESSION_EXPIRED")
             elif response.status_code == 403:
-                print(f"✗ 403 Forbidden - Access denied")
+                logger.error("✗ 403 Forbidden - Access denied")
                 raise PermissionError("ACCESS_DENIED")
             elif response.status_code == 404:
-                print(f"✗ 404 Not Found - Item not found")
+                logger.error("✗ 404 Not Found - Item not found")
                 raise FileNotFoundError(f"List item {item_id} not found")
             else:
                 error_msg = f"Failed to update EnhancedDocumentLink: HTTP {response.status_code}"
-                print(f"✗ {error_msg}")
+                logger.error("✗ %s", error_msg)
                 raise RuntimeError(error_msg)
                 
         except (ValueError, PermissionError, FileNotFoundError, RuntimeError):
             # Re-raise expected exceptions
             raise
         except Exception as e:
-            print(f"Error updating enhanced document link: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error updating enhanced document link: %s", str(e))
             raise RuntimeError(f"Unexpected error: {str(e)}")
 
 # Initialize SharePoint service instance
-sharepoint_service = SharePointService()
\ No newline at end of file
+sharepoint_service = SharePointService()
+
+
+def get_sharepoint_service():
+    """
+    SharePoint service scoped to the current request (stored on flask.g)
+    
+    Returns a shallow copy of the process-wide instance: site/drive IDs and the
+    app token are reused, while the per-user token that _ensure_valid_token
+    writes stays on this request's copy instead of leaking into other users'
+    concurrent requests.
+    """
+    if 'sharepoint_service' not in g:
+        request_service = copy.copy(sharepoint_service)
+        request_service._contract_cache = {}
+        g.sharepoint_service = request_service
+    return g.sharepoint_service
@@ -1,18 +1,25 @@
 """
 SharePoint contract download service using Microsoft Graph API.
-Downloads contract files and returns temporary file paths.
+Downloads contract files to temporary files, or into memory for text extraction.
 """
 import os
 import logging
 import time
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Tuple
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+from typing import BinaryIO, Callable, Tuple, Union
 import requests
+from app.services.graph_session import http_session
 from flask import session
 
 logger = logging.getLogger(__name__)
 
+# Bytes per chunk when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# In-memory downloads larger than this spill over to a temporary file
+IN_MEMORY_DOWNLOAD_LIMIT = 100 * 1024 * 1024
+
 
 class DownloadError(Exception):
     """Base exception for download failures."""
@@ -43,12 +50,12 @@ def _get_bearer_token() -> str:
             now_utc = datetime.now(timezone.utc)
             if now_utc >= token_expires_at:
                 logger.warning("Access token has expired")
-                print(f"DEBUG sp_download: Token expired at {token_expires_at}")
-                print(f"DEBUG sp_download: Current time is {now_utc}")
+                logger.debug("Token expired at %s", token_expires_at)
+                logger.debug("Current time is %s", now_utc)
                 raise PermissionError("SESSION_EXPIRED")
             else:
                 time_left = (token_expires_at - now_utc).total_seconds() / 60
-                print(f"DEBUG sp_download: Token valid for {time_left:.1f} more minutes")
+                logger.debug("Token valid for %.1f more minutes", time_left)
         except ValueError as e:
             logger.warning(f"Could not parse token expiration: {e}")
             # Continue with token anyway - API will reject if expired
@@ -87,7 +94,7 @@ def _attempt_token_refresh() -> str:
         accounts = msal_app.get_accounts(username=user_email)
         if accounts:
             logger.info(f"Attempting silent token refresh for {user_email}")
-            print(f"DEBUG sp_download: Attempting silent token refresh")
+            logger.debug("Attempting silent token refresh")
             result = msal_app.acquire_token_silent(
                 scopes=["User.Read", "Files.ReadWrite.All", "Sites.ReadWrite.All"],
                 account=accounts[0]
@@ -97,16 +104,14 @@ def _attempt_token_refresh() -> str:
                 # Update session with new token
                 session['access_token'] = result['access_token']
                 logger.info("Successfully refreshed access token")
-                print(f"DEBUG sp_download: Token refreshed successfully")
+                logger.debug("Token refreshed successfully")
                 return result['access_token']
         
         logger.warning("Silent token refresh failed - user needs to re-authenticate")
-        print(f"DEBUG sp_download: Silent token refresh failed")
         raise PermissionError("SESSION_EXPIRED")
         
     except Exception as e:
         logger.error(f"Token refresh error: {str(e)}")
-        print(f"DEBUG sp_download: Token refresh error: {str(e)}")
         raise PermissionError("SESSION_EXPIRED")
 
 
@@ -169,7 +174,7 @@ def _verify_drive_access(drive_id: str, token: str) -> dict:
     graph_base = "https://graph.microsoft.com/v1.0"
     drive_url = f"{graph_base}/drives/{drive_id}"
     
-    print(f"DEBUG sp_download: Verifying drive access: {drive_url}")
+    logger.debug("Verifying drive access: %s", drive_url)
     logger.info(f"Verifying drive access for drive_id: {drive_id}")
     
     headers = {
@@ -178,29 +183,26 @@ def _verify_drive_access(drive_id: str, token: str) -> dict:
     }
     
     try:
-        response = requests.get(drive_url, headers=headers, timeout=10)
-        print(f"DEBUG sp_download: Drive verification response: {response.status_code}")
+        response = http_session.get(drive_url, headers=headers, timeout=10)
+        logger.debug("Drive verification response: %s", response.status_code)
         
         if response.status_code == 200:
             drive_info = response.json()
             drive_name = drive_info.get('name', 'Unknown')
             drive_type = drive_info.get('driveType', 'Unknown')
-            print(f"DEBUG sp_download: ✓ Drive accessible - Name: '{drive_name}', Type: {drive_type}")
+            logger.debug("✓ Drive accessible - Name: '%s', Type: %s", drive_name, drive_type)
             logger.info(f"Drive verified: name={drive_name}, type={drive_type}")
             return drive_info
         elif response.status_code == 401:
             error_msg = response.text[:200]
-            print(f"DEBUG sp_download: ✗ 401 accessing drive: {error_msg}")
             raise RuntimeError(f"401 Unauthorized accessing drive. Token may lack permissions. Error: {error_msg}")
         elif response.status_code == 404:
-            print(f"DEBUG sp_download: ✗ 404 - Drive not found")
             raise RuntimeError(f"Drive ID not found: {drive_id}. Check DRIVE_ID in .env file.")
         else:
             error_msg = response.text[:200]
-            print(f"DEBUG sp_download: ✗ Drive access failed: {response.status_code} - {error_msg}")
+            logger.debug("Drive access failed: %s - %s", response.status_code, error_msg)
             raise RuntimeError(f"Cannot access drive: HTTP {response.status_code}")
     except requests.RequestException as e:
-        print(f"DEBUG sp_download: ✗ Request exception: {str(e)}")
         raise RuntimeError(f"Network error verifying drive: {str(e)}")
 
 
@@ -215,10 +217,10 @@ def _get_contract_metadata(contract_id: str, token: str) -> Tuple[str, str, str,
         FileNotFoundError: If contract not found.
         RuntimeError: On API errors.
     """
-    from app.services.sharepoint_service import SharePointService
+    from app.services.sharepoint_service import get_sharepoint_service
     
     try:
-        sp_service = SharePointService()
+        sp_service = get_sharepoint_service()
         contract = sp_service.get_contract_by_id(contract_id)
         
         if not contract:
@@ -229,24 +231,24 @@ def _get_contract_metadata(contract_id: str, token: str) -> Tuple[str, str, str,
         item_id = contract.get('fields', {}).get('ItemId')
         server_relative_path = contract.get('fields', {}).get('ServerRelativePath')
         
-        print(f"DEBUG sp_download: Initial metadata - drive_id={drive_id}, item_id={item_id}, server_relative_path={server_relative_path}")
+        logger.debug("Initial metadata - drive_id=%s, item_id=%s, server_relative_path=%s", drive_id, item_id, server_relative_path)
         
         # If item_id not found in fields, extract from Document_x0020_Link URL
         if not item_id:
             document_url = contract.get('document_url') or contract.get('fields', {}).get('Document_x0020_Link')
-            print(f"DEBUG sp_download: Attempting to extract item ID from URL")
-            print(f"DEBUG sp_download: document_url = {document_url}")
+            logger.debug("Attempting to extract item ID from URL")
+            logger.debug("document_url = %s", document_url)
             logger.debug(f"Attempting to extract item ID from document_url: {document_url}")
             if document_url:
                 try:
                     item_id = _extract_item_id_from_url(document_url)
-                    print(f"DEBUG sp_download: Successfully extracted item_id = {item_id}")
+                    logger.debug("Successfully extracted item_id = %s", item_id)
                     logger.info(f"Extracted item ID from document URL: {item_id}")
                 except ValueError as e:
-                    print(f"DEBUG sp_download: Failed to extract item ID: {e}")
+                    logger.debug("Failed to extract item ID: %s", e)
                     logger.warning(f"Could not extract item ID from URL: {e}")
             else:
-                print(f"DEBUG sp_download: No document_url found in contract data")
+                logger.debug("No document_url found in contract data")
                 logger.warning("No document_url found in contract data")
         
         # Get file extension from filename
@@ -264,21 +266,24 @@ def _get_contract_metadata(contract_id: str, token: str) -> Tuple[str, str, str,
         raise RuntimeError("Failed to retrieve contract information")
 
 
-def _download_file_content(url: str, token: str, retry_with_refresh: bool = True) -> bytes:
+def _get_download_response(url: str, token: str, retry_with_refresh: bool = True) -> requests.Response:
     """
-    Download file content from Microsoft Graph with token refresh on 401.
+    Open a streamed download from Microsoft Graph with token refresh on 401.
     
     Args:
         url: Microsoft Graph API URL to download from.
         token: Bearer token for authorization.
         retry_with_refresh: If True and 401 received, attempt token refresh and retry once.
     
+    Returns:
+        The successful response with its body not yet read.
+    
     Raises:
         PermissionError: On 401 status after token refresh attempt.
         FileNotFoundError: On 404 status.
         RuntimeError: On other HTTP errors or permission issues.
     """
-    print(f"DEBUG sp_download: Downloading from URL: {url}")
+    logger.debug("Downloading from URL: %s", url)
     logger.info(f"Attempting download from: {url}")
     
     headers = {
@@ -287,43 +292,41 @@ def _download_file_content(url: str, token: str, retry_with_refresh: bool = True
     }
     
     try:
-        response = requests.get(
+        response = http_session.get(
             url,
             headers=headers,
             timeout=(5, 30),  # connect timeout 5s, read timeout 30s
             stream=True
         )
         
-        print(f"DEBUG sp_download: Download response status: {response.status_code}")
+        logger.debug("Download response status: %s", response.status_code)
         
-        # For non-200 responses, try to get error details
-        if not response.ok:
+        # For non-200 responses, try to get error details (404s are routine while trying URL patterns;
+        # the status handling below logs real failures)
+        if not response.ok and logger.isEnabledFor(logging.DEBUG):
             try:
-                error_body = response.text
-                print(f"DEBUG sp_download: Error response body: {error_body[:500]}")
-                logger.error(f"Graph API error: {error_body[:500]}")
-            except:
+                logger.debug("Graph API error body: %s", response.text[:500])
+            except Exception:
                 pass
         
         # Handle specific status codes
         if response.status_code == 401:
             logger.warning("Received 401 Unauthorized during download")
-            print(f"DEBUG sp_download: 401 Unauthorized, retry_with_refresh={retry_with_refresh}")
+            logger.debug("401 Unauthorized, retry_with_refresh=%s", retry_with_refresh)
             
             if retry_with_refresh:
                 # Attempt to refresh the token and retry once
                 try:
-                    print(f"DEBUG sp_download: Attempting token refresh after 401")
+                    logger.debug("Attempting token refresh after 401")
                     new_token = _attempt_token_refresh()
                     # Retry download with refreshed token (no further refresh attempts)
-                    return _download_file_content(url, new_token, retry_with_refresh=False)
+                    return _get_download_response(url, new_token, retry_with_refresh=False)
                 except PermissionError:
                     # Token refresh failed, user needs to re-authenticate
                     raise PermissionError("SESSION_EXPIRED")
             else:
                 # Already tried refresh, this is a permissions issue
                 logger.error("401 after token refresh - likely a permissions issue")
-                print(f"DEBUG sp_download: 401 persists after token refresh")
                 raise RuntimeError(
                     "Access denied to contract file. This may be a SharePoint permissions issue. "
                     "Please verify the file is accessible and the app has the required permissions."
@@ -331,12 +334,11 @@ def _download_file_content(url: str, token: str, retry_with_refresh: bool = True
         
         elif response.status_code == 404:
             logger.debug(f"File not found at URL (404)")
-            print(f"DEBUG sp_download: 404 Not Found")
+            logger.debug("404 Not Found")
             raise FileNotFoundError("File not found at this URL")
         
         elif response.status_code == 403:
             logger.error(f"403 Forbidden - insufficient permissions")
-            print(f"DEBUG sp_download: 403 Forbidden")
             raise RuntimeError(
                 "Insufficient permissions to access the file. "
                 "The file may require special SharePoint permissions."
@@ -344,30 +346,95 @@ def _download_file_content(url: str, token: str, retry_with_refresh: bool = True
         
         elif response.status_code in (429, 503):
             logger.warning(f"Received {response.status_code}, rate limited or service unavailable")
-            print(f"DEBUG sp_download: {response.status_code} - will retry")
             raise RuntimeError(f"SharePoint service temporarily unavailable ({response.status_code})")
         
         elif not response.ok:
             logger.error(f"Download failed with status {response.status_code}")
-            print(f"DEBUG sp_download: Download failed with status {response.status_code}")
             raise RuntimeError(f"Failed to download contract file (HTTP {response.status_code})")
         
-        print(f"DEBUG sp_download: Download successful, content length: {len(response.content)} bytes")
-        return response.content
+        return response
         
     except requests.Timeout:
         logger.error("Download request timed out")
-        print(f"DEBUG sp_download: Request timed out")
         raise RuntimeError("Download request timed out")
     except (PermissionError, FileNotFoundError, RuntimeError):
         # Re-raise our custom exceptions
         raise
     except requests.RequestException as e:
         logger.error(f"Download request failed: {type(e).__name__}: {str(e)}")
-        print(f"DEBUG sp_download: Request exception: {type(e).__name__}")
         raise RuntimeError("Failed to download contract file")
 
 
+def _download_to_file(url: str, token: str, file_ext: str) -> Path:
+    """
+    Stream file content from Microsoft Graph straight into a temporary file.
+    
+    The partial file is removed if the download fails.
+    
+    Returns:
+        Path to the temporary file.
+    
+    Raises:
+        Same as _get_download_response; RuntimeError if the stream breaks mid-download.
+    """
+    response = _get_download_response(url, token, retry_with_refresh=True)
+    
+    temp_file = NamedTemporaryFile(mode='wb', suffix=file_ext, delete=False)
+    try:
+        with response, temp_file:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                temp_file.write(chunk)
+    except requests.RequestException as e:
+        Path(temp_file.name).unlink(missing_ok=True)
+        logger.error(f"Download stream failed: {type(e).__name__}: {str(e)}")
+        raise RuntimeError("Failed to download contract file")
+    except BaseException:
+        Path(temp_file.name).unlink(missing_ok=True)
+        raise
+    
+    return Path(temp_file.name)
+
+
+def _download_to_buffer(url: str, token: str, file_ext: str) -> BinaryIO:
+    """
+    Stream file content from Microsoft Graph into memory.
+    
+    Content past IN_MEMORY_DOWNLOAD_LIMIT rolls over to an anonymous temporary file.
+    
+    Returns:
+        Binary file object positioned at the start of the content.
+    
+    Raises:
+        Same as _get_download_response; RuntimeError if the stream breaks mid-download.
+    """
+    response = _get_download_response(url, token, retry_with_refresh=True)
+    
+    buffer = SpooledTemporaryFile(max_size=IN_MEMORY_DOWNLOAD_LIMIT, mode='w+b', suffix=file_ext)
+    try:
+        with response:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
+    except requests.RequestException as e:
+        buffer.close()
+        logger.error(f"Download stream failed: {type(e).__name__}: {str(e)}")
+        raise RuntimeError("Failed to download contract file")
+    except BaseException:
+        buffer.close()
+        raise
+    
+    buffer.seek(0)
+    return buffer
+
+
+def _downloaded_size(downloaded: Union[Path, BinaryIO]) -> int:
+    """Size in bytes of a downloaded temp file or buffer (buffers are left rewound)."""
+    if isinstance(downloaded, Path):
+        return downloaded.stat().st_size
+    size = downloaded.seek(0, os.SEEK_END)
+    downloaded.seek(0)
+    return size
+
+
 def download_contract(contract_id: str) -> Path:
     """
     Download a contract file from SharePoint using delegated user token.
@@ -389,6 +456,46 @@ def download_contract(contract_id: str) -> Path:
         FileNotFoundError: If contract file not found after all attempts.
         RuntimeError: On other download failures.
     """
+    temp_path, _ = _download_contract(contract_id, _download_to_file)
+    return temp_path
+
+
+def download_contract_content(contract_id: str) -> Tuple[BinaryIO, str]:
+    """
+    Download a contract file from SharePoint into memory, without a temp file on disk.
+    
+    Same lookup and URL fallbacks as download_contract; files over
+    IN_MEMORY_DOWNLOAD_LIMIT spill to an anonymous temporary file.
+    
+    Args:
+        contract_id: The SharePoint list item ID.
+    
+    Returns:
+        Tuple of (binary file object at position 0, file extension such as '.docx').
+        The caller closes the file object.
+    
+    Raises:
+        Same as download_contract.
+    """
+    return _download_contract(contract_id, _download_to_buffer)
+
+
+def _download_contract(
+    contract_id: str,
+    fetch: Callable[[str, str, str], Union[Path, BinaryIO]]
+) -> Tuple[Union[Path, BinaryIO], str]:
+    """
+    Look up a contract and download it through the first URL pattern that works.
+    
+    Tries multiple URL patterns in sequence to locate the file (see download_contract).
+    
+    Args:
+        contract_id: The SharePoint list item ID.
+        fetch: Downloader called as fetch(url, token, file_ext).
+    
+    Returns:
+        Tuple of (what fetch returned, file extension).
+    """
     start_time = time.time()
     
     try:
@@ -396,8 +503,8 @@ def download_contract(contract_id: str) -> Path:
         token = _get_bearer_token()
         
         # Get contract metadata
-        from app.services.sharepoint_service import SharePointService
-        sp_service = SharePointService()
+        from app.services.sharepoint_service import get_sharepoint_service
+        sp_service = get_sharepoint_service()
         contract = sp_service.get_contract_by_id(contract_id)
         
         if not contract:
@@ -413,10 +520,10 @@ def download_contract(contract_id: str) -> Path:
         if document_url:
             try:
                 item_id = _extract_item_id_from_url(document_url)
-                print(f"DEBUG sp_download: Extracted item_id = {item_id}")
+                logger.debug("Extracted item_id = %s", item_id)
                 logger.info(f"Extracted item ID from URL: {item_id}")
             except ValueError as e:
-                print(f"DEBUG sp_download: Could not extract item ID: {e}")
+                logger.debug("Could not extract item ID: %s", e)
                 logger.warning(f"Could not extract item ID: {e}")
         
         # Get configuration
@@ -424,19 +531,18 @@ def download_contract(contract_id: str) -> Path:
         drive_id = os.getenv('DRIVE_ID', '')  # ContractFiles library drive
         site_id = os.getenv('O365_SITE_ID', '')
         
-        print(f"DEBUG sp_download: Metadata - file_name={file_name}, item_id={item_id}")
-        print(f"DEBUG sp_download: Config - drive_id={drive_id[:20]}..., site_id={site_id}")
+        logger.debug("Metadata - file_name=%s, item_id=%s", file_name, item_id)
+        logger.debug("Config - drive_id=%s..., site_id=%s", drive_id[:20], site_id)
         
         # === OPTION D: Verify drive access before attempting download ===
         if drive_id:
             try:
                 drive_info = _verify_drive_access(drive_id, token)
-                print(f"DEBUG sp_download: Drive verification successful")
+                logger.debug("Drive verification successful")
             except RuntimeError as e:
-                print(f"DEBUG sp_download: Drive verification failed: {str(e)}")
-                logger.error(f"Drive verification failed: {str(e)}")
+                logger.warning("Drive verification failed: %s", e)
                 # Don't fail completely - continue with attempts but warn user
-                print(f"DEBUG sp_download: Continuing with download attempts despite drive verification failure")
+                logger.debug("Continuing with download attempts despite drive verification failure")
         
         # Build list of URLs to try (in order of likelihood)
         download_attempts = []
@@ -474,40 +580,33 @@ def download_contract(contract_id: str) -> Path:
                 f"Need DRIVE_ID={bool(drive_id)}, file_name={bool(file_name)}"
             )
         
-        print(f"DEBUG sp_download: Will try {len(download_attempts)} URL patterns")
+        logger.debug("Will try %s URL patterns", len(download_attempts))
         
         # Try each URL pattern in sequence
         last_error = None
         for attempt_num, (method_name, url) in enumerate(download_attempts, 1):
             try:
-                print(f"DEBUG sp_download: Attempt {attempt_num}/{len(download_attempts)}: {method_name}")
-                print(f"DEBUG sp_download: URL: {url}")
+                logger.debug("Attempt %s/%s: %s", attempt_num, len(download_attempts), method_name)
+                logger.debug("URL: %s", url)
                 logger.info(f"Download attempt {attempt_num}: {method_name}")
                 
-                # Attempt download (with token refresh on 401)
-                content = _download_file_content(url, token, retry_with_refresh=True)
-                
-                # Success! Save to temporary file
-                temp_file = NamedTemporaryFile(mode='wb', suffix=file_ext, delete=False)
-                temp_file.write(content)
-                temp_file.flush()
-                temp_file.close()
+                # Attempt download (with token refresh on 401), streamed to a temp file or buffer
+                downloaded = fetch(url, token, file_ext)
                 
                 duration = time.time() - start_time
-                size_kb = len(content) / 1024
+                size_kb = _downloaded_size(downloaded) / 1024
                 
-                print(f"DEBUG sp_download: ✓ SUCCESS with {method_name}")
+                logger.debug("✓ SUCCESS with %s", method_name)
                 logger.info(
                     f"Contract downloaded successfully: contract_id={contract_id}, "
                     f"method={method_name}, size={size_kb:.1f}KB, duration={duration:.2f}s"
                 )
                 
-                return Path(temp_file.name)
+                return downloaded, file_ext
                 
             except FileNotFoundError as e:
                 # 404 - file not at this URL, try next
-                print(f"DEBUG sp_download: ✗ 404 Not Found, trying next URL...")
-                logger.debug(f"Attempt {attempt_num} failed: {method_name} - {str(e)}")
+                logger.debug("Attempt %s failed (404): %s - %s, trying next URL", attempt_num, method_name, e)
                 last_error = e
                 continue
                 
@@ -521,13 +620,11 @@ def download_contract(contract_id: str) -> Path:
                 if "401 after token refresh" in error_msg or "403 Forbidden" in error_msg:
                     # Permission issue - don't continue
                     raise
-                print(f"DEBUG sp_download: ✗ Error: {error_msg}, trying next URL...")
-                logger.debug(f"Attempt {attempt_num} failed: {method_name} - {error_msg}")
+                logger.debug("Attempt %s failed: %s - %s, trying next URL", attempt_num, method_name, error_msg)
                 last_error = e
                 continue
         
         # All attempts failed
-        print(f"DEBUG sp_download: All {len(download_attempts)} download attempts failed")
         logger.error(f"Failed to download contract after {len(download_attempts)} attempts")
         raise FileNotFoundError(
             f"Contract file not found at any expected location. "
@@ -545,16 +642,17 @@ def download_contract(contract_id: str) -> Path:
         raise RuntimeError("An unexpected error occurred during download")
 
 
-def download_contract_by_filename(drive_id: str, filename: str) -> bytes:
+def stream_contract_by_filename(drive_id: str, filename: str) -> requests.Response:
     """
-    Download a contract file by filename from SharePoint drive.
+    Open a streamed download of a contract file by filename from SharePoint drive.
     
     Args:
         drive_id: SharePoint drive ID
         filename: Name of the file to download
     
     Returns:
-        bytes: File content
+        requests.Response: Successful response with its body not yet read
+        (iterate with iter_content and close when done)
     
     Raises:
         FileNotFoundError: If file not found
@@ -568,32 +666,57 @@ def download_contract_by_filename(drive_id: str, filename: str) -> bytes:
     
     headers = {'Authorization': f'Bearer {token}'}
     
-    print(f"DEBUG sp_download: Downloading file by name: {filename}")
+    logger.debug("Downloading file by name: %s", filename)
     
     try:
-        response = requests.get(url, headers=headers, timeout=60)
+        response = http_session.get(url, headers=headers, timeout=60, stream=True)
         
         if response.status_code == 200:
-            print(f"DEBUG sp_download: ✓ Download successful - {len(response.content)} bytes")
-            return response.content
-        elif response.status_code == 404:
-            raise FileNotFoundError(f"File not found: {filename}")
-        elif response.status_code == 401:
-            raise PermissionError("SESSION_EXPIRED")
-        else:
-            error_msg = f"Download failed: HTTP {response.status_code}"
-            try:
-                error_data = response.json()
-                if 'error' in error_data:
-                    error_msg += f" - {error_data['error'].get('message', 'Unknown error')}"
-            except:
-                pass
-            raise DownloadError(error_msg)
+            logger.debug("✓ Download started - %s bytes", response.headers.get('Content-Length', 'unknown'))
+            return response
+        
+        with response:
+            if response.status_code == 404:
+                raise FileNotFoundError(f"File not found: {filename}")
+            elif response.status_code == 401:
+                raise PermissionError("SESSION_EXPIRED")
+            else:
+                error_msg = f"Download failed: HTTP {response.status_code}"
+                try:
+                    error_data = response.json()
+                    if 'error' in error_data:
+                        error_msg += f" - {error_data['error'].get('message', 'Unknown error')}"
+                except:
+                    pass
+                raise DownloadError(error_msg)
     
     except requests.exceptions.RequestException as e:
         raise DownloadError(f"Network error: {str(e)}")
 
 
+def download_contract_by_filename(drive_id: str, filename: str) -> bytes:
+    """
+    Download a contract file by filename from SharePoint drive.
+    
+    Args:
+        drive_id: SharePoint drive ID
+        filename: Name of the file to download
+    
+    Returns:
+        bytes: File content
+    
+    Raises:
+        FileNotFoundError: If file not found
+        PermissionError: If SESSION_EXPIRED or access denied
+        DownloadError: If download fails for other reasons
+    """
+    with stream_contract_by_filename(drive_id, filename) as response:
+        try:
+            return response.content
+        except requests.exceptions.RequestException as e:
+            raise DownloadError(f"Network error: {str(e)}")
+
+
 def get_file_metadata_by_filename(drive_id: str, filename: str) -> dict:
     """
     Get file metadata including webUrl from SharePoint by filename.
@@ -617,16 +740,16 @@ def get_file_metadata_by_filename(drive_id: str, filename: str) -> dict:
     
     headers = {'Authorization': f'Bearer {token}'}
     
-    print(f"DEBUG sp_download: Getting metadata for file: {filename}")
+    logger.debug("Getting metadata for file: %s", filename)
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http_session.get(url, headers=headers, timeout=30)
         
         if response.status_code == 200:
             metadata = response.json()
-            print(f"DEBUG sp_download: ✓ Metadata retrieved")
-            print(f"  File ID: {metadata.get('id', 'N/A')[:20]}...")
-            print(f"  WebUrl: {metadata.get('webUrl', 'N/A')[:80]}...")
+            logger.debug("✓ Metadata retrieved")
+            logger.debug("  File ID: %s...", metadata.get('id', 'N/A')[:20])
+            logger.debug("  WebUrl: %s...", metadata.get('webUrl', 'N/A')[:80])
             return metadata
         elif response.status_code == 404:
             raise FileNotFoundError(f"File not found: {filename}")
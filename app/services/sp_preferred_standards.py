@@ -5,11 +5,47 @@ Loads gold standard clauses from a SharePoint list.
 import os
 import logging
 import requests
+from app.services.graph_session import http_session
 from flask import session
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from app.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+# Preferred standards change rarely; cache the parsed SharePoint list per list ID.
+# Fallback standards are never cached so a recovered SharePoint is picked up right away.
+PREFERRED_STANDARDS_TTL_SECONDS = 300
+_standards_cache = TTLCache()
+
+# Standard names used when the SharePoint list is unavailable (immutable; do not modify)
+FALLBACK_STANDARDS: tuple[str, ...] = (
+    "Indemnification",
+    "Limitation of Liability",
+    "Term and Termination",
+    "Confidentiality",
+    "Intellectual Property",
+    "Warranties",
+    "Payment Terms",
+    "Dispute Resolution",
+    "Governing Law",
+    "Force Majeure",
+    "Assignment",
+    "Notices",
+    "Entire Agreement",
+    "Severability",
+    "Waiver",
+    "Insurance Requirements",
+    "Compliance with Laws",
+    "Data Protection",
+    "Audit Rights",
+)
+
+
+def clear_preferred_standards_cache() -> None:
+    """Drop cached preferred standards (e.g. after the SharePoint list is edited)."""
+    _standards_cache.clear()
+
 
 def _get_bearer_token() -> str:
     """
@@ -63,7 +99,7 @@ def _fetch_preferred_standards_list(token: str, list_id: str) -> dict:
         'Accept': 'application/json'
     }
     
-    response = requests.get(
+    response = http_session.get(
         url,
         headers=headers,
         params=params,
@@ -89,6 +125,7 @@ def get_preferred_standards() -> list[dict]:
     Load preferred (gold standard) clauses from SharePoint list.
     
     Returns a list of dictionaries with standard names and their clause text.
+    Results from SharePoint are cached for PREFERRED_STANDARDS_TTL_SECONDS.
     On failure, returns empty list and logs a warning (non-fatal).
     
     Returns:
@@ -110,19 +147,24 @@ def get_preferred_standards() -> list[dict]:
             logger.warning("No bearer token available, skipping preferred standards lookup")
             return []
         
+        cached = _standards_cache.get(list_id)
+        if cached is not None:
+            logger.debug("Using cached preferred standards (%d items)", len(cached))
+            return list(cached)
+        
         # Fetch from SharePoint
         logger.info(f"Fetching preferred standards from SharePoint list 'Preferred Contract Terms': {list_id}")
-        print(f"DEBUG sp_preferred_standards: Fetching from list_id={list_id}")
+        logger.debug("Fetching from list_id=%s", list_id)
         response_data = _fetch_preferred_standards_list(token, list_id)
         
         # Parse response
         standards_list = []
         items = response_data.get('value', [])
-        print(f"DEBUG sp_preferred_standards: Received {len(items)} items from SharePoint")
+        logger.debug("Received %s items from SharePoint", len(items))
         
         for item in items:
             fields = item.get('fields', {})
-            print(f"DEBUG sp_preferred_standards: Item fields keys: {list(fields.keys())}")
+            logger.debug("Item fields keys: %s", list(fields.keys()))
             
             # Extract standard name and clause text
             # SharePoint columns: "Standard" and "Clause"
@@ -131,7 +173,7 @@ def get_preferred_standards() -> list[dict]:
             # Extract Security column (Yes/No field)
             is_security = fields.get('Security', False)
             
-            print(f"DEBUG sp_preferred_standards: standard_name={standard_name}, clause_length={len(clause_text) if clause_text else 0}, is_security={is_security}")
+            logger.debug("standard_name=%s, clause_length=%s, is_security=%s", standard_name, len(clause_text) if clause_text else 0, is_security)
             
             if standard_name and clause_text:
                 standards_list.append({
@@ -141,33 +183,25 @@ def get_preferred_standards() -> list[dict]:
                 })
                 logger.debug(f"Loaded preferred standard: {standard_name} (security={is_security})")
             else:
-                print(f"DEBUG sp_preferred_standards: SKIPPED - Missing data. Standard={bool(standard_name)}, Clause={bool(clause_text)}")
+                logger.debug("SKIPPED - Missing data. Standard=%s, Clause=%s", bool(standard_name), bool(clause_text))
         
         logger.info(f"Loaded {len(standards_list)} preferred standards from SharePoint")
-        print(f"DEBUG sp_preferred_standards: Returning {len(standards_list)} standards")
-        return standards_list
+        logger.debug("Returning %s standards", len(standards_list))
+        _standards_cache.set(list_id, standards_list, ttl=PREFERRED_STANDARDS_TTL_SECONDS)
+        return list(standards_list)
         
     except PermissionError as e:
         # Token expired - DO NOT use fallback, force user to re-authenticate
         logger.error(f"Token expired fetching preferred standards: {e}")
-        print(f"DEBUG sp_preferred_standards: PermissionError (token expired) - Re-raising to force login")
         raise  # Re-raise to propagate to calling code
     except ValueError as e:
         logger.warning(f"Configuration error for preferred standards: {e}")
-        print(f"DEBUG sp_preferred_standards: ValueError - {e}")
-        print(f"DEBUG sp_preferred_standards: Returning fallback standards")
         return _get_fallback_standards()
-    except requests.RequestException as e:
-        logger.warning(f"Failed to fetch preferred standards from SharePoint: {type(e).__name__}")
-        print(f"DEBUG sp_preferred_standards: RequestException - {type(e).__name__}: {e}")
-        print(f"DEBUG sp_preferred_standards: Returning fallback standards")
+    except requests.RequestException:
+        logger.exception("Failed to fetch preferred standards from SharePoint")
         return _get_fallback_standards()
-    except Exception as e:
-        logger.warning(f"Unexpected error loading preferred standards: {type(e).__name__}")
-        print(f"DEBUG sp_preferred_standards: Exception - {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
-        print(f"DEBUG sp_preferred_standards: Returning fallback standards")
+    except Exception:
+        logger.exception("Unexpected error loading preferred standards")
         return _get_fallback_standards()
 
 
@@ -176,29 +210,7 @@ def _get_fallback_standards() -> list[dict]:
     Temporary fallback standards when SharePoint list is unavailable.
     Returns hardcoded standards with generic clause text.
     """
-    print("WARNING: Using fallback standards. Please configure correct PREFERRED_STANDARDS_LIST_ID in .env")
-    
-    fallback = [
-        "Indemnification",
-        "Limitation of Liability", 
-        "Term and Termination",
-        "Confidentiality",
-        "Intellectual Property",
-        "Warranties",
-        "Payment Terms",
-        "Dispute Resolution",
-        "Governing Law",
-        "Force Majeure",
-        "Assignment",
-        "Notices",
-        "Entire Agreement",
-        "Severability",
-        "Waiver",
-        "Insurance Requirements",
-        "Compliance with Laws",
-        "Data Protection",
-        "Audit Rights"
-    ]
+    logger.warning("Using fallback standards. Please configure correct PREFERRED_STANDARDS_LIST_ID in .env")
     
     return [
         {
@@ -206,7 +218,7 @@ def _get_fallback_standards() -> list[dict]:
             'clause': f"[PLACEHOLDER: Please configure SharePoint 'Preferred Contract Terms' list to load actual clause text for {name}]",
             'is_security': False
         }
-        for name in fallback
+        for name in FALLBACK_STANDARDS
     ]
 
 
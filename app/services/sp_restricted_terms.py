@@ -5,6 +5,7 @@ Loads restricted verbiage rules from a SharePoint list.
 import os
 import logging
 import requests
+from app.services.graph_session import http_session
 from flask import session
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
@@ -63,7 +64,7 @@ def _fetch_restricted_terms_list(token: str, list_id: str) -> dict:
         'Accept': 'application/json'
     }
     
-    response = requests.get(
+    response = http_session.get(
         url,
         headers=headers,
         params=params,
@@ -2,12 +2,17 @@
 SharePoint file upload service using delegated user authentication.
 """
 
-from typing import Dict
+from typing import BinaryIO, Dict, Union
+import logging
 import requests
+from requests.utils import super_len
+from app.services.graph_session import http_session
 from flask import session
 import os
 
-print("\n=== DEBUG: sp_upload.py module loaded ===")
+logger = logging.getLogger(__name__)
+
+DOCX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
 
 
 class UploadError(Exception):
@@ -25,15 +30,15 @@ def _get_bearer_token() -> str:
     Raises:
         PermissionError: If token not found in session
     """
-    print(f"\n=== DEBUG _get_bearer_token ===")
-    print(f"Session keys: {list(session.keys())}")
+    logger.debug("=== DEBUG _get_bearer_token ===")
+    logger.debug("Session keys: %s", list(session.keys()))
     
     access_token = session.get('access_token')
     if not access_token:
-        print(f"✗ ERROR: No access_token in session")
+        logger.warning("✗ No access_token in session")
         raise PermissionError("SESSION_EXPIRED")
     
-    print(f"✓ Token found (length: {len(access_token)})")
+    logger.debug("✓ Token found (length: %s)", len(access_token))
     return access_token
 
 
@@ -51,9 +56,9 @@ def _update_file_creator(file_id: str, drive_id: str, user_email: str, site_id:
         bool: True if successful, False otherwise
     """
     try:
-        print(f"\n=== DEBUG _update_file_creator (sp_upload) ===")
-        print(f"File ID: {file_id}")
-        print(f"User Email: {user_email}")
+        logger.debug("=== DEBUG _update_file_creator (sp_upload) ===")
+        logger.debug("File ID: %s", file_id)
+        logger.debug("User Email: %s", user_email)
         
         token = _get_bearer_token()
         headers = {
@@ -63,43 +68,43 @@ def _update_file_creator(file_id: str, drive_id: str, user_email: str, site_id:
         
         # Get user ID from email
         user_lookup_url = f"https://graph.microsoft.com/v1.0/users/{user_email}"
-        user_response = requests.get(user_lookup_url, headers=headers)
+        user_response = http_session.get(user_lookup_url, headers=headers)
         
         if user_response.status_code != 200:
-            print(f"✗ Failed to lookup user: {user_response.status_code}")
+            logger.error("✗ Failed to lookup user: %s", user_response.status_code)
             return False
         
         user_data = user_response.json()
         user_id = user_data.get('id')
-        print(f"✓ Found user ID: {user_id}")
+        logger.debug("✓ Found user ID: %s", user_id)
         
         # Get list item for the file
         list_item_url = f"https://graph.microsoft.com/v1.0/drives/{drive_id}/items/{file_id}/listItem"
-        list_item_response = requests.get(list_item_url, headers=headers)
+        list_item_response = http_session.get(list_item_url, headers=headers)
         
         if list_item_response.status_code != 200:
-            print(f"✗ Failed to get list item: {list_item_response.status_code}")
+            logger.error("✗ Failed to get list item: %s", list_item_response.status_code)
             return False
         
         list_item_data = list_item_response.json()
         list_item_id = list_item_data.get('id')
-        print(f"✓ Found list item ID: {list_item_id}")
+        logger.debug("✓ Found list item ID: %s", list_item_id)
         
         # Update the Editor field
         update_url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists/{drive_id}/items/{list_item_id}/fields"
         update_data = {'EditorLookupId': user_id}
         
-        update_response = requests.patch(update_url, headers=headers, json=update_data)
+        update_response = http_session.patch(update_url, headers=headers, json=update_data)
         
         if update_response.status_code == 200:
-            print(f"✓ Successfully updated file creator")
+            logger.debug("✓ Successfully updated file creator")
             return True
         else:
-            print(f"✗ Failed to update: {update_response.status_code} - {update_response.text}")
+            logger.error("✗ Failed to update: %s - %s", update_response.status_code, update_response.text)
             return False
             
     except Exception as e:
-        print(f"✗ Exception updating file creator: {e}")
+        logger.error("✗ Exception updating file creator: %s", e)
         return False
 
 
@@ -107,7 +112,7 @@ def upload_file(
     drive_id: str,
     folder_path: str,
     filename: str,
-    content: bytes,
+    content: Union[bytes, BinaryIO],
     user_email: str = None,
     site_id: str = None
 ) -> Dict:
@@ -118,7 +123,7 @@ def upload_file(
         drive_id: SharePoint drive ID
         folder_path: Folder path within drive (e.g., "Contracts" or "" for root)
         filename: Name for the uploaded file
-        content: File content as bytes
+        content: File content as bytes, or a binary file object streamed as the request body
         user_email: Email of user to attribute file to (optional)
         site_id: SharePoint site ID (required if user_email provided)
     
@@ -129,13 +134,11 @@ def upload_file(
         PermissionError: If SESSION_EXPIRED
         UploadError: If upload fails (network, permissions, etc.)
     """
-    print(f"\n{'='*60}")
-    print(f"=== DEBUG upload_file ===")
-    print(f"{'='*60}")
-    print(f"Drive ID: {drive_id}")
-    print(f"Folder path: '{folder_path}'")
-    print(f"Filename: {filename}")
-    print(f"Content size: {len(content):,} bytes")
+    logger.debug("=== DEBUG upload_file ===")
+    logger.debug("Drive ID: %s", drive_id)
+    logger.debug("Folder path: '%s'", folder_path)
+    logger.debug("Filename: %s", filename)
+    logger.debug("Content size: %s bytes", format(super_len(content), ','))
     
     token = _get_bearer_token()
     
@@ -144,60 +147,59 @@ def upload_file(
     # URL encode only the filename to handle spaces and special characters
     from urllib.parse import quote
     
-    print(f"\n=== DEBUGGING URL CONSTRUCTION ===")
-    print(f"Raw filename: '{filename}'")
-    print(f"Filename length: {len(filename)}")
-    print(f"Folder path: '{folder_path}'")
-    print(f"Drive ID: '{drive_id}'")
+    logger.debug("=== DEBUGGING URL CONSTRUCTION ===")
+    logger.debug("Raw filename: '%s'", filename)
+    logger.debug("Filename length: %s", len(filename))
+    logger.debug("Folder path: '%s'", folder_path)
+    logger.debug("Drive ID: '%s'", drive_id)
     
     # URL encode the filename (not the path separators)
     encoded_filename = quote(filename)
-    print(f"Encoded filename: '{encoded_filename}'")
+    logger.debug("Encoded filename: '%s'", encoded_filename)
     
     if folder_path and folder_path.strip():
         # Remove leading/trailing slashes from folder_path
         folder_path = folder_path.strip('/')
         path = f"{folder_path}/{encoded_filename}"
-        print(f"Path (with folder): '{path}'")
+        logger.debug("Path (with folder): '%s'", path)
     else:
         path = encoded_filename
-        print(f"Path (root): '{path}'")
+        logger.debug("Path (root): '%s'", path)
     
     url = f"https://graph.microsoft.com/v1.0/drives/{drive_id}/root:/{path}:/content"
-    print(f"Final URL: {url}")
-    print(f"URL length: {len(url)}")
-    print(f"=== END URL CONSTRUCTION ===\n")
+    logger.debug("Final URL: %s", url)
+    logger.debug("URL length: %s", len(url))
+    logger.debug("=== END URL CONSTRUCTION ===")
     
     headers = {
         'Authorization': f'Bearer {token}',
-        'Content-Type': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+        'Content-Type': DOCX_MIMETYPE
     }
     
-    print(f"\nSending PUT request to SharePoint...")
+    logger.debug("Sending PUT request to SharePoint...")
     try:
-        response = requests.put(url, headers=headers, data=content, timeout=60)
-        print(f"Response status: {response.status_code}")
+        response = http_session.put(url, headers=headers, data=content, timeout=60)
+        logger.debug("Response status: %s", response.status_code)
         
         if response.status_code in (200, 201):
             result = response.json()
-            print(f"✓ Upload successful!")
-            print(f"  File ID: {result.get('id', 'N/A')}")
-            print(f"  File name: {result.get('name', filename)}")
+            logger.debug("✓ Upload successful!")
+            logger.debug("  File ID: %s", result.get('id', 'N/A'))
+            logger.debug("  File name: %s", result.get('name', filename))
             if 'webUrl' in result:
-                print(f"  Web URL: {result['webUrl'][:60]}...")
+                logger.debug("  Web URL: %s...", result['webUrl'][:60])
             
             # Update file creator if user_email and site_id provided
             if user_email and site_id:
                 file_id = result.get('id')
-                print(f"\nUpdating file creator to: {user_email}")
+                logger.debug("Updating file creator to: %s", user_email)
                 _update_file_creator(file_id, drive_id, user_email, site_id)
             elif user_email and not site_id:
-                print(f"⚠ Warning: user_email provided but site_id missing, cannot update creator")
+                logger.warning("⚠ user_email provided but site_id missing, cannot update creator")
             
-            print(f"{'='*60}\n")
             return result
         elif response.status_code == 401:
-            print(f"✗ ERROR: 401 Unauthorized - Token expired")
+            logger.error("✗ 401 Unauthorized - Token expired")
             raise PermissionError("SESSION_EXPIRED")
         else:
             error_msg = f"Upload failed: HTTP {response.status_code}"
@@ -206,15 +208,15 @@ def upload_file(
                 if 'error' in error_data:
                     error_detail = error_data['error'].get('message', 'Unknown error')
                     error_msg += f" - {error_detail}"
-                    print(f"✗ ERROR: {error_msg}")
+                    logger.error("✗ %s", error_msg)
             except:
                 error_msg += f" - {response.text[:200]}"
-                print(f"✗ ERROR: {error_msg}")
+                logger.error("✗ %s", error_msg)
             
             raise UploadError(error_msg)
     
     except requests.exceptions.RequestException as e:
-        print(f"✗ ERROR: Network error - {str(e)}")
+        logger.error("✗ Network error - %s", str(e))
         raise UploadError(f"Network error during upload: {str(e)}")
 
 
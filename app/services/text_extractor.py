@@ -5,7 +5,7 @@ Supports DOCX and PDF formats.
 import re
 import logging
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import BinaryIO, Optional, Dict, List, Union
 import docx
 from docx.oxml.ns import qn
 from pdfminer.high_level import extract_text as pdf_extract_text
@@ -252,12 +252,17 @@ def _get_paragraph_number(para, doc, numbering_dict: Dict, counter_state: Dict)
         return None
 
 
-def _extract_docx_text(path: Path) -> str:
+def _source_name(source: Union[Path, BinaryIO]) -> str:
+    """Display name of a document path or in-memory file for debug output."""
+    return source.name if isinstance(source, Path) else '<in-memory document>'
+
+
+def _extract_docx_text(path: Union[Path, BinaryIO]) -> str:
     """
     Extract text from a DOCX file, preserving paragraph numbering.
     
     Args:
-        path: Path to the DOCX file.
+        path: Path to the DOCX file, or a seekable binary file object.
     
     Returns:
         Extracted text content with numbering preserved.
@@ -269,30 +274,28 @@ def _extract_docx_text(path: Path) -> str:
         doc = docx.Document(path)
         
         # === ENHANCED DEBUGGING ===
-        print(f"\n{'='*70}")
-        print(f"TEXT EXTRACTION DEBUG: {path.name}")
-        print(f"{'='*70}")
+        logger.debug("TEXT EXTRACTION DEBUG: %s", _source_name(path))
         
         # Extract numbering definitions
-        print(f"[1/5] Extracting numbering definitions...")
+        logger.debug("[1/5] Extracting numbering definitions...")
         numbering_dict = _get_numbering_definitions(doc)
-        print(f"      Found {len(numbering_dict)} numbering definitions")
+        logger.debug("      Found %s numbering definitions", len(numbering_dict))
         
         if numbering_dict:
-            print(f"      Numbering formats:")
+            logger.debug("      Numbering formats:")
             for (num_id, level), fmt in list(numbering_dict.items())[:5]:
-                print(f"        - numId={num_id}, level={level}: {fmt.get('lvlText', 'N/A')} ({fmt.get('numFmt', 'N/A')})")
+                logger.debug("        - numId=%s, level=%s: %s (%s)", num_id, level, fmt.get('lvlText', 'N/A'), fmt.get('numFmt', 'N/A'))
         else:
-            print(f"      ⚠ No numbering definitions found in document")
-            print(f"        This means the document either:")
-            print(f"        • Uses manually typed numbers (not automatic numbering)")
-            print(f"        • Has no numbered sections")
+            logger.warning("      ⚠ No numbering definitions found in document")
+            logger.debug("        This means the document either:")
+            logger.debug("        • Uses manually typed numbers (not automatic numbering)")
+            logger.debug("        • Has no numbered sections")
         
         # Track counter state for numbering (increments as we process paragraphs)
         counter_state = {}
         
         # Extract text from all paragraphs with numbering
-        print(f"\n[2/5] Processing paragraphs...")
+        logger.debug("[2/5] Processing paragraphs...")
         paragraphs = []
         numbered_para_count = 0
         total_para_count = 0
@@ -346,7 +349,7 @@ def _extract_docx_text(path: Path) -> str:
                 # Log first 10 numbered paragraphs for debugging
                 if numbered_para_count <= 10:
                     preview = para.text[:60] + "..." if len(para.text) > 60 else para.text
-                    print(f"      ✓ Para {total_para_count}: {num_text} {preview}")
+                    logger.debug("      ✓ Para %s: %s %s", total_para_count, num_text, preview)
                 
                 logger.debug(f"Numbered paragraph: {num_text} {para.text[:50]}...")
             else:
@@ -355,7 +358,7 @@ def _extract_docx_text(path: Path) -> str:
             paragraphs.append(full_text)
         
         # Extract text from tables
-        print(f"\n[3/5] Processing tables...")
+        logger.debug("[3/5] Processing tables...")
         table_cell_count = 0
         for table in doc.tables:
             for row in table.rows:
@@ -363,54 +366,57 @@ def _extract_docx_text(path: Path) -> str:
                     if cell.text.strip():
                         paragraphs.append(cell.text)
                         table_cell_count += 1
-        print(f"      Found {table_cell_count} table cells with content")
+        logger.debug("      Found %s table cells with content", table_cell_count)
         
         text = '\n\n'.join(paragraphs)
         
         if not text.strip():
             raise RuntimeError("Document appears to be empty")
         
-        # === ENHANCED DEBUGGING OUTPUT ===
-        print(f"\n[4/5] Extraction Summary:")
-        print(f"      Total paragraphs: {total_para_count}")
-        print(f"      Numbered paragraphs: {numbered_para_count}")
-        print(f"      Table cells: {table_cell_count}")
-        print(f"      Total characters: {len(text)}")
-        print(f"      Numbering success rate: {numbered_para_count}/{total_para_count} ({100*numbered_para_count/total_para_count:.1f}%)" if total_para_count > 0 else "      No paragraphs processed")
-        
-        print(f"\n[5/5] Checking for common numbering patterns in extracted text:")
-        patterns = {
-            "1.": text.count("1."),
-            "2.": text.count("2."),
-            "3.": text.count("3."),
-            "I.": text.count("I."),
-            "II.": text.count("II."),
-            "Section": text.count("Section"),
-            "Article": text.count("Article"),
-        }
-        
-        for pattern, count in patterns.items():
-            status = "✓" if count > 0 else "✗"
-            print(f"      {status} '{pattern}' appears {count} times")
-        
-        # Save first 3000 chars to a debug file for inspection
-        debug_file = Path("DEBUG_EXTRACTED_TEXT.txt")
-        debug_content = f"FILE: {path.name}\n{'='*70}\n\n"
-        debug_content += f"EXTRACTION STATS:\n"
-        debug_content += f"  Total paragraphs: {total_para_count}\n"
-        debug_content += f"  Numbered paragraphs: {numbered_para_count}\n"
-        debug_content += f"  Total characters: {len(text)}\n\n"
-        debug_content += f"FIRST 3000 CHARACTERS:\n{'='*70}\n"
-        debug_content += text[:3000]
-        debug_content += f"\n\n{'='*70}\n"
-        debug_content += f"FULL TEXT ({len(text)} chars):\n{'='*70}\n\n"
-        debug_content += text
-        
-        debug_file.write_text(debug_content, encoding='utf-8')
-        print(f"\n      💾 Saved full extraction to: {debug_file.absolute()}")
-        print(f"         Open this file to see exactly what the AI receives")
-        
-        print(f"{'='*70}\n")
+        # === ENHANCED DEBUGGING OUTPUT (only when DEBUG logging is on; writes the full text to disk) ===
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[4/5] Extraction Summary:")
+            logger.debug("      Total paragraphs: %s", total_para_count)
+            logger.debug("      Numbered paragraphs: %s", numbered_para_count)
+            logger.debug("      Table cells: %s", table_cell_count)
+            logger.debug("      Total characters: %s", len(text))
+            if total_para_count > 0:
+                logger.debug("      Numbering success rate: %s/%s (%.1f%%)", numbered_para_count, total_para_count,
+                             100 * numbered_para_count / total_para_count)
+            else:
+                logger.debug("      No paragraphs processed")
+            
+            logger.debug("[5/5] Checking for common numbering patterns in extracted text:")
+            patterns = {
+                "1.": text.count("1."),
+                "2.": text.count("2."),
+                "3.": text.count("3."),
+                "I.": text.count("I."),
+                "II.": text.count("II."),
+                "Section": text.count("Section"),
+                "Article": text.count("Article"),
+            }
+            
+            for pattern, count in patterns.items():
+                status = "✓" if count > 0 else "✗"
+                logger.debug("      %s '%s' appears %s times", status, pattern, count)
+            
+            # Save first 3000 chars to a debug file for inspection
+            debug_file = Path("DEBUG_EXTRACTED_TEXT.txt")
+            debug_content = f"FILE: {_source_name(path)}\n{'='*70}\n\n"
+            debug_content += f"EXTRACTION STATS:\n"
+            debug_content += f"  Total paragraphs: {total_para_count}\n"
+            debug_content += f"  Numbered paragraphs: {numbered_para_count}\n"
+            debug_content += f"  Total characters: {len(text)}\n\n"
+            debug_content += f"FIRST 3000 CHARACTERS:\n{'='*70}\n"
+            debug_content += text[:3000]
+            debug_content += f"\n\n{'='*70}\n"
+            debug_content += f"FULL TEXT ({len(text)} chars):\n{'='*70}\n\n"
+            debug_content += text
+            
+            debug_file.write_text(debug_content, encoding='utf-8')
+            logger.debug("      💾 Saved full extraction to: %s", debug_file.absolute())
+            logger.debug("         Open this file to see exactly what the AI receives")
         
         logger.info(f"Extracted {len(text)} characters from DOCX file ({numbered_para_count} numbered paragraphs)")
         return text
@@ -424,12 +430,12 @@ def _extract_docx_text(path: Path) -> str:
         raise RuntimeError("Failed to extract text from document. The file may be corrupted or in an unsupported format.")
 
 
-def _extract_pdf_text(path: Path) -> str:
+def _extract_pdf_text(path: Union[Path, BinaryIO]) -> str:
     """
     Extract text from a PDF file.
     
     Args:
-        path: Path to the PDF file.
+        path: Path to the PDF file, or a seekable binary file object.
     
     Returns:
         Extracted text content.
@@ -438,7 +444,7 @@ def _extract_pdf_text(path: Path) -> str:
         RuntimeError: On extraction failure.
     """
     try:
-        text = pdf_extract_text(str(path))
+        text = pdf_extract_text(str(path) if isinstance(path, Path) else path)
         
         if not text or not text.strip():
             raise RuntimeError("PDF appears to be empty or contains only images")
@@ -454,12 +460,15 @@ def _extract_pdf_text(path: Path) -> str:
         raise RuntimeError("Failed to extract text from PDF. The file may be encrypted, corrupted, or in an unsupported format.")
 
 
-def extract_text(path: Path) -> str:
+def extract_text(path: Union[Path, BinaryIO], suffix: Optional[str] = None) -> str:
     """
     Extract text from a contract document (DOCX or PDF).
     
     Args:
-        path: Path to the document file.
+        path: Path to the document file, or a seekable binary file object
+            (e.g. from sp_download.download_contract_content).
+        suffix: File extension such as '.docx'; required for file objects,
+            taken from the path otherwise.
     
     Returns:
         Normalized text content with whitespace cleaned and control characters removed.
@@ -467,11 +476,13 @@ def extract_text(path: Path) -> str:
     Raises:
         RuntimeError: If extraction fails or file format is unsupported.
     """
-    if not path.exists():
-        raise RuntimeError("Contract file not found")
+    if isinstance(path, Path):
+        if not path.exists():
+            raise RuntimeError("Contract file not found")
+        suffix = path.suffix
     
     # Determine file type by extension
-    suffix = path.suffix.lower()
+    suffix = (suffix or '').lower()
     
     try:
         if suffix == '.docx':
@@ -8,6 +8,7 @@ IMPORTANT: Word COM can hang if dialogs appear. We use timeouts to prevent indef
 """
 import os
 import logging
+import importlib.util
 from pathlib import Path
 from typing import Dict, List
 import tempfile
@@ -15,6 +16,9 @@ import threading
 
 logger = logging.getLogger(__name__)
 
+# pywin32 is only present on Windows hosts; without it check_spelling_with_word can never run
+PYWIN32_INSTALLED = importlib.util.find_spec('win32com') is not None
+
 
 def _is_false_positive_spelling_error(error_text: str, suggestion: str, context: str) -> bool:
     """
@@ -7,16 +7,65 @@ See git history to revert if needed.
 """
 from functools import wraps
 from flask import session, redirect, url_for, request, flash, current_app
-import requests
 import msal
 import os
+import time
+from urllib.parse import quote
 import logging
 
+from app.cache import create_shared_cache
+from app.services.graph_session import http_session
+
 logger = logging.getLogger(__name__)
 
+# Refresh the app token this many seconds before it actually expires
+TOKEN_REFRESH_SKEW_SECONDS = 60
+
+# Process-wide caches: the MSAL client, the app-only Graph token, and site IDs
+# (a site ID never changes, so it is cached without expiry)
+_msal_app = None
+_token_cache = {'token': None, 'exp': 0}
+_site_id_cache = {}
+
+GRAPH_URL = "https://graph.microsoft.com/v1.0"
+
+# Graph JSON batching accepts at most 20 requests per $batch call
+GRAPH_BATCH_LIMIT = 20
+
+# Graph calls go through the app-wide pooled session (keep-alive to graph.microsoft.com)
+GRAPH_TIMEOUT_SECONDS = 5
+_http = http_session
+
+# Admin status cache (email -> bool), shared by all sessions in this worker, or by all
+# workers when Redis is configured. Entries are leases: they expire on their own and
+# clear_admin_cache() drops them early after the admin list is edited
+ADMIN_CACHE_TTL_SECONDS = 600
+_admin_cache = create_shared_cache('is_admin:')
+
+
+def clear_admin_cache():
+    """Drop all cached admin statuses so the next checks re-read the SharePoint admin list"""
+    _admin_cache.clear()
+
+
+def _get_msal_app(client_id, client_secret, tenant_id):
+    """Return the shared MSAL confidential client, building it on first use"""
+    global _msal_app
+    if _msal_app is None:
+        authority = f"https://login.microsoftonline.com/{tenant_id}"
+        _msal_app = msal.ConfidentialClientApplication(
+            client_id,
+            authority=authority,
+            client_credential=client_secret
+        )
+    return _msal_app
+
 
 def _get_access_token():
-    """Get access token using client credentials flow for Microsoft Graph API"""
+    """Get access token using client credentials flow for Microsoft Graph API (cached until near expiry)"""
+    if _token_cache['token'] and time.time() < _token_cache['exp'] - TOKEN_REFRESH_SKEW_SECONDS:
+        return _token_cache['token']
+    
     try:
         client_id = os.getenv('O365_CLIENT_ID')
         client_secret = os.getenv('O365_CLIENT_SECRET')
@@ -26,18 +75,15 @@ def _get_access_token():
             logger.error("SharePoint credentials not configured")
             return None
         
-        authority = f"https://login.microsoftonline.com/{tenant_id}"
-        app = msal.ConfidentialClientApplication(
-            client_id,
-            authority=authority,
-            client_credential=client_secret
-        )
+        app = _get_msal_app(client_id, client_secret, tenant_id)
         
         # Get token for Microsoft Graph
         scopes = ["https://graph.microsoft.com/.default"]
         result = app.acquire_token_for_client(scopes=scopes)
         
         if "access_token" in result:
+            _token_cache['token'] = result["access_token"]
+            _token_cache['exp'] = time.time() + result.get("expires_in", 3599)
             return result["access_token"]
         else:
             logger.error(f"Failed to get access token: {result}")
@@ -49,19 +95,22 @@ def _get_access_token():
 
 
 def _get_site_id(access_token):
-    """Get the SharePoint site ID using Graph API"""
+    """Get the SharePoint site ID using Graph API (cached per site)"""
+    site_url = f"{GRAPH_URL}/sites/peakcampus.sharepoint.com:/sites/BaseCampApps"
+    
+    if site_url in _site_id_cache:
+        return _site_id_cache[site_url]
+    
     try:
-        graph_url = "https://graph.microsoft.com/v1.0"
-        site_url = f"{graph_url}/sites/peakcampus.sharepoint.com:/sites/BaseCampApps"
-        
         headers = {
             'Authorization': f'Bearer {access_token}'
         }
         
-        response = requests.get(site_url, headers=headers)
+        response = _http.get(site_url, headers=headers, timeout=GRAPH_TIMEOUT_SECONDS)
         
         if response.status_code == 200:
             site_data = response.json()
+            _site_id_cache[site_url] = site_data['id']
             return site_data['id']
         else:
             logger.error(f"Failed to get site ID: {response.status_code} - {response.text}")
@@ -72,6 +121,21 @@ def _get_site_id(access_token):
         return None
 
 
+def _admin_filter(email_column, user_email):
+    """OData $filter matching one email in the admin list (single quotes escaped)"""
+    odata_email = user_email.replace("'", "''")
+    return f"fields/{email_column} eq '{odata_email}'"
+
+
+def _is_active_admin(items, active_column):
+    """True if any matching admin list row is marked active"""
+    # Handle both boolean True and string representations
+    return any(
+        item.get('fields', {}).get(active_column, False) in [True, 'Yes', 'yes', 1, '1']
+        for item in items
+    )
+
+
 def is_admin(user_email):
     """
     Check if a user is an admin by querying SharePoint admin list via Microsoft Graph API
@@ -86,83 +150,116 @@ def is_admin(user_email):
         logger.warning("No email provided for admin check")
         return False
     
-    try:
-        print(f"\n=== DEBUG is_admin (Graph API) ===")
-        print(f"Checking admin status for: {user_email}")
+    # Single lookups share the batch code path (and its cache handling)
+    return is_admin_batch([user_email])[user_email]
+
+
+def is_admin_batch(user_emails):
+    """
+    Check admin status for several users with Graph JSON batching
+    
+    Emails already in the admin cache are answered from it; the rest are
+    looked up with up to 20 filter queries per $batch call instead of one
+    Graph round trip per email.
+    
+    Args:
+        user_emails (list): Email addresses to check
         
-        # Get access token
+    Returns:
+        dict: {email: bool} for every email passed in (errors count as False)
+    """
+    results = {}
+    pending = {}  # lowercase email -> original spellings still to look up
+    
+    for email in user_emails:
+        if not email:
+            results[email] = False
+            continue
+        cached_status = _admin_cache.get(email.lower())
+        if cached_status is not None:
+            logger.debug("Using cached admin status for %s: %s", email, cached_status)
+            results[email] = cached_status
+        else:
+            pending.setdefault(email.lower(), []).append(email)
+    
+    if not pending:
+        return results
+    
+    # Anything not answered below (errors) is reported as not admin
+    for emails in pending.values():
+        for email in emails:
+            results[email] = False
+    
+    try:
         access_token = _get_access_token()
         if not access_token:
             logger.error("Failed to get access token")
-            return False
+            return results
         
-        # Get site ID
         site_id = _get_site_id(access_token)
         if not site_id:
             logger.error("Failed to get site ID")
-            return False
+            return results
         
-        # Get admin list configuration
         admin_list_id = current_app.config.get('SP_ADMIN_LIST_ID')
         email_column = current_app.config.get('SP_ADMIN_EMAIL_COLUMN', 'Email')
         active_column = current_app.config.get('SP_ADMIN_ACTIVE_COLUMN', 'Active')
         
-        print(f"DEBUG: Site ID: {site_id}")
-        print(f"DEBUG: Admin List ID: {admin_list_id}")
-        print(f"DEBUG: Email Column: {email_column}")
-        print(f"DEBUG: Active Column: {active_column}")
+        logger.debug(
+            "Site ID: %s, Admin List ID: %s, Email Column: %s, Active Column: %s",
+            site_id, admin_list_id, email_column, active_column
+        )
         
         if not admin_list_id:
             logger.error("SP_ADMIN_LIST_ID not configured")
-            return False
-        
-        # Query the admin list using Microsoft Graph API
-        graph_url = "https://graph.microsoft.com/v1.0"
-        items_url = f"{graph_url}/sites/{site_id}/lists/{admin_list_id}/items?$expand=fields"
+            return results
         
         headers = {
-            'Authorization': f'Bearer {access_token}'
+            'Authorization': f'Bearer {access_token}',
+            'Content-Type': 'application/json'
         }
+        items_path = f"/sites/{site_id}/lists/{admin_list_id}/items"
+        keys = list(pending)
         
-        print(f"DEBUG: Querying admin list via Graph API")
-        response = requests.get(items_url, headers=headers)
-        
-        print(f"DEBUG: Response status: {response.status_code}")
-        
-        if response.status_code == 200:
-            items_data = response.json()
-            items = items_data.get('value', [])
+        for start in range(0, len(keys), GRAPH_BATCH_LIMIT):
+            chunk = keys[start:start + GRAPH_BATCH_LIMIT]
+            body = {
+                'requests': [
+                    {
+                        'id': str(i),
+                        'method': 'GET',
+                        'url': f"{items_path}?$expand=fields&$filter={quote(_admin_filter(email_column, key))}",
+                        # Email column is not indexed, so we need the Prefer header
+                        'headers': {'Prefer': 'HonorNonIndexedQueriesWarningMayFailRandomly'}
+                    }
+                    for i, key in enumerate(chunk)
+                ]
+            }
             
-            print(f"DEBUG: Query returned {len(items)} items")
+            response = _http.post(f"{GRAPH_URL}/$batch", headers=headers, json=body, timeout=GRAPH_TIMEOUT_SECONDS)
+            if response.status_code != 200:
+                logger.error(f"Failed to batch query admin list: {response.status_code} - {response.text}")
+                continue
             
-            # Check if user exists and is active
-            for item in items:
-                fields = item.get('fields', {})
-                item_email = fields.get(email_column, '').lower()
-                is_active = fields.get(active_column, False)
+            for item in response.json().get('responses', []):
+                key = chunk[int(item['id'])]
+                if item.get('status') != 200:
+                    logger.error(f"Failed to query admin list for {key}: {item.get('status')}")
+                    continue
                 
-                print(f"DEBUG: Checking item - Email: {item_email}, Active: {is_active} (type: {type(is_active)})")
-                
-                # Handle both boolean True and string representations
-                if item_email == user_email.lower() and is_active in [True, 'Yes', 'yes', 1, '1']:
-                    logger.info(f"Admin check passed for {user_email}")
-                    print(f"DEBUG: ✓ User is an active admin!")
-                    return True
-            
-            logger.info(f"Admin check failed for {user_email}")
-            print(f"DEBUG: User is NOT found as active admin in list")
-            return False
-        else:
-            logger.error(f"Failed to query admin list: {response.status_code} - {response.text}")
-            print(f"DEBUG ERROR: Graph API query failed")
-            return False
+                admin_status = _is_active_admin(item.get('body', {}).get('value', []), active_column)
+                # Only definitive answers are cached; errors are retried on the next check
+                _admin_cache.set(key, admin_status, ttl=ADMIN_CACHE_TTL_SECONDS)
+                logger.info("Admin check %s for %s", 'passed' if admin_status else 'failed', key)
+                for email in pending[key]:
+                    results[email] = admin_status
         
+        logger.debug("Batch admin check for %d emails (%d looked up)", len(user_emails), len(keys))
+        return results
+    
     except Exception as e:
-        logger.error(f"Error checking admin status: {str(e)}")
-        print(f"DEBUG ERROR in is_admin: {str(e)}")
-        import traceback
-        print(f"DEBUG Traceback: {traceback.format_exc()}")
-        return False
+        logger.exception(f"Error batch checking admin status: {str(e)}")
+        return results
 
 
 def admin_required(f):
@@ -172,36 +269,28 @@ def admin_required(f):
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        print(f"\n=== DEBUG admin_required ===")
-        print(f"Route: {request.endpoint}")
-        
         # First check if user is logged in
         if not session.get('access_token') or not session.get('user_email'):
-            print(f"DEBUG: User not authenticated")
+            logger.debug("admin_required: user not authenticated for %s", request.endpoint)
             session['next_url'] = request.url
             return redirect(url_for('auth.login'))
         
         user_email = session.get('user_email')
-        print(f"DEBUG: Checking admin status for {user_email}")
         
-        # Check admin status (with caching in session)
-        # Cache admin status for 5 minutes to avoid excessive SharePoint queries
-        if 'is_admin' not in session or session.get('admin_check_email') != user_email:
-            admin_status = is_admin(user_email)
+        # Check admin status against the shared lease cache (SharePoint is only queried on a
+        # miss), so clear_admin_cache() takes effect for sessions that are already signed in;
+        # the session copy is only rewritten when it changes
+        admin_status = is_admin(user_email)
+        if session.get('is_admin') != admin_status or session.get('admin_check_email') != user_email:
             session['is_admin'] = admin_status
             session['admin_check_email'] = user_email
-            print(f"DEBUG: Admin status checked and cached: {admin_status}")
-        else:
-            admin_status = session.get('is_admin', False)
-            print(f"DEBUG: Using cached admin status: {admin_status}")
+            logger.debug("Admin status for %s updated in session: %s", user_email, admin_status)
         
         if not admin_status:
-            logger.warning(f"Unauthorized admin access attempt by {user_email}")
-            print(f"DEBUG: Access denied - user is not an admin")
+            logger.warning("Unauthorized admin access attempt by %s", user_email)
             flash('Access denied. This page requires administrator privileges.', 'error')
             return redirect(url_for('index'))
         
-        print(f"DEBUG: Admin check passed, proceeding to route")
         return f(*args, **kwargs)
     
     return decorated_function
@@ -1,59 +1,62 @@
 """
 Authentication utilities for the Flask application
 """
+import logging
+import time
+from datetime import datetime
 from functools import wraps
-from flask import session, redirect, url_for, request
+from flask import session, redirect, url_for, request, flash
 import requests
 
+logger = logging.getLogger(__name__)
+
+# Absolute session lifetime, measured from login (4 hours)
+MAX_SESSION_SECONDS = 4 * 60 * 60
+
 
 def login_required(f):
     """Decorator to require authentication for routes"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        from datetime import datetime, timedelta, timezone as tz
-        
-        print(f"\n=== DEBUG login_required ===")
-        print(f"Route: {request.endpoint}")
-        print(f"URL: {request.url}")
-        print(f"Has access_token: {bool(session.get('access_token'))}")
-        print(f"Has user_email: {bool(session.get('user_email'))}")
-        print(f"Session keys: {list(session.keys())}")
+        # Read the session once up front
+        access_token = session.get('access_token')
+        user_email = session.get('user_email')
         
         # Check if user has valid access token and email
-        if not session.get('access_token') or not session.get('user_email'):
-            print(f"DEBUG: Not authenticated, redirecting to login")
-            print(f"DEBUG: Storing next_url: {request.url}")
+        if not access_token or not user_email:
+            logger.debug("login_required: not authenticated for %s, redirecting to login", request.endpoint)
             # Store the intended destination
             session['next_url'] = request.url
             return redirect(url_for('auth.login'))
         
-        # Check absolute session timeout (4 hours)
-        login_time_str = session.get('login_time')
-        if login_time_str:
-            try:
-                login_time = datetime.fromisoformat(login_time_str)
-                session_age = (datetime.now(tz.utc) - login_time).total_seconds()
-                max_session_seconds = 4 * 60 * 60  # 4 hours
-                
-                print(f"DEBUG: Session age: {session_age:.0f} seconds ({session_age/60:.1f} minutes)")
-                print(f"DEBUG: Max allowed: {max_session_seconds} seconds ({max_session_seconds/3600} hours)")
-                
-                if session_age > max_session_seconds:
-                    print(f"DEBUG: Absolute session timeout exceeded, clearing session")
+        # Check absolute session timeout (4 hours) against the epoch login timestamp
+        login_time_ts = session.get('login_time_ts')
+        if login_time_ts is None:
+            # Backfill for sessions created before login_time_ts existed (ISO string only);
+            # parse once and store the epoch value so later requests skip the parse
+            login_time_str = session.get('login_time')
+            if login_time_str:
+                try:
+                    login_time_ts = int(datetime.fromisoformat(login_time_str).timestamp())
+                    session['login_time_ts'] = login_time_ts
+                except (ValueError, TypeError) as e:
+                    logger.debug("Error parsing login_time: %s", e)
+                    # If we can't parse login_time, clear session for safety
                     session.clear()
                     session['next_url'] = request.url
-                    from flask import flash
-                    flash('Your session has expired after 4 hours. Please log in again.', 'warning')
                     return redirect(url_for('auth.login'))
-            except (ValueError, TypeError) as e:
-                print(f"DEBUG: Error parsing login_time: {e}")
-                # If we can't parse login_time, clear session for safety
+        
+        if login_time_ts is not None:
+            session_age = time.time() - login_time_ts
+            
+            if session_age > MAX_SESSION_SECONDS:
+                logger.debug("Absolute session timeout exceeded (%.0f seconds), clearing session", session_age)
                 session.clear()
                 session['next_url'] = request.url
+                flash('Your session has expired after 4 hours. Please log in again.', 'warning')
                 return redirect(url_for('auth.login'))
         
-        print(f"DEBUG: Authentication check passed, proceeding to route")
         # Simple validation - just check if token exists
         # More complex validation removed to prevent redirect loops
         return f(*args, **kwargs)
-    return decorated_function
\ No newline at end of file
+    return decorated_function
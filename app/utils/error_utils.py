@@ -0,0 +1,24 @@
+"""
+Error-handling utilities for the Flask application
+"""
+import logging
+from functools import wraps
+from flask import jsonify
+
+logger = logging.getLogger(__name__)
+
+
+def json_errors(f):
+    """
+    Decorator for JSON API routes: turn an unhandled exception into
+    {'success': False, 'error': str(e)} with a 500, logging the traceback once
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except Exception as e:
+            logger.exception("Unhandled error in %s", f.__name__)
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    return decorated_function
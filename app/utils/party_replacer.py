@@ -5,9 +5,64 @@ Replaces generic terms (Contractor, Customer) with actual party names
 detected in the contract.
 """
 
+import logging
 import re
 from typing import Dict, Optional
 
+logger = logging.getLogger(__name__)
+
+# Single pass over the text: group 1 is the role, group 2 the optional possessive
+_PARTY_RE = re.compile(r"\b(Contractor|Customer)('s)?\b", re.IGNORECASE)
+
+# transform_suggestions joins suggestions with this record separator and runs
+# one regex pass once there are more than _BATCH_THRESHOLD items
+_BATCH_SEP = "\x1e"
+_BATCH_THRESHOLD = 4
+
+
+def _possessive(name: str) -> str:
+    """Possessive form of a party name: HIS -> HIS's, Residents -> Residents'."""
+    return f"{name}'" if name.endswith('s') else f"{name}'s"
+
+
+def _build_renderer(party_info: Dict):
+    """
+    Resolve which party is contractor and which is customer.
+    
+    Returns:
+        A re.sub callback for _PARTY_RE, or None if neither role was resolved
+    """
+    # Determine which party is contractor and which is customer
+    contractor_name = None
+    customer_name = None
+    for party in (party_info.get('party1') or {}, party_info.get('party2') or {}):
+        role = party.get('role')
+        if role == 'contractor':
+            contractor_name = party.get('defined_as')
+        elif role == 'customer':
+            customer_name = party.get('defined_as')
+    
+    logger.debug("Party roles resolved: contractor=%s, customer=%s", contractor_name, customer_name)
+    
+    # Fallback: if roles not determined, nothing to replace
+    if not contractor_name and not customer_name:
+        return None
+    
+    # Map each role to its (name, possessive) replacement; unresolved roles are left as-is
+    replacements = {}
+    if contractor_name:
+        replacements['contractor'] = (contractor_name, _possessive(contractor_name))
+    if customer_name:
+        replacements['customer'] = (customer_name, _possessive(customer_name))
+    
+    def _render(match):
+        names = replacements.get(match.group(1).lower())
+        if names is None:
+            return match.group(0)
+        return names[1] if match.group(2) else names[0]
+    
+    return _render
+
 
 def replace_party_terms(text: str, party_info: Dict) -> str:
     """
@@ -30,96 +85,16 @@ def replace_party_terms(text: str, party_info: Dict) -> str:
         Input: "Contractor shall notify Customer within 30 days."
         Output: "HIS shall notify Partner within 30 days."
     """
-    print(f"\n[replace_party_terms] Called with:")
-    print(f"  text length: {len(text) if text else 0}")
-    print(f"  party_info: {party_info}")
-    
     # Fallback: if party detection failed, return original text
     if not party_info or not party_info.get('found'):
-        print(f"[replace_party_terms] Party detection failed or not found, returning original")
         return text
     
-    party1 = party_info.get('party1', {})
-    party2 = party_info.get('party2', {})
-    
-    # Determine which party is contractor and which is customer
-    contractor_name = None
-    customer_name = None
-    
-    print(f"[replace_party_terms] Determining roles...")
-    print(f"  party1: {party1}")
-    print(f"  party2: {party2}")
-    
-    if party1.get('role') == 'contractor':
-        contractor_name = party1.get('defined_as')
-        print(f"  ✓ party1 is contractor: {contractor_name}")
-    elif party1.get('role') == 'customer':
-        customer_name = party1.get('defined_as')
-        print(f"  ✓ party1 is customer: {customer_name}")
-    
-    if party2.get('role') == 'contractor':
-        contractor_name = party2.get('defined_as')
-        print(f"  ✓ party2 is contractor: {contractor_name}")
-    elif party2.get('role') == 'customer':
-        customer_name = party2.get('defined_as')
-        print(f"  ✓ party2 is customer: {customer_name}")
-    
-    print(f"[replace_party_terms] Final determination:")
-    print(f"  contractor_name: {contractor_name}")
-    print(f"  customer_name: {customer_name}")
-    
-    # Fallback: if roles not determined, return original
-    if not contractor_name and not customer_name:
-        print(f"[replace_party_terms] No roles determined, returning original")
+    render = _build_renderer(party_info)
+    if render is None:
         return text
     
-    # Replace Contractor terms (case-insensitive, all occurrences)
-    if contractor_name:
-        # Handle possessive forms: Contractor's → HIS's or HIS'
-        # Use HIS' if name already ends with 's', otherwise add 's
-        contractor_possessive = f"{contractor_name}'" if contractor_name.endswith('s') else f"{contractor_name}'s"
-        
-        # Replace "Contractor's" (case-insensitive)
-        text = re.sub(
-            r'\bContractor\'s\b',
-            contractor_possessive,
-            text,
-            flags=re.IGNORECASE
-        )
-        
-        # Replace "Contractor" (case-insensitive)
-        text = re.sub(
-            r'\bContractor\b',
-            contractor_name,
-            text,
-            flags=re.IGNORECASE
-        )
-    
-    # Replace Customer terms (case-insensitive, all occurrences)
-    if customer_name:
-        # Handle possessive forms: Customer's → Partner's or Partner'
-        customer_possessive = f"{customer_name}'" if customer_name.endswith('s') else f"{customer_name}'s"
-        
-        print(f"[replace_party_terms] Replacing Customer with {customer_name}")
-        
-        # Replace "Customer's" (case-insensitive)
-        text = re.sub(
-            r'\bCustomer\'s\b',
-            customer_possessive,
-            text,
-            flags=re.IGNORECASE
-        )
-        
-        # Replace "Customer" (case-insensitive)
-        text = re.sub(
-            r'\bCustomer\b',
-            customer_name,
-            text,
-            flags=re.IGNORECASE
-        )
-    
-    print(f"[replace_party_terms] Replacement complete, returning text (length: {len(text)})")
-    return text
+    # Replace Contractor/Customer terms (case-insensitive, all occurrences) in one pass
+    return _PARTY_RE.sub(render, text)
 
 
 def transform_suggestions(items: list, party_info: Dict) -> list:
@@ -131,28 +106,41 @@ def transform_suggestions(items: list, party_info: Dict) -> list:
         party_info: Party information dictionary
         
     Returns:
-        New list with transformed suggestions
+        New list with transformed suggestions. Items whose suggestion needed
+        no replacement are returned as-is (not copied); callers must not
+        mutate them.
     """
-    print(f"\n[transform_suggestions] Called with {len(items)} items")
-    print(f"[transform_suggestions] party_info: {party_info}")
-    
     if not party_info or not party_info.get('found'):
-        print(f"[transform_suggestions] Party info not found, returning items unchanged")
+        logger.debug("Party info not found, returning %d items unchanged", len(items))
         return items
     
-    print(f"[transform_suggestions] Processing items...")
+    suggestions = [item.get('suggestion') or '' for item in items]
+    
+    if len(items) > _BATCH_THRESHOLD and not any(_BATCH_SEP in text for text in suggestions):
+        # Run the regex once over all suggestions joined by a record separator
+        # instead of once per item, then split the result back apart
+        render = _build_renderer(party_info)
+        if render is None:
+            return items
+        new_suggestions = _PARTY_RE.sub(render, _BATCH_SEP.join(suggestions)).split(_BATCH_SEP)
+    else:
+        new_suggestions = [
+            replace_party_terms(text, party_info) if text else text
+            for text in suggestions
+        ]
+    
     transformed = []
-    for i, item in enumerate(items):
+    for item, original_suggestion, new_suggestion in zip(items, suggestions, new_suggestions):
+        if new_suggestion == original_suggestion:
+            # Nothing replaced - reuse the original item instead of copying it
+            transformed.append(item)
+            continue
+        
         new_item = item.copy()
-        if 'suggestion' in new_item and new_item['suggestion']:
-            print(f"\n[transform_suggestions] Item {i+1}/{len(items)}: {new_item.get('standard', 'Unknown')}")
-            original_suggestion = new_item['suggestion']
-            new_item['suggestion'] = replace_party_terms(new_item['suggestion'], party_info)
-            if original_suggestion != new_item['suggestion']:
-                print(f"  ✓ Suggestion was modified")
-            else:
-                print(f"  - Suggestion unchanged (no Contractor/Customer terms found)")
+        new_item['suggestion'] = new_suggestion
         transformed.append(new_item)
     
-    print(f"[transform_suggestions] Returning {len(transformed)} transformed items\n")
+    if logger.isEnabledFor(logging.DEBUG):
+        changed = sum(new is not old for new, old in zip(transformed, items))
+        logger.debug("Transformed party terms in %d of %d suggestions", changed, len(items))
     return transformed
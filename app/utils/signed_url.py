@@ -6,10 +6,48 @@ that don't depend on Flask session cookies.
 """
 
 import hmac
-import hashlib
+import logging
+import re
 import time
 import os
-from flask import url_for
+from flask import url_for, current_app, request, has_request_context
+
+logger = logging.getLogger(__name__)
+
+# Signing key, read once at import (must be set in Azure)
+_SECRET = os.getenv('DOWNLOAD_URL_SECRET', 'dev-download-secret').encode('utf-8')
+
+
+def _message(contract_id: str, exp) -> bytes:
+    """Signed message bytes for "contract_id:exp" (ASCII fast path, UTF-8 for anything else)."""
+    message = f"{contract_id}:{exp}"
+    try:
+        return message.encode('ascii')
+    except UnicodeEncodeError:
+        return message.encode('utf-8')
+
+
+def _sign(contract_id: str, exp) -> str:
+    """HMAC-SHA256 hex signature of "contract_id:exp" (one-shot C implementation)."""
+    return hmac.digest(_SECRET, _message(contract_id, exp), 'sha256').hex()
+
+
+# Contract IDs that appear verbatim in the URL path (no percent-encoding needed)
+_URL_SAFE_ID = re.compile(r'[A-Za-z0-9._~-]+')
+_ID_PLACEHOLDER = 'CONTRACTID'
+
+# (app, script_root) -> (path prefix, path suffix) around the contract ID
+_path_templates = {}
+
+
+def _download_path_template():
+    """Build the download route's path once per app/script root, splitting it around the contract ID."""
+    key = (current_app._get_current_object(), request.script_root if has_request_context() else None)
+    template = _path_templates.get(key)
+    if template is None:
+        prefix, _, suffix = url_for('download_edited_contract', contract_id=_ID_PLACEHOLDER).partition(_ID_PLACEHOLDER)
+        template = _path_templates[key] = (prefix, suffix)
+    return template
 
 
 def make_signed_path(contract_id: str, ttl_sec: int = 300) -> str:
@@ -28,31 +66,24 @@ def make_signed_path(contract_id: str, ttl_sec: int = 300) -> str:
         download_path = make_signed_path('ABC123', ttl_sec=300)
         # Returns: /contracts/ABC123/download_edited?exp=1234567890&sig=...
     """
-    # Get secret from environment (must be set in Azure)
-    secret = os.getenv('DOWNLOAD_URL_SECRET', 'dev-download-secret')
-    
     # Calculate expiration timestamp
     exp = int(time.time() + ttl_sec)
     
-    # Create message to sign: contract_id + expiration
-    message = f"{contract_id}:{exp}"
+    # Generate HMAC-SHA256 signature over contract_id + expiration
+    sig = _sign(contract_id, exp)
     
-    # Generate HMAC-SHA256 signature
-    sig = hmac.new(
-        secret.encode('utf-8'),
-        message.encode('utf-8'),
-        hashlib.sha256
-    ).hexdigest()
+    # Build signed URL path (relative, not absolute). Plain IDs reuse the cached
+    # route template; anything needing percent-encoding goes through url_for
+    if _URL_SAFE_ID.fullmatch(contract_id):
+        prefix, suffix = _download_path_template()
+        return f"{prefix}{contract_id}{suffix}?exp={exp}&sig={sig}"
     
-    # Build signed URL path (relative, not absolute)
-    path = url_for(
+    return url_for(
         'download_edited_contract',
         contract_id=contract_id,
         exp=exp,
         sig=sig
     )
-    
-    return path
 
 
 def verify_signed(contract_id: str, exp: str, sig: str) -> bool:
@@ -73,32 +104,25 @@ def verify_signed(contract_id: str, exp: str, sig: str) -> bool:
         else:
             # Reject request
     """
+    # Reject malformed input up front
     try:
-        # Get secret from environment
-        secret = os.getenv('DOWNLOAD_URL_SECRET', 'dev-download-secret')
-        
-        # Check expiration
         exp_int = int(exp)
-        if time.time() > exp_int:
-            print(f"SIGNED URL EXPIRED: {contract_id} (expired at {exp_int})")
-            return False
-        
-        # Recreate message and signature
-        message = f"{contract_id}:{exp}"
-        expected_sig = hmac.new(
-            secret.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        
-        # Constant-time comparison to prevent timing attacks
-        if hmac.compare_digest(sig, expected_sig):
-            print(f"SIGNED URL VERIFIED: {contract_id} (expires in {exp_int - int(time.time())}s)")
-            return True
-        else:
-            print(f"SIGNED URL INVALID: {contract_id} (signature mismatch)")
-            return False
-            
     except (ValueError, TypeError) as e:
-        print(f"SIGNED URL ERROR: {contract_id} - {e}")
+        logger.warning("Signed URL error: %s - %s", contract_id, e)
+        return False
+    if not isinstance(sig, str) or not sig.isascii():
+        logger.warning("Signed URL invalid: %s (malformed signature)", contract_id)
+        return False
+    
+    # Check expiration before doing any HMAC work
+    if time.time() > exp_int:
+        logger.info("Signed URL expired: %s (expired at %s)", contract_id, exp_int)
         return False
+    
+    # Recreate signature and compare in constant time to prevent timing attacks
+    if hmac.compare_digest(sig, _sign(contract_id, exp)):
+        logger.debug("Signed URL verified: %s (expires at %s)", contract_id, exp_int)
+        return True
+    
+    logger.warning("Signed URL invalid: %s (signature mismatch)", contract_id)
+    return False
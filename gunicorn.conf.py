@@ -0,0 +1,24 @@
+"""
+Gunicorn settings for Azure App Service
+
+Picked up automatically when gunicorn starts from the app root (the Azure
+startup command runs it there). Every route waits on SharePoint or OpenAI,
+so each worker serves requests on a pool of threads instead of one at a time.
+
+Keep a single worker unless REDIS_URL or CACHE_DB_PATH is set: otherwise
+analysis results and background upload jobs live in process memory, and a
+follow-up request routed to another worker would not find them.
+"""
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# Only used by async worker classes (GUNICORN_WORKER_CLASS=gevent, which needs the gevent
+# package installed); the gevent worker monkey-patches sockets before the app is imported
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '100'))
+
+# Analysis runs many LLM calls; keep the long timeout from the original startup command
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '600'))
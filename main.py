@@ -1,31 +1,84 @@
-from flask import Flask, render_template, session, request, jsonify, flash, redirect, url_for
+from flask import Flask, render_template, session, request, jsonify, flash, redirect, url_for, copy_current_request_context, send_file, abort
+import atexit
 import os
+import re
+import logging
+import queue
+import ssl
+import uuid
+import functools
+import hashlib
+import tempfile
+import threading
+import time
+import traceback
 from datetime import datetime, timedelta, timezone as tz
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from flask_session import Session
 
 # Import analysis services
-from app.services.sp_download import download_contract
+from app.services.sp_download import download_contract, download_contract_content, stream_contract_by_filename, get_file_metadata_by_filename
 from app.services.text_extractor import extract_text
-from app.services.sp_preferred_standards import get_preferred_standards, get_preferred_standards_dict, get_preferred_standards_by_category
+from app.services.sp_preferred_standards import get_preferred_standards, get_preferred_standards_dict, get_preferred_standards_by_category, clear_preferred_standards_cache
 from app.services.analysis_orchestrator import analyze_contract as run_analysis
-from app.cache import analysis_cache
-
-print("\n=== DEBUG APP INITIALIZATION ===")
+from app.services.llm_client import detect_contract_parties
+from app.services.word_grammar_checker import PYWIN32_INSTALLED
+from app.services import doc_cache, doc_editor, sp_upload
+from app.services.graph_session import http_session
+from app.cache import analysis_cache, create_shared_cache, get_redis_client
+from app.utils.party_replacer import transform_suggestions
+from app.utils.signed_url import make_signed_path, verify_signed
+from app.auth.token_utils import ensure_fresh_access_token, AuthRequired
+# app.services.sharepoint_service is imported on first use by _sharepoint_service(): importing it
+# builds the app-token SharePointService singleton, which calls Graph, so it must not run at app import
 
 # Load environment variables BEFORE importing activity_logger
 load_dotenv()
-print(f"DEBUG: .env file loaded")
+
+# Route and startup diagnostics are DEBUG records; set LOG_LEVEL=DEBUG to see them.
+# Request threads only enqueue records; a listener thread does the (blocking) stream writes
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Merges args/traceback; the listener adds the prefix
+logging.basicConfig(
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+    handlers=[_log_queue_handler]
+)
+if _log_queue_handler in logging.getLogger().handlers:
+    _log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+logger = logging.getLogger(__name__)
+logger.debug("=== APP INITIALIZATION ===")
+logger.debug(".env file loaded")
 
 # Import activity_logger AFTER .env is loaded so it can read SP_LOG_LIST_ID
 from app.services.activity_logger import logger as activity_logger
-print(f"DEBUG: Activity logger initialized with log_list_id: {activity_logger.log_list_id}")
+logger.debug("Activity logger initialized with log_list_id: %s", activity_logger.log_list_id)
 
 app = Flask(__name__, static_folder='app/static', template_folder='app/templates')
 app.secret_key = os.getenv('SECRET_KEY', 'dev-secret-key')
-print(f"DEBUG: Flask app created")
-print(f"DEBUG: SECRET_KEY set: {bool(app.secret_key)}")
+
+# Serialize jsonify() responses with orjson when it is installed
+try:
+    from app.utils.json_provider import OrjsonProvider
+    app.json = OrjsonProvider(app)
+except ImportError:
+    logger.warning("orjson not installed; using the standard library JSON provider")
+logger.debug("Flask app created")
+logger.debug("SECRET_KEY set: %s", bool(app.secret_key))
+
+# Signed download URLs (app/utils/signed_url.py) use HMAC-SHA256; make sure it is
+# served by OpenSSL (which uses SHA-NI / ARMv8 SHA instructions when the CPU has them)
+# rather than CPython's slower built-in fallback
+logger.debug("OpenSSL version: %s", ssl.OPENSSL_VERSION)
+if hashlib.sha256.__name__ != 'openssl_sha256':
+    logger.warning("hashlib.sha256 is not OpenSSL-backed (%s); signed URL HMACs will be slower", hashlib.sha256.__name__)
 
 # Configure Flask-Session for server-side filesystem storage
 # Azure App Service: Use /home/ for persistence across restarts
@@ -38,10 +91,14 @@ else:
 
 # Ensure session directory exists
 os.makedirs(session_dir_path, exist_ok=True)
-print(f"DEBUG: Session directory: {session_dir_path}")
+logger.debug("Session directory: %s", session_dir_path)
+
+# With REDIS_URL configured, keep sessions in Redis so every worker/instance shares them
+session_redis = get_redis_client()
 
 app.config.update(
-    SESSION_TYPE='filesystem',
+    SESSION_TYPE='redis' if session_redis else 'filesystem',
+    SESSION_REDIS=session_redis,
     SESSION_FILE_DIR=session_dir_path,
     SESSION_PERMANENT=True,
     PERMANENT_SESSION_LIFETIME=timedelta(hours=8),
@@ -52,45 +109,53 @@ app.config.update(
 
 # Initialize Flask-Session BEFORE ProxyFix
 Session(app)
-print(f"DEBUG: Flask-Session configured with filesystem storage at {session_dir_path}")
-print(f"DEBUG: Session interface type: {type(app.session_interface)}")
-print(f"DEBUG: Session interface class: {app.session_interface.__class__.__name__}")
+if session_redis:
+    logger.debug("Flask-Session configured with Redis storage")
+else:
+    logger.debug("Flask-Session configured with filesystem storage at %s", session_dir_path)
+logger.debug("Session interface type: %s", type(app.session_interface))
+logger.debug("Session interface class: %s", app.session_interface.__class__.__name__)
 if hasattr(app.session_interface, 'cache_dir'):
-    print(f"DEBUG: Actual cache_dir: {app.session_interface.cache_dir}")
+    logger.debug("Actual cache_dir: %s", app.session_interface.cache_dir)
 
 # Safe cleanup of stale session files on startup
 # Only delete files older than session lifetime + 1 hour safety buffer
 # This prevents deleting active sessions and race conditions
-session_dir = Path(session_dir_path)
-if session_dir.exists() and session_dir.is_dir():
+# (the directory was just created above, so it exists)
+if not session_redis:
     # Add 1 hour safety buffer to prevent deleting active sessions
     session_lifetime = timedelta(hours=8)
     safety_buffer = timedelta(hours=1)
-    cutoff_time = datetime.now(tz.utc) - session_lifetime - safety_buffer
+    now_ts = time.time()
+    cutoff_ts = now_ts - (session_lifetime + safety_buffer).total_seconds()
     
     cleaned_count = 0
     try:
-        for session_file in session_dir.glob('*'):
-            if session_file.is_file():
+        # scandir answers is_file() from the directory listing, leaving one stat() per session file
+        with os.scandir(session_dir_path) as entries:
+            for entry in entries:
                 try:
-                    file_mtime = datetime.fromtimestamp(session_file.stat().st_mtime, tz=tz.utc)
-                    file_age_hours = (datetime.now(tz.utc) - file_mtime).total_seconds() / 3600
-                    print(f"DEBUG: Session file {session_file.name}: age={file_age_hours:.1f}h, cutoff=9h")
+                    if not entry.is_file():
+                        continue
+                    file_mtime = entry.stat().st_mtime
+                    file_age_hours = (now_ts - file_mtime) / 3600
+                    logger.debug("Session file %s: age=%.1fh, cutoff=9h", entry.name, file_age_hours)
                     
-                    if file_mtime < cutoff_time:
-                        session_file.unlink()
+                    if file_mtime < cutoff_ts:
+                        # Another worker sweeping at the same time may have removed it already
+                        Path(entry.path).unlink(missing_ok=True)
                         cleaned_count += 1
-                        print(f"DEBUG: Deleted {session_file.name} (age: {file_age_hours:.1f} hours)")
-                except (OSError, ValueError) as e:
-                    # Skip files that can't be accessed or have invalid timestamps
-                    print(f"DEBUG: Skipped session file {session_file.name}: {e}")
+                        logger.debug("Deleted %s (age: %.1f hours)", entry.name, file_age_hours)
+                except OSError as e:
+                    # Skip files that can't be accessed
+                    logger.debug("Skipped session file %s: %s", entry.name, e)
         
         if cleaned_count > 0:
-            print(f"DEBUG: Cleaned up {cleaned_count} stale session files (>9 hours old)")
+            logger.debug("Cleaned up %s stale session files (>9 hours old)", cleaned_count)
         else:
-            print(f"DEBUG: No stale session files to clean up")
+            logger.debug("No stale session files to clean up")
     except Exception as e:
-        print(f"DEBUG: Session cleanup failed (non-critical): {e}")
+        logger.debug("Session cleanup failed (non-critical): %s", e)
 
 # Configure Flask for Azure App Service behind reverse proxy
 # ProxyFix ensures url_for() generates correct HTTPS URLs and handles proxy headers
@@ -111,6 +176,10 @@ app.config.update(
     SESSION_COOKIE_SAMESITE='Lax'      # Same-origin iframe works; blocks CSRF
 )
 
+# Upload size cap: oversized contract uploads are rejected with 413 from Content-Length,
+# before Werkzeug spools (and parses) any of the multipart body
+app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_UPLOAD_MB', '50')) * 1024 * 1024
+
 # MSAL Configuration
 app.config['CLIENT_ID'] = os.getenv('O365_CLIENT_ID')
 app.config['CLIENT_SECRET'] = os.getenv('O365_CLIENT_SECRET')
@@ -119,10 +188,11 @@ app.config['AUTHORITY'] = f"https://login.microsoftonline.com/{app.config['TENAN
 app.config['SCOPE'] = ["User.Read", "Sites.Read.All"]  # Include SharePoint access
 app.config['REDIRECT_URI'] = os.getenv('REDIRECT_URI', 'http://localhost:5000/auth/redirect')
 
-print(f"DEBUG: CLIENT_ID: {app.config['CLIENT_ID'][:10] + '...' if app.config['CLIENT_ID'] else 'None'}")
-print(f"DEBUG: CLIENT_SECRET: {'SET' if app.config['CLIENT_SECRET'] else 'None'}")
-print(f"DEBUG: TENANT_ID: {app.config['TENANT_ID'][:10] + '...' if app.config['TENANT_ID'] else 'None'}")
-print(f"DEBUG: REDIRECT_URI: {app.config['REDIRECT_URI']}")
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("CLIENT_ID: %s", app.config['CLIENT_ID'][:10] + '...' if app.config['CLIENT_ID'] else 'None')
+    logger.debug("CLIENT_SECRET: %s", 'SET' if app.config['CLIENT_SECRET'] else 'None')
+    logger.debug("TENANT_ID: %s", app.config['TENANT_ID'][:10] + '...' if app.config['TENANT_ID'] else 'None')
+    logger.debug("REDIRECT_URI: %s", app.config['REDIRECT_URI'])
 
 # SharePoint Configuration
 app.config['SP_SITE_URL'] = os.getenv('SP_SITE_URL')
@@ -132,12 +202,73 @@ app.config['SP_ADMIN_LIST_ID'] = os.getenv('SP_ADMIN_LIST_ID')
 app.config['SP_ADMIN_EMAIL_COLUMN'] = os.getenv('SP_ADMIN_EMAIL_COLUMN', 'Email')
 app.config['SP_ADMIN_ACTIVE_COLUMN'] = os.getenv('SP_ADMIN_ACTIVE_COLUMN', 'Active')
 
-print(f"DEBUG: SP_SITE_URL: {app.config['SP_SITE_URL']}")
-print(f"DEBUG: SP_ADMIN_LIST_ID: {app.config['SP_ADMIN_LIST_ID'][:10] + '...' if app.config['SP_ADMIN_LIST_ID'] else 'None'}")
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("SP_SITE_URL: %s", app.config['SP_SITE_URL'])
+    logger.debug("SP_ADMIN_LIST_ID: %s", app.config['SP_ADMIN_LIST_ID'][:10] + '...' if app.config['SP_ADMIN_LIST_ID'] else 'None')
+
+# Worker pool for overlapping independent SharePoint/Graph I/O within a request
+io_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='contract-io')
+
+# Background contract uploads get their own pool so a slow Graph upload never
+# holds a slot that a request's fan-out above is waiting on
+upload_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='contract-upload')
+
+# Stage suffix on stored contract filenames (e.g. Lease_uploaded.docx -> Lease)
+_FILENAME_STAGE_SUFFIX_RE = re.compile(r'_(uploaded|edited|completed)$')
+
+
+def _contract_base_name(filename):
+    """Stored contract filename without its extension or stage suffix (Lease_uploaded.docx -> Lease)"""
+    base_name, dot, _ = filename.rpartition('.')
+    return _FILENAME_STAGE_SUFFIX_RE.sub('', base_name if dot else filename)
+
+
+@functools.lru_cache(maxsize=1024)
+def _edited_filename(uploaded_filename):
+    """Name of the edited copy stored next to a contract (Lease_uploaded.docx -> Lease_edited.docx)"""
+    return f"{_contract_base_name(uploaded_filename)}_edited.docx"
+
+# Background contract uploads: job_id -> {'status', 'user_email', 'form', 'result'}
+# (in Redis or SQLite when configured, so a status poll can land on any gunicorn worker)
+UPLOAD_JOB_TTL_SECONDS = 3600
+upload_jobs = create_shared_cache('upload_job:')
+upload_jobs_lock = threading.Lock()
+
+# Serialized /api/contracts bodies (+ ETag) per (user, admin) so dashboard polls don't hit SharePoint
+# or re-encode the list every time
+CONTRACT_LIST_TTL_SECONDS = 30
+contract_lists = create_shared_cache('contract_list:')
+
+# SharePoint choice-column options per field; these only change when someone edits the
+# list column, so keep them for an hour (admins can drop them via /admin/choices/invalidate)
+FIELD_CHOICES_TTL_SECONDS = 3600
+field_choices_cache = create_shared_cache('field_choices:')
+
+# download_edited targets (edited filename + drive) per contract, so re-downloads of a freshly
+# issued signed link skip the SharePoint contract lookup
+EDITED_DOWNLOAD_TTL_SECONDS = 60
+edited_download_targets = create_shared_cache('edited_download:')
+
+_sharepoint_module = None
+
+
+def _sharepoint_service():
+    """
+    Request-scoped SharePointService for route handlers
+    
+    The module is imported on first use rather than at app import (see the note at the
+    top of this file) and then kept, so handlers don't go through the import system on
+    every request. get_sharepoint_service is looked up on the module at call time.
+    """
+    global _sharepoint_module
+    if _sharepoint_module is None:
+        from app.services import sharepoint_service as _sharepoint_module
+    return _sharepoint_module.get_sharepoint_service()
 
 # Import authentication utilities
 from app.utils.auth_utils import login_required
-from app.utils.admin_utils import admin_required
+from app.utils.admin_utils import admin_required, clear_admin_cache
+from app.utils.error_utils import json_errors
 
 # Register auth blueprint
 from app.routes.auth_routes import auth_bp
@@ -154,21 +285,24 @@ def inject_auth():
         'is_admin': session.get('is_admin', False)
     }
 
+@app.template_filter('ts_to_iso')
+def ts_to_iso(ts):
+    """Format an epoch-nanosecond timestamp (UTC) as ISO 8601; older ISO strings pass through"""
+    if isinstance(ts, int):
+        return datetime.fromtimestamp(ts / 1e9, tz.utc).replace(tzinfo=None).isoformat()
+    return ts
+
 @app.route('/')
 @login_required
 def index():
-    print(f"\n{'='*80}")
-    print(f"=== INDEX ROUTE CALLED ===")
-    print(f"{'='*80}")
-    print(f"Session keys: {list(session.keys())}")
-    print(f"access_token present: {bool(session.get('access_token'))}")
-    print(f"user_email: {session.get('user_email')}")
-    print(f"user_name: {session.get('user_name')}")
-    print(f"is_admin: {session.get('is_admin')}")
-    print(f"{'='*80}\n")
+    logger.debug("=== INDEX ROUTE CALLED ===")
+    logger.debug("Session keys: %s", list(session.keys()))
+    logger.debug("access_token present: %s", bool(session.get('access_token')))
+    logger.debug("user_email: %s", session.get('user_email'))
+    logger.debug("user_name: %s", session.get('user_name'))
+    logger.debug("is_admin: %s", session.get('is_admin'))
     
     # Ensure access token is fresh
-    from app.auth.token_utils import ensure_fresh_access_token, AuthRequired
     try:
         ensure_fresh_access_token()
     except AuthRequired:
@@ -180,13 +314,84 @@ def index():
     
     return render_template('index.html')
 
+def _run_contract_upload(job_id, temp_path, upload_kwargs):
+    """Background job: upload a spooled contract file to SharePoint and record the result"""
+    try:
+        with open(temp_path, 'rb') as f:
+            upload_result = _sharepoint_service().upload_contract(file_content=f, **upload_kwargs)
+    except Exception as e:
+        logger.error("Error in background contract upload: %s", str(e))
+        upload_result = {
+            'success': False,
+            'error': str(e),
+            'message': 'Failed to upload contract to SharePoint'
+        }
+    finally:
+        Path(temp_path).unlink(missing_ok=True)
+    
+    if upload_result['success']:
+        _forget_contract_list()
+    
+    # Log the outcome of the contract upload
+    try:
+        user_email = session.get('user_email')
+        user_name = session.get('user_name')
+        if upload_result['success']:
+            activity_logger.log_successful_contract_upload(user_email=user_email, user_display_name=user_name)
+        else:
+            activity_logger.log_failed_contract_upload(user_email=user_email, user_display_name=user_name)
+    except Exception as log_err:
+        logger.warning("[ActivityLogger] Failed to log contract upload: %s", log_err)
+    
+    with upload_jobs_lock:
+        job = upload_jobs.get(job_id)
+        if job is not None:
+            job['status'] = 'done'
+            job['result'] = upload_result
+            upload_jobs.set(job_id, job, ttl=UPLOAD_JOB_TTL_SECONDS)
+
+
+def _submit_contract_response(upload_result, form):
+    """Build the JSON response for a finished contract upload (same shape as the old synchronous endpoint)"""
+    if upload_result['success']:
+        contract_name = form['contract_name']
+        flash(f'Contract "{contract_name}" uploaded successfully!', 'success')
+        return jsonify({
+            'success': True, 
+            'message': f'Contract submitted successfully! Contract ID: {upload_result["contract_id"]}',
+            'file_url': upload_result['file_url'],
+            'contract_id': upload_result['contract_id'],
+            'redirect_url': url_for('index') + '?tab=dashboard'
+        })
+    
+    error_msg = upload_result.get("error", "Unknown error")
+    # Check if this is a token expiration error
+    if "expired" in error_msg.lower() or "unauthorized" in error_msg.lower() or "authentication" in error_msg.lower():
+        # Clear the session to force re-authentication
+        session.clear()
+        return jsonify({
+            'success': False,
+            'message': 'Your session has expired. Please log in again.',
+            'auth_error': True
+        }), 401
+    
+    return jsonify({
+        'success': False, 
+        'message': f'Failed to upload to SharePoint: {error_msg}'
+    }), 500
+
+
 @app.route('/submit-contract', methods=['POST'])
 @login_required
 def submit_contract():
-    """Handle contract submission and upload to SharePoint"""
+    """
+    Accept a contract submission and upload it to SharePoint in the background
+    
+    Returns 202 with a status_url; the client polls it for the final result so the
+    worker is not held for the duration of the Graph upload.
+    """
     try:
         # Ensure access token is fresh before making API calls
-        from app.auth.token_utils import ensure_fresh_access_token, AuthRequired
         try:
             ensure_fresh_access_token()
         except AuthRequired as e:
@@ -200,17 +405,20 @@ def submit_contract():
             }), 401
         
         # Get form data
-        submitter_name = request.form.get('submitterName')
-        submitter_email = request.form.get('submitterEmail')
-        contract_name = request.form.get('contractName')
-        business_approver_email = request.form.get('businessApproverEmail')
-        date_requested = request.form.get('dateRequested')
-        contract_type = request.form.get('contractType')
-        business_terms = request.form.getlist('businessTerms')
-        additional_notes = request.form.get('additionalNotes', '')
+        form = {
+            'submitter_name': request.form.get('submitterName'),
+            'submitter_email': request.form.get('submitterEmail'),
+            'contract_name': request.form.get('contractName'),
+            'business_approver_email': request.form.get('businessApproverEmail'),
+            'date_requested': request.form.get('dateRequested'),
+            'contract_type': request.form.get('contractType'),
+            'business_terms': request.form.getlist('businessTerms'),
+            'additional_notes': request.form.get('additionalNotes', '')
+        }
         
         # Validate required fields
-        if not all([submitter_name, submitter_email, contract_name, business_approver_email, date_requested, contract_type]):
+        required = ['submitter_name', 'submitter_email', 'contract_name', 'business_approver_email', 'date_requested', 'contract_type']
+        if not all(form[key] for key in required):
             return jsonify({'success': False, 'message': 'All required fields must be filled'}), 400
         
         # Check if file was uploaded
@@ -225,79 +433,32 @@ def submit_contract():
         if not file.filename.lower().endswith(('.docx', '.doc')):
             return jsonify({'success': False, 'message': 'Only DOCX files are allowed'}), 400
         
-        # Read file content
-        file_content = file.read()
-        
-        # Import SharePoint service
-        from app.services.sharepoint_service import sharepoint_service
-        
-        # Upload to SharePoint
-        upload_result = sharepoint_service.upload_contract(
-            file_content=file_content,
-            file_name=file.filename,
-            submitter_name=submitter_name,
-            contract_name=contract_name,
-            submitter_email=submitter_email,
-            business_approver_email=business_approver_email,
-            date_requested=date_requested,
-            contract_type=contract_type,
-            business_terms=business_terms,
-            additional_notes=additional_notes
-        )
+        # Spool the upload to a temp file the background job owns (the request
+        # stream is closed once this response is sent)
+        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as temp_file:
+            file.save(temp_file)
+            temp_path = temp_file.name
+        
+        job_id = uuid.uuid4().hex
+        with upload_jobs_lock:
+            upload_jobs.set(job_id, {
+                'status': 'pending',
+                'user_email': session.get('user_email'),
+                'form': form,
+                'result': None
+            }, ttl=UPLOAD_JOB_TTL_SECONDS)
+        
+        # The job uploads with the token validated above: the session is saved with the
+        # 202 response, so the job must not refresh or write it
+        upload_kwargs = dict(form, file_name=file.filename, access_token=session.get('access_token'))
+        upload_executor.submit(copy_current_request_context(_run_contract_upload), job_id, temp_path, upload_kwargs)
         
-        if upload_result['success']:
-            # Log successful contract upload
-            try:
-                user_email = session.get('user_email')
-                user_name = session.get('user_name')
-                activity_logger.log_successful_contract_upload(user_email=user_email, user_display_name=user_name)
-            except Exception as log_err:
-                print(f"[ActivityLogger] Failed to log successful contract upload: {log_err}")
-            
-            # Store submission details in session for success message
-            session['last_submission'] = {
-                'contract_name': contract_name,
-                'file_url': upload_result['file_url'],
-                'file_name': upload_result['file_name'],
-                'submitter_name': submitter_name,
-                'business_approver_email': business_approver_email,
-                'date_requested': date_requested,
-                'business_terms': business_terms,
-                'additional_notes': additional_notes
-            }
-            
-            flash(f'Contract "{contract_name}" uploaded successfully!', 'success')
-            return jsonify({
-                'success': True, 
-                'message': f'Contract submitted successfully! Contract ID: {upload_result["contract_id"]}',
-                'file_url': upload_result['file_url'],
-                'contract_id': upload_result['contract_id'],
-                'redirect_url': url_for('index') + '?tab=dashboard'
-            })
-        else:
-            # Log failed contract upload
-            try:
-                user_email = session.get('user_email')
-                user_name = session.get('user_name')
-                activity_logger.log_failed_contract_upload(user_email=user_email, user_display_name=user_name)
-            except Exception as log_err:
-                print(f"[ActivityLogger] Failed to log failed contract upload: {log_err}")
-            
-            error_msg = upload_result.get("error", "Unknown error")
-            # Check if this is a token expiration error
-            if "expired" in error_msg.lower() or "unauthorized" in error_msg.lower() or "authentication" in error_msg.lower():
-                # Clear the session to force re-authentication
-                session.clear()
-                return jsonify({
-                    'success': False,
-                    'message': 'Your session has expired. Please log in again.',
-                    'auth_error': True
-                }), 401
-            
-            return jsonify({
-                'success': False, 
-                'message': f'Failed to upload to SharePoint: {error_msg}'
-            }), 500
+        return jsonify({
+            'success': True,
+            'status': 'pending',
+            'job_id': job_id,
+            'status_url': url_for('submit_contract_status', job_id=job_id)
+        }), 202
             
     except Exception as e:
         # Log failed contract upload for exceptions
@@ -306,10 +467,10 @@ def submit_contract():
             user_name = session.get('user_name')
             activity_logger.log_failed_contract_upload(user_email=user_email, user_display_name=user_name)
         except Exception as log_err:
-            print(f"[ActivityLogger] Failed to log failed contract upload: {log_err}")
+            logger.warning("[ActivityLogger] Failed to log failed contract upload: %s", log_err)
         
         error_str = str(e)
-        print(f"Error in submit_contract: {error_str}")
+        logger.error("Error in submit_contract: %s", error_str)
         
         # Check if this is a token expiration error
         if "expired" in error_str.lower() or "unauthorized" in error_str.lower() or "authentication" in error_str.lower():
@@ -323,11 +484,28 @@ def submit_contract():
         
         return jsonify({'success': False, 'message': f'Server error: {error_str}'}), 500
 
+@app.route('/submit-contract/status/<job_id>')
+@login_required
+def submit_contract_status(job_id):
+    """Poll a background contract upload; returns 202 while pending, then the final submit result"""
+    with upload_jobs_lock:
+        job = upload_jobs.get(job_id)
+    
+    if not job or job['user_email'] != session.get('user_email'):
+        return jsonify({'success': False, 'message': 'Upload not found'}), 404
+    
+    if job['status'] != 'done':
+        return jsonify({'success': True, 'status': 'pending', 'job_id': job_id}), 202
+    
+    with upload_jobs_lock:
+        upload_jobs.delete(job_id)
+    return _submit_contract_response(job['result'], job['form'])
+
 @app.route('/test-sharepoint')
 def test_sharepoint():
     """Test SharePoint connection"""
     try:
-        from app.services.sharepoint_service import sharepoint_service
+        sharepoint_service = _sharepoint_service()
         
         # Test basic connection
         sharepoint_service.create_contract_folder_if_not_exists()
@@ -336,108 +514,159 @@ def test_sharepoint():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
+def _contract_list_key(user_email, is_admin):
+    """Cache key for a user's dashboard contract list"""
+    return f"{(user_email or '').lower()}:{int(bool(is_admin))}"
+
+
+def _forget_contract_list():
+    """Drop the current user's cached contract lists so the dashboard shows their change right away"""
+    user_email = session.get('user_email')
+    for is_admin in (False, True):
+        contract_lists.delete(_contract_list_key(user_email, is_admin))
+
+
+@app.before_request
+def reject_oversized_upload():
+    """
+    Refuse bodies over MAX_CONTENT_LENGTH up front
+    
+    Werkzeug raises 413 only when request.form/files is first read, which is inside the
+    upload routes' catch-all try blocks; checking Content-Length here means the body is
+    never spooled and the client gets a proper 413.
+    """
+    limit = app.config['MAX_CONTENT_LENGTH']
+    if limit is not None and request.content_length is not None and request.content_length > limit:
+        abort(413)
+
+
+@app.errorhandler(413)
+def upload_too_large(e):
+    """JSON error for bodies over MAX_CONTENT_LENGTH (the upload endpoints' fetch() callers expect JSON)"""
+    limit_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+    return jsonify({'success': False, 'message': f'File is too large. Maximum upload size is {limit_mb} MB.'}), 413
+
+
+@app.after_request
+def forget_contract_list_after_change(response):
+    """Any successful write request may have changed a contract list item"""
+    if request.method != 'GET' and response.status_code < 400 and session.get('user_email'):
+        _forget_contract_list()
+    return response
+
+
 @app.route('/api/contracts')
 @login_required
+@json_errors
 def get_contracts():
     """Get contracts data from SharePoint list"""
-    try:
-        from app.services.sharepoint_service import sharepoint_service
-        
-        # Get user info from session
-        user_email = session.get('user_email')
-        is_admin = session.get('is_admin', False)
-        
-        print(f"\n=== DEBUG /api/contracts ===")
-        print(f"User: {user_email}")
-        print(f"Is Admin: {is_admin}")
-        
-        # Get contracts from SharePoint list (filtered by user if not admin)
-        contracts = sharepoint_service.get_contract_files(
+    # Get user info from session
+    user_email = session.get('user_email')
+    is_admin = session.get('is_admin', False)
+    
+    logger.debug("=== DEBUG /api/contracts ===")
+    logger.debug("User: %s", user_email)
+    logger.debug("Is Admin: %s", is_admin)
+    
+    # Get contracts from SharePoint list (filtered by user if not admin)
+    cache_key = _contract_list_key(user_email, is_admin)
+    cached = contract_lists.get(cache_key)
+    if cached is None:
+        contracts = _sharepoint_service().get_contract_files(
             user_email=user_email,
             is_admin=is_admin
         )
-        
-        return jsonify({
+        response = jsonify({
             'success': True,
             'contracts': contracts,
             'count': len(contracts),
             'is_admin': is_admin
         })
-        
-    except Exception as e:
-        print(f"Error getting contracts: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': str(e)}), 500
+        response.add_etag()
+        # get_contract_files returns [] on errors too, so only cache real results
+        if contracts:
+            contract_lists.set(cache_key, {
+                'body': response.get_data(as_text=True),
+                'etag': response.get_etag()[0]
+            }, ttl=CONTRACT_LIST_TTL_SECONDS)
+    else:
+        # Serve the already-serialized list as-is
+        response = app.response_class(cached['body'], mimetype=app.json.mimetype)
+        response.set_etag(cached['etag'])
+    
+    # Let dashboard polls revalidate with If-None-Match and get a bodiless 304 when nothing changed
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 @app.route('/api/field-choices/<field_name>', methods=['GET'])
 @login_required
 def get_field_choices(field_name):
     """Get the choice options for a specific SharePoint field"""
     try:
-        from app.services.sharepoint_service import sharepoint_service
-        
-        print(f"\n=== DEBUG /api/field-choices/{field_name} ===")
-        
-        # Get choices from SharePoint
-        choices = sharepoint_service.get_field_choices(field_name)
-        
-        return jsonify({'success': True, 'choices': choices})
+        logger.debug("=== DEBUG /api/field-choices/%s ===", field_name)
+        
+        choices = field_choices_cache.get(field_name)
+        if choices is None:
+            # Get choices from SharePoint
+            choices = _sharepoint_service().get_field_choices(field_name)
+            # get_field_choices returns [] on errors too, so only cache real results
+            if choices:
+                field_choices_cache.set(field_name, choices, ttl=FIELD_CHOICES_TTL_SECONDS)
+        
+        # Choice sets rarely change, so let the dashboard revalidate with If-None-Match
+        response = jsonify({'success': True, 'choices': choices})
+        response.add_etag()
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
             
     except Exception as e:
-        print(f"Error getting field choices: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error getting field choices: %s", str(e))
         return jsonify({'success': False, 'error': str(e), 'choices': []}), 500
 
 @app.route('/api/update-contract-field', methods=['POST'])
 @login_required
+@json_errors
 def update_contract_field():
     """Update a specific field in a SharePoint contract list item"""
-    try:
-        from app.services.sharepoint_service import sharepoint_service
-        
-        data = request.json
-        contract_id = data.get('contract_id')
-        field = data.get('field')
-        value = data.get('value')
-        
-        print(f"\n=== DEBUG /api/update-contract-field ===")
-        print(f"Contract ID: {contract_id}")
-        print(f"Field: {field}")
-        print(f"New Value: {value}")
-        
-        if not contract_id or not field:
-            return jsonify({'success': False, 'error': 'Missing contract_id or field'}), 400
-        
-        # Update the field in SharePoint
-        success = sharepoint_service.update_contract_field(contract_id, field, value)
-        
-        if success:
-            return jsonify({'success': True, 'message': f'{field} updated successfully'})
-        else:
-            return jsonify({'success': False, 'error': 'Failed to update field'}), 500
-            
-    except Exception as e:
-        print(f"Error updating contract field: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': str(e)}), 500
+    sharepoint_service = _sharepoint_service()
+    
+    data = request.json
+    contract_id = data.get('contract_id')
+    field = data.get('field')
+    value = data.get('value')
+    
+    logger.debug("=== DEBUG /api/update-contract-field ===")
+    logger.debug("Contract ID: %s", contract_id)
+    logger.debug("Field: %s", field)
+    logger.debug("New Value: %s", value)
+    
+    if not contract_id or not field:
+        return jsonify({'success': False, 'error': 'Missing contract_id or field'}), 400
+    
+    # Update the field in SharePoint
+    success = sharepoint_service.update_contract_field(contract_id, field, value)
+    
+    if success:
+        return jsonify({'success': True, 'message': f'{field} updated successfully'})
+    else:
+        return jsonify({'success': False, 'error': 'Failed to update field'}), 500
 
 @app.route('/api/upload-completed-contract', methods=['POST'])
 @login_required
 def upload_completed_contract():
     """Upload a completed contract document to SharePoint ContractFiles"""
     try:
-        from app.services.sharepoint_service import sharepoint_service
+        sharepoint_service = _sharepoint_service()
         
         # Get the uploaded file and contract ID
         file = request.files.get('file')
         contract_id = request.form.get('contract_id')
         
-        print(f"\n=== DEBUG /api/upload-completed-contract ===")
-        print(f"Contract ID: {contract_id}")
-        print(f"File: {file.filename if file else 'None'}")
+        logger.debug("=== DEBUG /api/upload-completed-contract ===")
+        logger.debug("Contract ID: %s", contract_id)
+        logger.debug("File: %s", file.filename if file else 'None')
         
         if not file or not contract_id:
             return jsonify({'success': False, 'message': 'Missing file or contract_id'}), 400
@@ -447,21 +676,19 @@ def upload_completed_contract():
         if contract:
             # Use the original filename stored in SharePoint
             original_uploaded_filename = contract.get('file_name', file.filename)
-            print(f"Original uploaded filename from SharePoint: {original_uploaded_filename}")
+            logger.debug("Original uploaded filename from SharePoint: %s", original_uploaded_filename)
         else:
             # Fallback to the uploaded file's name if contract not found
             original_uploaded_filename = file.filename
-            print(f"Warning: Contract not found, using uploaded filename: {original_uploaded_filename}")
+            logger.warning("Contract not found, using uploaded filename: %s", original_uploaded_filename)
         
         # Extract base name and remove any existing suffix
-        import re
-        base_name = original_uploaded_filename.rsplit('.', 1)[0] if '.' in original_uploaded_filename else original_uploaded_filename
-        base_name = re.sub(r'_(uploaded|edited|completed)$', '', base_name)
+        base_name = _contract_base_name(original_uploaded_filename)
         
         completed_filename = f"{base_name}_completed.docx"
         
-        print(f"Base name (cleaned): {base_name}")
-        print(f"Completed filename: {completed_filename}")
+        logger.debug("Base name (cleaned): %s", base_name)
+        logger.debug("Completed filename: %s", completed_filename)
         
         # Upload the completed file to ContractFiles
         upload_result = sharepoint_service.upload_to_contract_files(
@@ -476,8 +703,8 @@ def upload_completed_contract():
             enhanced_url = upload_result.get('file_url', '')
             
             if drive_item:
-                print(f"Storing Enhanced Document Link from drive_item")
-                print(f"Contract Item ID: {contract_id}")
+                logger.debug("Storing Enhanced Document Link from drive_item")
+                logger.debug("Contract Item ID: %s", contract_id)
                 
                 try:
                     # Update the EnhancedDocumentLink field (Single line of text, max 255 chars)
@@ -485,25 +712,25 @@ def upload_completed_contract():
                         item_id=contract_id,
                         drive_item=drive_item
                     )
-                    print(f"✓ EnhancedDocumentLink stored successfully")
+                    logger.debug("✓ EnhancedDocumentLink stored successfully")
                 except ValueError as e:
                     # URL too long for SharePoint Single line of text field
-                    print(f"⚠ URL exceeds 255 character limit: {str(e)}")
+                    logger.warning("⚠ URL exceeds 255 character limit: %s", str(e))
                     # Non-critical - file uploaded successfully, just couldn't store link
                     pass
                 except PermissionError as e:
                     if "SESSION_EXPIRED" in str(e):
-                        print(f"⚠ Session expired while updating EnhancedDocumentLink")
+                        logger.warning("⚠ Session expired while updating EnhancedDocumentLink")
                         return jsonify({
                             'success': False,
                             'message': 'Session expired. Please sign in again.'
                         }), 401
                     else:
-                        print(f"⚠ Permission denied: {str(e)}")
+                        logger.warning("⚠ Permission denied: %s", str(e))
                         # Non-critical - file uploaded successfully, just couldn't update link
                         pass
                 except (FileNotFoundError, RuntimeError) as e:
-                    print(f"⚠ Failed to update EnhancedDocumentLink: {str(e)}")
+                    logger.warning("⚠ Failed to update EnhancedDocumentLink: %s", str(e))
                     # Non-critical - file uploaded successfully
                     pass
             
@@ -513,7 +740,7 @@ def upload_completed_contract():
                 user_name = session.get('user_name')
                 activity_logger.log_successful_completed_contract_upload(user_email=user_email, user_display_name=user_name)
             except Exception as log_err:
-                print(f"[ActivityLogger] Failed to log successful completed contract upload: {log_err}")
+                logger.warning("[ActivityLogger] Failed to log successful completed contract upload: %s", log_err)
             
             return jsonify({
                 'success': True,
@@ -528,7 +755,7 @@ def upload_completed_contract():
                 user_name = session.get('user_name')
                 activity_logger.log_failed_completed_contract_upload(user_email=user_email, user_display_name=user_name)
             except Exception as log_err:
-                print(f"[ActivityLogger] Failed to log failed completed contract upload: {log_err}")
+                logger.warning("[ActivityLogger] Failed to log failed completed contract upload: %s", log_err)
             
             return jsonify({
                 'success': False,
@@ -542,11 +769,9 @@ def upload_completed_contract():
             user_name = session.get('user_name')
             activity_logger.log_failed_completed_contract_upload(user_email=user_email, user_display_name=user_name)
         except Exception as log_err:
-            print(f"[ActivityLogger] Failed to log failed completed contract upload: {log_err}")
+            logger.warning("[ActivityLogger] Failed to log failed completed contract upload: %s", log_err)
         
-        print(f"Error uploading completed contract: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error uploading completed contract: %s", str(e))
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/dashboard')
@@ -558,40 +783,67 @@ def dashboard():
 @admin_required
 def admin_panel():
     """Admin-only route - requires user to be in SharePoint admin list"""
-    print(f"\n=== DEBUG admin_panel() route called ===")
+    logger.debug("=== DEBUG admin_panel() route called ===")
     return render_template('admin.html')
 
+@app.route('/admin/refresh-standards', methods=['POST'])
+@admin_required
+def refresh_standards():
+    """Drop the cached preferred standards so the next page load re-reads the SharePoint list"""
+    clear_preferred_standards_cache()
+    logger.info("Preferred standards cache cleared by %s", session.get('user_email'))
+    return jsonify({'success': True, 'message': 'Preferred standards will be reloaded from SharePoint'})
+
+@app.route('/admin/cache/invalidate', methods=['POST'])
+@admin_required
+def invalidate_admin_cache():
+    """Drop cached admin statuses (e.g. after the SharePoint admin list is edited)"""
+    clear_admin_cache()
+    logger.info("Admin status cache cleared by %s", session.get('user_email'))
+    return jsonify({'success': True, 'message': 'Admin statuses will be re-checked against SharePoint'})
+
+@app.route('/admin/choices/invalidate', methods=['POST'])
+@app.route('/admin/choices/invalidate/<field_name>', methods=['POST'])
+@admin_required
+def invalidate_field_choices(field_name=None):
+    """Drop cached choice options for one field, or all fields (e.g. after a list column is edited)"""
+    if field_name:
+        field_choices_cache.delete(field_name)
+    else:
+        field_choices_cache.clear()
+    logger.info("Field choices cache cleared (%s) by %s", field_name or 'all fields', session.get('user_email'))
+    return jsonify({'success': True, 'message': 'Field choices will be reloaded from SharePoint'})
+
 @app.route('/debug/lists')
 @admin_required
 def debug_lists():
     """Debug route to list all SharePoint lists"""
-    import requests
     
     try:
-        print("\n=== DEBUG /debug/lists route ===")
+        logger.debug("=== DEBUG /debug/lists route ===")
         token = session.get('access_token')
         site_id = os.getenv('O365_SITE_ID')
         
-        print(f"Token present: {bool(token)}")
-        print(f"Site ID: {site_id}")
+        logger.debug("Token present: %s", bool(token))
+        logger.debug("Site ID: %s", site_id)
         
         if not token:
             return jsonify({'error': 'No access token in session'}), 401
         
         url = f"https://graph.microsoft.com/v1.0/sites/{site_id}/lists"
-        print(f"URL: {url}")
+        logger.debug("URL: %s", url)
         
         headers = {'Authorization': f'Bearer {token}'}
         
-        print(f"Making request to Graph API...")
-        response = requests.get(url, headers=headers, timeout=30)
-        print(f"Response status: {response.status_code}")
+        logger.debug("Making request to Graph API...")
+        response = http_session.get(url, headers=headers, timeout=30)
+        logger.debug("Response status: %s", response.status_code)
         
         response.raise_for_status()
         
         lists_data = response.json()
         lists = lists_data.get('value', [])
-        print(f"Found {len(lists)} lists")
+        logger.debug("Found %s lists", len(lists))
         
         # Format for display
         result = []
@@ -603,15 +855,14 @@ def debug_lists():
                 'webUrl': lst.get('webUrl', 'N/A')
             }
             result.append(list_info)
-            print(f"  - {list_info['name']}: {list_info['id']}")
+            logger.debug("  - %s: %s", list_info['name'], list_info['id'])
         
         return jsonify({'lists': result, 'count': len(result), 'site_id': site_id})
         
     except Exception as e:
-        import traceback
         error_trace = traceback.format_exc()
-        print(f"ERROR in debug_lists: {str(e)}")
-        print(error_trace)
+        logger.error("Error in debug_lists: %s", str(e))
+        logger.debug("%s", error_trace)
         return jsonify({'error': str(e), 'trace': error_trace}), 500
 
 # Default standards list (19 standards)
@@ -620,54 +871,48 @@ def debug_lists():
 def contract_standards(contract_id):
     """Display standards selection page for a specific contract"""
     try:
-        from app.services.sharepoint_service import sharepoint_service
+        sharepoint_service = _sharepoint_service()
         
-        print(f"\n=== DEBUG contract_standards ===")
-        print(f"Contract ID: {contract_id}")
+        logger.debug("=== DEBUG contract_standards ===")
+        logger.debug("Contract ID: %s", contract_id)
         
         # Check if there's a cached analysis - if so, redirect to results page
         cached_data = analysis_cache.get(contract_id)
         if cached_data and cached_data.get('results'):
-            print(f"Found cached analysis, redirecting to results page")
+            logger.debug("Found cached analysis, redirecting to results page")
             return redirect(url_for('apply_suggestions_new', contract_id=contract_id))
         
-        # Get user info
-        user_email = session.get('user_email')
+        # Get user info (sessions from before user_email_lc was stored fall back to lowering here)
+        user_email_lc = session.get('user_email_lc') or session.get('user_email', '').lower()
         is_admin = session.get('is_admin', False)
         
-        # Get all contracts to find this specific one
-        contracts = sharepoint_service.get_contract_files(
-            user_email=user_email,
-            is_admin=is_admin
-        )
-        
-        # Find the specific contract
-        contract = next((c for c in contracts if c['contract_id'] == contract_id), None)
+        # Fetch just this contract (filtered server-side by ContractID)
+        contract = sharepoint_service.get_contract_by_id(contract_id)
         
         if not contract:
             flash('Contract not found', 'error')
             return redirect(url_for('dashboard'))
         
         # Check if user has access to this contract (admins can access all)
-        if not is_admin and contract['submitter_email'].lower() != user_email.lower():
+        if not is_admin and contract['submitter_email_lc'] != user_email_lc:
             flash('You do not have access to this contract', 'error')
             return redirect(url_for('dashboard'))
         
         # Get preferred standards from SharePoint (categorized by security flag)
-        print(f"Loading preferred standards from SharePoint...")
+        logger.debug("Loading preferred standards from SharePoint...")
         try:
             categorized_standards = get_preferred_standards_by_category()
             default_standards = categorized_standards['default']
             security_standards = categorized_standards['security']
-            print(f"Loaded {len(default_standards)} default standards and {len(security_standards)} security standards")
+            logger.debug("Loaded %s default standards and %s security standards", len(default_standards), len(security_standards))
             if default_standards:
-                print(f"First default standard example: {default_standards[0]}")
+                logger.debug("First default standard example: %s", default_standards[0])
             if security_standards:
-                print(f"First security standard example: {security_standards[0]}")
+                logger.debug("First security standard example: %s", security_standards[0])
         except PermissionError as e:
             # Token expired - show session expiration message
             if 'SESSION_EXPIRED' in str(e):
-                print(f"Token expired while loading standards - clearing session")
+                logger.debug("Token expired while loading standards - clearing session")
                 session.clear()
                 flash('Your session has expired. Please log in again.', 'warning')
                 return redirect(url_for('index'))
@@ -680,240 +925,286 @@ def contract_standards(contract_id):
                              security_standards=security_standards)
         
     except Exception as e:
-        print(f"Error in contract_standards: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in contract_standards: %s", str(e))
         flash(f'Error loading contract standards: {str(e)}', 'error')
         return redirect(url_for('dashboard'))
 
+def _remove_temp_file(temp_file_path):
+    """Delete a downloaded temp file (no-op for None or an already-removed file)"""
+    if not temp_file_path:
+        return
+    try:
+        Path(temp_file_path).unlink(missing_ok=True)
+        logger.debug("Cleaned up temporary file: %s", temp_file_path)
+    except OSError as cleanup_error:
+        logger.warning("Failed to clean up temporary file: %s", cleanup_error)
+
+
+def _build_summary(analysis_results, selected_standards):
+    """Summary rows (one per selected standard) shown on the results page"""
+    summary_items = []
+    for standard_name in selected_standards:
+        result = analysis_results.get(standard_name, {})
+        
+        summary_items.append({
+            'standard': standard_name,
+            'present': result.get('found', False),
+            'excerpt': result.get('excerpt') or 'N/A',
+            'location': result.get('location') or 'N/A',
+            'suggestion': result.get('suggestion') or 'N/A',
+            'source': result.get('source', 'ai')
+        })
+    return summary_items
+
+
+def _wants_json():
+    """True when the client (e.g. a fetch() call) asked for JSON rather than an HTML redirect"""
+    return request.accept_mimetypes.best == 'application/json'
+
+
+def _analyze_error(message, category, redirect_to, status):
+    """Report an analyze failure as JSON for fetch() clients, otherwise flash and redirect"""
+    if _wants_json():
+        return jsonify({'success': False, 'error': message, 'redirect_url': redirect_to}), status
+    flash(message, category)
+    return redirect(redirect_to)
+
+
 @app.route('/contract/<contract_id>/analyze', methods=['POST'], endpoint='analyze_contract')
 @login_required
 def analyze_contract_route(contract_id):
     """Run AI analysis on contract with selected standards"""
-    from app.services.sharepoint_service import sharepoint_service
+    sharepoint_service = _sharepoint_service()
     temp_file_path = None
     
     try:
-        print(f"\n=== DEBUG analyze_contract ===")
-        print(f"Contract ID: {contract_id}")
+        logger.debug("=== DEBUG analyze_contract ===")
+        logger.debug("Contract ID: %s", contract_id)
         
         # Get all selected standards from form (includes both default and custom standards)
         all_standards = request.form.getlist('standards')
         
-        print(f"Total standards selected: {len(all_standards)}")
+        logger.debug("Total standards selected: %s", len(all_standards))
         
         if not all_standards:
-            flash('Please select at least one standard to analyze', 'warning')
-            return redirect(url_for('contract_standards', contract_id=contract_id))
-        
-        # Download contract from SharePoint
-        print(f"Downloading contract {contract_id} from SharePoint...")
-        temp_file_path = download_contract(contract_id)
-        print(f"Contract downloaded to: {temp_file_path}")
+            return _analyze_error('Please select at least one standard to analyze', 'warning',
+                                  url_for('contract_standards', contract_id=contract_id), 400)
+        
+        # Get preferred standards from SharePoint (as dict for analysis) in the background;
+        # the list fetch is independent of the download + extract chain below
+        logger.debug("Loading preferred standards from SharePoint...")
+        standards_future = io_executor.submit(copy_current_request_context(get_preferred_standards_dict))
+        
+        # Download contract from SharePoint and extract its text. Only the Word COM spelling
+        # check (Windows + pywin32) needs the file on disk; otherwise it stays in memory
+        logger.debug("Downloading contract %s from SharePoint...", contract_id)
+        if PYWIN32_INSTALLED:
+            temp_file_path = download_contract(contract_id)
+            logger.debug("Contract downloaded to: %s", temp_file_path)
+            contract_text = extract_text(temp_file_path)
+        else:
+            contract_file, file_ext = download_contract_content(contract_id)
+            with contract_file:
+                contract_text = extract_text(contract_file, suffix=file_ext)
+                # Keep the analyzed copy so applying suggestions doesn't download it again
+                doc_cache.put(session.get('user_email'), contract_id, contract_file, suffix=file_ext)
+        logger.debug("Extracted %s characters", len(contract_text))
         
-        # Extract text from contract
-        print(f"Extracting text from contract...")
-        contract_text = extract_text(temp_file_path)
-        print(f"Extracted {len(contract_text)} characters")
+        preferred_standards_dict = standards_future.result()
+        logger.debug("Loaded %s preferred standards", len(preferred_standards_dict))
         
-        # Get preferred standards from SharePoint (as dict for analysis)
-        print(f"Loading preferred standards from SharePoint...")
-        preferred_standards_dict = get_preferred_standards_dict()
-        print(f"Loaded {len(preferred_standards_dict)} preferred standards")
+        # Party detection is one more independent LLM call; run it while the standards are analyzed
+        parties_future = io_executor.submit(copy_current_request_context(detect_contract_parties), contract_text)
         
         # Run AI analysis (now returns dict with 'standards' and 'grammar' keys)
         # Pass file_path for Word COM API grammar checking
-        print(f"Running AI analysis for {len(all_standards)} standards...")
+        logger.debug("Running AI analysis for %s standards...", len(all_standards))
         analysis_output = run_analysis(
             contract_text, 
             all_standards, 
             preferred_standards_dict,
-            file_path=str(temp_file_path)  # Pass file path for Word COM grammar checking
+            file_path=str(temp_file_path) if temp_file_path else None  # Pass file path for Word COM grammar checking
         )
         
+        # Analysis was the last use of the file here; hand it to the document cache for the apply step
+        if temp_file_path and not doc_cache.put(session.get('user_email'), contract_id, temp_file_path):
+            _remove_temp_file(temp_file_path)
+        temp_file_path = None
+        
         # Extract standards results and grammar results
         analysis_results = analysis_output.get('standards', {})
         grammar_results = analysis_output.get('grammar', None)
         
-        print(f"Analysis complete: {len(analysis_results)} standards results")
+        logger.debug("Analysis complete: %s standards results", len(analysis_results))
         if grammar_results:
-            print(f"Grammar check complete: {grammar_results.get('error_count', 0)} errors found")
-            print(f"Grammar check method: {grammar_results.get('method', 'unknown')}")
+            logger.debug("Grammar check complete: %s errors found", grammar_results.get('error_count', 0))
+            logger.debug("Grammar check method: %s", grammar_results.get('method', 'unknown'))
         
         # Detect contract parties  
-        print("\n[DEBUG] About to detect contract parties...")
+        logger.debug("[DEBUG] About to detect contract parties...")
         try:
-            from app.services.llm_client import detect_contract_parties
-            print("[DEBUG] Import successful, calling detect_contract_parties...")
-            party_info = detect_contract_parties(contract_text)
-            print(f"[DEBUG] Party detection returned: {party_info}")
+            logger.debug("[DEBUG] Waiting for detect_contract_parties...")
+            party_info = parties_future.result()
+            logger.debug("[DEBUG] Party detection returned: %s", party_info)
             if party_info.get('found'):
                 party1 = party_info.get('party1', {})
                 party2 = party_info.get('party2', {})
-                print(f"\n[PARTY DETECTION]")
-                print(f"  Party 1: {party1.get('legal_name', 'Unknown')} (defined as: {party1.get('defined_as', 'Unknown')})")
-                print(f"  Party 2: {party2.get('legal_name', 'Unknown')} (defined as: {party2.get('defined_as', 'Unknown')})")
+                logger.debug("[PARTY DETECTION]")
+                logger.debug("  Party 1: %s (defined as: %s)", party1.get('legal_name', 'Unknown'), party1.get('defined_as', 'Unknown'))
+                logger.debug("  Party 2: %s (defined as: %s)", party2.get('legal_name', 'Unknown'), party2.get('defined_as', 'Unknown'))
             else:
-                print(f"\n[PARTY DETECTION] Could not clearly identify contract parties")
+                logger.debug("[PARTY DETECTION] Could not clearly identify contract parties")
                 party_info = {'found': False}
         except Exception as e:
-            print(f"\n[PARTY DETECTION] Failed with exception: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[PARTY DETECTION] Failed with exception: %s", e)
             party_info = {'found': False}
         
+        # Look up the contract once: its name is cached for the results page and its
+        # SharePoint list item ID is needed for the status update below
+        contract = sharepoint_service.get_contract_by_id(contract_id)
+        contract_name = 'Unknown'
+        if contract and 'id' in contract:
+            contract_name = contract.get('name', contract_id)
+        
         # Cache the results with 30-minute TTL (include party_info, original_party_info, and grammar_results)
+        summary_items = _build_summary(analysis_results, all_standards)
         cache_data = {
             'results': analysis_results,
             'selected': all_standards,
+            'summary': summary_items,  # Rows for the results page, built once here rather than per reload
             'party_info': party_info,
             'original_party_info': party_info.copy() if party_info else {'found': False},  # Store AI-detected original
             'grammar': grammar_results,  # Add grammar results to cache
-            'ts': datetime.utcnow().isoformat()
+            'contract_name': contract.get('name', 'Unknown Contract') if contract else None,  # Saves a SharePoint lookup on the results page
+            'ts': time.time_ns()  # Formatted at render time by the ts_to_iso filter
         }
         analysis_cache.set(contract_id, cache_data, ttl=1800)
-        print(f"Results cached for contract {contract_id}")
+        logger.debug("Results cached for contract %s", contract_id)
         
-        # Update status to "In progress" in SharePoint (matches SharePoint choice field)
-        # First get the contract to obtain the SharePoint list item ID
-        print(f"Updating status to 'In progress' for contract {contract_id}...")
-        contract = sharepoint_service.get_contract_by_id(contract_id)
-        contract_name = 'Unknown'
+        # Update status to "In progress" in SharePoint (matches SharePoint choice field);
+        # runs on io_executor so it overlaps with the activity log write below
+        logger.debug("Updating status to 'In progress' for contract %s...", contract_id)
+        status_future = None
         if contract and 'id' in contract:
-            contract_name = contract.get('name', contract_id)
-            status_updated = sharepoint_service.update_contract_field(contract['id'], 'Status', 'In progress')
-            if status_updated:
-                print(f"✓ Status updated to 'In progress'")
-            else:
-                print(f"⚠ Failed to update status (non-critical)")
+            status_future = io_executor.submit(
+                copy_current_request_context(sharepoint_service.update_contract_field),
+                contract['id'], 'Status', 'In progress'
+            )
         else:
-            print(f"⚠ Could not retrieve contract ID for status update (non-critical)")
+            logger.warning("⚠ Could not retrieve contract ID for status update (non-critical)")
         
         # Log successful analysis to SharePoint
-        print(f"Logging successful analysis to SharePoint...")
+        logger.debug("Logging successful analysis to SharePoint...")
         activity_logger.log_analysis_success(contract_name)
         
-        # Clean up temporary file
-        if temp_file_path and Path(temp_file_path).exists():
-            Path(temp_file_path).unlink()
-            print(f"Cleaned up temporary file: {temp_file_path}")
+        if status_future is not None:
+            if status_future.result():
+                logger.debug("✓ Status updated to 'In progress'")
+            else:
+                logger.warning("⚠ Failed to update status (non-critical)")
         
-        return redirect(url_for('apply_suggestions_new', contract_id=contract_id))
+        results_url = url_for('apply_suggestions_new', contract_id=contract_id)
+        if _wants_json():
+            return jsonify({
+                'success': True,
+                'contract_id': contract_id,
+                'summary': transform_suggestions(summary_items, party_info),
+                'redirect_url': results_url
+            })
+        return redirect(results_url)
         
     except PermissionError as e:
         # Log failure
         activity_logger.log_analysis_failure(contract_id)
         
         if "SESSION_EXPIRED" in str(e):
-            flash('Session expired — please sign in again.', 'warning')
-            return redirect(url_for('auth.login'))
+            return _analyze_error('Session expired — please sign in again.', 'warning', url_for('auth.login'), 401)
         else:
-            print(f"Permission error in analyze_contract: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            flash('You do not have permission to access this contract.', 'error')
-            return redirect(url_for('contract_standards', contract_id=contract_id))
+            logger.exception("Permission error in analyze_contract: %s", str(e))
+            return _analyze_error('You do not have permission to access this contract.', 'error',
+                                  url_for('contract_standards', contract_id=contract_id), 403)
             
     except FileNotFoundError as e:
         # Log failure
         activity_logger.log_analysis_failure(contract_id)
         
-        print(f"File not found in analyze_contract: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        flash('Contract file not found in SharePoint.', 'error')
-        return redirect(url_for('contract_standards', contract_id=contract_id))
+        logger.exception("File not found in analyze_contract: %s", str(e))
+        return _analyze_error('Contract file not found in SharePoint.', 'error',
+                              url_for('contract_standards', contract_id=contract_id), 404)
         
     except RuntimeError as e:
         # Log failure
         activity_logger.log_analysis_failure(contract_id)
         
-        print(f"Runtime error in analyze_contract: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        flash('Could not process the document.', 'error')
-        return redirect(url_for('contract_standards', contract_id=contract_id))
+        logger.exception("Runtime error in analyze_contract: %s", str(e))
+        return _analyze_error('Could not process the document.', 'error',
+                              url_for('contract_standards', contract_id=contract_id), 422)
         
     except Exception as e:
         # Log failure
         activity_logger.log_analysis_failure(contract_id)
         
-        print(f"Unexpected error in analyze_contract: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        flash('Analysis failed; please try again.', 'error')
-        return redirect(url_for('contract_standards', contract_id=contract_id))
+        logger.exception("Unexpected error in analyze_contract: %s", str(e))
+        return _analyze_error('Analysis failed; please try again.', 'error',
+                              url_for('contract_standards', contract_id=contract_id), 500)
         
     finally:
         # Ensure cleanup of temporary file even if error occurs
-        if temp_file_path:
-            try:
-                if Path(temp_file_path).exists():
-                    Path(temp_file_path).unlink()
-            except Exception as cleanup_error:
-                print(f"Warning: Failed to clean up temporary file: {cleanup_error}")
+        _remove_temp_file(temp_file_path)
 
 @app.route('/api/contract/<contract_id>/update-parties', methods=['POST'])
 @login_required
+@json_errors
 def update_contract_parties(contract_id):
     """Update party information in cache and refresh suggestions"""
-    try:
-        print(f"\n=== DEBUG update_contract_parties ===")
-        print(f"Contract ID: {contract_id}")
-        
-        # Get updated party info from request
-        updated_party_info = request.json
-        print(f"Updated party info: {updated_party_info}")
-        
-        # Validate party info structure
-        if not updated_party_info or not updated_party_info.get('found'):
-            return jsonify({'success': False, 'error': 'Invalid party information'}), 400
-        
-        if not updated_party_info.get('party1') or not updated_party_info.get('party2'):
-            return jsonify({'success': False, 'error': 'Missing party data'}), 400
-        
-        # Get existing cache
-        cached_data = analysis_cache.get(contract_id)
-        
-        if not cached_data:
-            return jsonify({'success': False, 'error': 'No analysis found in cache'}), 404
-        
-        # Update party info in cache
-        cached_data['party_info'] = updated_party_info
-        
-        # Save back to cache with same TTL
-        analysis_cache.set(contract_id, cached_data, ttl=1800)
-        
-        print(f"✓ Party info updated in cache for contract {contract_id}")
-        print(f"  Party 1: {updated_party_info['party1']['legal_name']} ({updated_party_info['party1']['role']})")
-        print(f"  Party 2: {updated_party_info['party2']['legal_name']} ({updated_party_info['party2']['role']})")
-        
-        return jsonify({
-            'success': True,
-            'message': 'Party information updated successfully'
-        })
-        
-    except Exception as e:
-        print(f"Error in update_contract_parties: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': str(e)}), 500
+    logger.debug("=== DEBUG update_contract_parties ===")
+    logger.debug("Contract ID: %s", contract_id)
+    
+    # Get updated party info from request
+    updated_party_info = request.json
+    logger.debug("Updated party info: %s", updated_party_info)
+    
+    # Validate party info structure
+    if not updated_party_info or not updated_party_info.get('found'):
+        return jsonify({'success': False, 'error': 'Invalid party information'}), 400
+    
+    if not updated_party_info.get('party1') or not updated_party_info.get('party2'):
+        return jsonify({'success': False, 'error': 'Missing party data'}), 400
+    
+    # Get existing cache
+    cached_data = analysis_cache.get(contract_id)
+    
+    if not cached_data:
+        return jsonify({'success': False, 'error': 'No analysis found in cache'}), 404
+    
+    # Update party info in cache
+    cached_data['party_info'] = updated_party_info
+    
+    # Save back to cache with same TTL
+    analysis_cache.set(contract_id, cached_data, ttl=1800)
+    
+    logger.debug("✓ Party info updated in cache for contract %s", contract_id)
+    logger.debug("  Party 1: %s (%s)", updated_party_info['party1']['legal_name'], updated_party_info['party1']['role'])
+    logger.debug("  Party 2: %s (%s)", updated_party_info['party2']['legal_name'], updated_party_info['party2']['role'])
+    
+    return jsonify({
+        'success': True,
+        'message': 'Party information updated successfully'
+    })
 
 @app.route('/apply_suggestions_new/<contract_id>')
 @login_required
 def apply_suggestions_new(contract_id):
     """Display AI analysis results for contract"""
     try:
-        print(f"\n{'='*60}")
-        print(f"XXXX DEBUG apply_suggestions_new - CODE VERSION 2.0 XXXX")
-        print(f"{'='*60}")
-        print(f"Contract ID: {contract_id}")
+        logger.debug("XXXX DEBUG apply_suggestions_new - CODE VERSION 2.0 XXXX")
+        logger.debug("Contract ID: %s", contract_id)
         
         # Get analysis from cache
         cached_data = analysis_cache.get(contract_id)
         
         if not cached_data:
-            print(f"No cached analysis found for contract {contract_id}")
+            logger.debug("No cached analysis found for contract %s", contract_id)
             flash('No analysis found for this contract.', 'warning')
             return redirect(url_for('contract_standards', contract_id=contract_id))
         
@@ -924,87 +1215,75 @@ def apply_suggestions_new(contract_id):
         grammar_results = cached_data.get('grammar', None)  # Get grammar results from cache
         timestamp = cached_data.get('ts', '')
         
-        print(f"Found cached analysis: {len(analysis_results)} results")
+        logger.debug("Found cached analysis: %s results", len(analysis_results))
         if grammar_results:
-            print(f"Found cached grammar results: {grammar_results.get('error_count', 0)} errors")
-        print(f"[DEBUG PARTY] party_info from cache: {party_info}")
-        print(f"[DEBUG PARTY] party_info type: {type(party_info)}")
-        print(f"[DEBUG PARTY] party_info.get('found'): {party_info.get('found')}")
+            logger.debug("Found cached grammar results: %s errors", grammar_results.get('error_count', 0))
+        logger.debug("[DEBUG PARTY] party_info from cache: %s", party_info)
+        logger.debug("[DEBUG PARTY] party_info type: %s", type(party_info))
+        logger.debug("[DEBUG PARTY] party_info.get('found'): %s", party_info.get('found'))
         if party_info.get('found'):
-            print(f"[DEBUG PARTY] ✓ Party info found in cache!")
-            print(f"[DEBUG PARTY]   - party1: {party_info.get('party1')}")
-            print(f"[DEBUG PARTY]   - party2: {party_info.get('party2')}")
+            logger.debug("[DEBUG PARTY] ✓ Party info found in cache!")
+            logger.debug("[DEBUG PARTY]   - party1: %s", party_info.get('party1'))
+            logger.debug("[DEBUG PARTY]   - party2: %s", party_info.get('party2'))
         else:
-            print(f"[DEBUG PARTY] ✗ Party info NOT found or found=False")
-        
-        # Get contract details from SharePoint
-        from app.services.sharepoint_service import SharePointService
-        sp_service = SharePointService()
-        contract = sp_service.get_contract_by_id(contract_id)
+            logger.debug("[DEBUG PARTY] ✗ Party info NOT found or found=False")
         
-        if not contract:
-            flash('Contract not found.', 'error')
-            return redirect(url_for('dashboard'))
-        
-        contract_name = contract.get('name', 'Unknown Contract')
-        
-        # Build summary items list for template
-        summary_items = []
-        for standard_name in selected_standards:
-            result = analysis_results.get(standard_name, {})
+        # Contract name is cached by analyze; older cache entries fall back to SharePoint
+        contract_name = cached_data.get('contract_name')
+        if not contract_name:
+            sp_service = _sharepoint_service()
+            contract = sp_service.get_contract_by_id(contract_id)
             
-            summary_items.append({
-                'standard': standard_name,
-                'present': result.get('found', False),
-                'excerpt': result.get('excerpt') or 'N/A',
-                'location': result.get('location') or 'N/A',
-                'suggestion': result.get('suggestion') or 'N/A',
-                'source': result.get('source', 'ai')
-            })
+            if not contract:
+                flash('Contract not found.', 'error')
+                return redirect(url_for('dashboard'))
+            
+            contract_name = contract.get('name', 'Unknown Contract')
+        
+        # Summary rows are built at analysis time; older cache entries rebuild them here
+        summary_items = cached_data.get('summary')
+        if summary_items is None:
+            summary_items = _build_summary(analysis_results, selected_standards)
         
-        print(f"\n{'='*70}")
-        print(f"[PARTY REPLACEMENT DEBUG - RESULTS PAGE]")
-        print(f"{'='*70}")
-        print(f"party_info type: {type(party_info)}")
-        print(f"party_info: {party_info}")
-        print(f"party_info.get('found'): {party_info.get('found') if isinstance(party_info, dict) else 'NOT A DICT'}")
+        logger.debug("[PARTY REPLACEMENT DEBUG - RESULTS PAGE]")
+        logger.debug("party_info type: %s", type(party_info))
+        logger.debug("party_info: %s", party_info)
+        logger.debug("party_info.get('found'): %s", party_info.get('found') if isinstance(party_info, dict) else 'NOT A DICT')
         
         # Show first suggestion BEFORE replacement
         first_missing = next((item for item in summary_items if not item['present'] and item['suggestion'] != 'N/A'), None)
         if first_missing:
-            print(f"\nFIRST MISSING STANDARD BEFORE REPLACEMENT:")
-            print(f"  Standard: {first_missing['standard']}")
-            print(f"  Suggestion (first 200 chars): {first_missing['suggestion'][:200]}")
-            print(f"  Contains 'Contractor': {'Contractor' in first_missing['suggestion']}")
-            print(f"  Contains 'Customer': {'Customer' in first_missing['suggestion']}")
+            logger.debug("FIRST MISSING STANDARD BEFORE REPLACEMENT:")
+            logger.debug("  Standard: %s", first_missing['standard'])
+            logger.debug("  Suggestion (first 200 chars): %s", first_missing['suggestion'][:200])
+            logger.debug("  Contains 'Contractor': %s", 'Contractor' in first_missing['suggestion'])
+            logger.debug("  Contains 'Customer': %s", 'Customer' in first_missing['suggestion'])
         
         # Transform suggestions with actual party names
-        from app.utils.party_replacer import transform_suggestions
-        print(f"\nCalling transform_suggestions()...")
+        logger.debug("Calling transform_suggestions()...")
         summary_items = transform_suggestions(summary_items, party_info)
-        print(f"✓ transform_suggestions() returned")
+        logger.debug("✓ transform_suggestions() returned")
         
         # Show first suggestion AFTER replacement
         if first_missing:
             first_missing_after = next((item for item in summary_items if item['standard'] == first_missing['standard']), None)
             if first_missing_after:
-                print(f"\nFIRST MISSING STANDARD AFTER REPLACEMENT:")
-                print(f"  Standard: {first_missing_after['standard']}")
-                print(f"  Suggestion (first 200 chars): {first_missing_after['suggestion'][:200]}")
-                print(f"  Contains 'Contractor': {'Contractor' in first_missing_after['suggestion']}")
-                print(f"  Contains 'Customer': {'Customer' in first_missing_after['suggestion']}")
-                print(f"  Contains 'Phonesuite': {'Phonesuite' in first_missing_after['suggestion']}")
-                print(f"  Contains 'Partner': {'Partner' in first_missing_after['suggestion']}")
-        
-        print(f"{'='*70}\n")
-        
-        print(f"Rendering apply_suggestions with {len(summary_items)} items")
-        print(f"[DEBUG TEMPLATE] About to render template with:")
-        print(f"[DEBUG TEMPLATE]   - contract_id: {contract_id}")
-        print(f"[DEBUG TEMPLATE]   - contract_name: {contract_name}")
-        print(f"[DEBUG TEMPLATE]   - timestamp: {timestamp}")
-        print(f"[DEBUG TEMPLATE]   - party_info: {party_info}")
-        print(f"[DEBUG TEMPLATE]   - party_info['found']: {party_info.get('found')}")
+                logger.debug("FIRST MISSING STANDARD AFTER REPLACEMENT:")
+                logger.debug("  Standard: %s", first_missing_after['standard'])
+                logger.debug("  Suggestion (first 200 chars): %s", first_missing_after['suggestion'][:200])
+                logger.debug("  Contains 'Contractor': %s", 'Contractor' in first_missing_after['suggestion'])
+                logger.debug("  Contains 'Customer': %s", 'Customer' in first_missing_after['suggestion'])
+                logger.debug("  Contains 'Phonesuite': %s", 'Phonesuite' in first_missing_after['suggestion'])
+                logger.debug("  Contains 'Partner': %s", 'Partner' in first_missing_after['suggestion'])
+        
+        
+        logger.debug("Rendering apply_suggestions with %s items", len(summary_items))
+        logger.debug("[DEBUG TEMPLATE] About to render template with:")
+        logger.debug("[DEBUG TEMPLATE]   - contract_id: %s", contract_id)
+        logger.debug("[DEBUG TEMPLATE]   - contract_name: %s", contract_name)
+        logger.debug("[DEBUG TEMPLATE]   - timestamp: %s", timestamp)
+        logger.debug("[DEBUG TEMPLATE]   - party_info: %s", party_info)
+        logger.debug("[DEBUG TEMPLATE]   - party_info['found']: %s", party_info.get('found'))
         
         # Get original AI-detected party info for reset functionality
         original_party_info = cached_data.get('original_party_info', party_info)
@@ -1014,9 +1293,9 @@ def apply_suggestions_new(contract_id):
         user_name = session.get('user_name')
         try:
             result = activity_logger.log_successful_ai_analysis(user_email=user_email, user_display_name=user_name)
-            print(f"[ActivityLogger] Successful AI Analysis log result: {result}")
+            logger.debug("[ActivityLogger] Successful AI Analysis log result: %s", result)
         except Exception as e:
-            print(f"[ActivityLogger] Exception logging Successful AI Analysis: {e}")
+            logger.error("[ActivityLogger] Exception logging Successful AI Analysis: %s", e)
         # Render template with analysis_completed flag and party info
         return render_template(
             'apply_suggestions.html',
@@ -1031,17 +1310,15 @@ def apply_suggestions_new(contract_id):
         )
         
     except Exception as e:
-        print(f"Error in apply_suggestions_new: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in apply_suggestions_new: %s", str(e))
         # Log Failed AI Analysis activity
         user_email = session.get('user_email')
         user_name = session.get('user_name')
         try:
             result = activity_logger.log_failed_ai_analysis(user_email=user_email, user_display_name=user_name)
-            print(f"[ActivityLogger] Failed AI Analysis log result: {result}")
+            logger.debug("[ActivityLogger] Failed AI Analysis log result: %s", result)
         except Exception as log_e:
-            print(f"[ActivityLogger] Exception logging Failed AI Analysis: {log_e}")
+            logger.error("[ActivityLogger] Exception logging Failed AI Analysis: %s", log_e)
         flash('Error loading analysis results.', 'error')
         return redirect(url_for('dashboard'))
 
@@ -1049,9 +1326,7 @@ def apply_suggestions_new(contract_id):
 @login_required
 def apply_suggestions_action(contract_id):
     """Apply selected suggestions to contract and return download URL."""
-    from app.services.sharepoint_service import sharepoint_service
-    from app.services import doc_editor, sp_upload
-    import tempfile
+    sharepoint_service = _sharepoint_service()
     
     try:
         # Parse JSON payload
@@ -1068,27 +1343,24 @@ def apply_suggestions_action(contract_id):
             if 'standard' not in item or 'suggestion' not in item:
                 return jsonify({'error': 'Invalid item structure'}), 400
         
-        print(f"\n{'='*70}")
-        print(f"APPLY SUGGESTIONS: Contract {contract_id}")
-        print(f"{'='*70}")
-        print(f"Applying {len(items)} suggestions to contract {contract_id}")
+        logger.debug("APPLY SUGGESTIONS: Contract %s", contract_id)
+        logger.debug("Applying %s suggestions to contract %s", len(items), contract_id)
         for i, item in enumerate(items[:3]):
-            print(f"  [{i+1}] {item.get('standard', 'N/A')[:40]}...")
+            logger.debug("  [%s] %s...", i+1, item.get('standard', 'N/A')[:40])
         
         # Get party info from cache to replace party terms in suggestions
         cached_data = analysis_cache.get(contract_id)
         party_info = cached_data.get('party_info', {'found': False}) if cached_data else {'found': False}
         
         # Transform suggestions with actual party names before applying to document
-        from app.utils.party_replacer import transform_suggestions
         items = transform_suggestions(items, party_info)
-        print(f"✓ Party terms replaced in suggestions for document")
+        logger.debug("✓ Party terms replaced in suggestions for document")
         
         # Get contract metadata
-        print(f"\nStep 1: Fetching contract metadata...")
+        logger.debug("Step 1: Fetching contract metadata...")
         contract = sharepoint_service.get_contract_by_id(contract_id)
         if not contract:
-            print(f"✗ Contract not found: {contract_id}")
+            logger.error("✗ Contract not found: %s", contract_id)
             return jsonify({'error': 'Contract not found'}), 404
         
         # Store the SharePoint list item ID for later status update
@@ -1099,99 +1371,96 @@ def apply_suggestions_action(contract_id):
         # This is the OriginalFilename_uploaded.docx that was stored during upload
         uploaded_filename = contract.get('file_name', 'contract_uploaded.docx')
         
-        print(f"\n=== DEBUGGING FILENAME FOR EDITED DOC ===")
-        print(f"Uploaded filename from SharePoint: '{uploaded_filename}'")
+        logger.debug("=== DEBUGGING FILENAME FOR EDITED DOC ===")
+        logger.debug("Uploaded filename from SharePoint: '%s'", uploaded_filename)
         
         # Extract the base name without the _uploaded suffix and extension
         # Example: "Phonesuite_1231_uploaded.docx" -> "Phonesuite_1231"
-        import re
-        base_filename = uploaded_filename.rsplit('.', 1)[0] if '.' in uploaded_filename else uploaded_filename
-        
-        # Remove _uploaded, _edited, or _completed suffix if present
-        base_filename = re.sub(r'_(uploaded|edited|completed)$', '', base_filename)
+        base_filename = _contract_base_name(uploaded_filename)
         
-        print(f"Base filename (cleaned): '{base_filename}'")
+        logger.debug("Base filename (cleaned): '%s'", base_filename)
         
         # For edited document, we need the base name with .docx extension
         # The generate_edited_filename function will add "_edited.docx"
         original_doc_name = f"{base_filename}.docx"
         
-        print(f"Final filename for editing: '{original_doc_name}'")
-        print(f"=== END FILENAME DEBUG ===\n")
+        logger.debug("Final filename for editing: '%s'", original_doc_name)
+        logger.debug("=== END FILENAME DEBUG ===")
         
         # Ensure we have just the base name without extension
-        print(f"✓ Contract metadata retrieved")
-        print(f"  SharePoint Item ID: {sharepoint_item_id}")
-        print(f"  Drive ID: {drive_id}")
-        print(f"  Uploaded filename: {uploaded_filename}")
-        print(f"  Base filename for editing: {original_doc_name}")
-        
-        # Download original document
-        print(f"\nStep 2: Downloading original document: {uploaded_filename}")
+        logger.debug("✓ Contract metadata retrieved")
+        logger.debug("  SharePoint Item ID: %s", sharepoint_item_id)
+        logger.debug("  Drive ID: %s", drive_id)
+        logger.debug("  Uploaded filename: %s", uploaded_filename)
+        logger.debug("  Base filename for editing: %s", original_doc_name)
+        
+        # Load the preferred standards (Step 4) in the background while the original downloads
+        standards_future = io_executor.submit(copy_current_request_context(get_preferred_standards))
+        
+        # Download original document, unless this user's analyzed copy is still cached locally
+        logger.debug("Step 2: Downloading original document: %s", uploaded_filename)
         try:
-            doc_path = download_contract(contract_id)
-            doc_size = doc_path.stat().st_size
-            print(f"✓ Downloaded to temp file: {doc_path}")
-            print(f"  File size: {doc_size:,} bytes")
+            doc_path = doc_cache.get(session.get('user_email'), contract_id)
+            if doc_path is not None:
+                logger.debug("✓ Reusing the analyzed copy of the document")
+            else:
+                doc_path = download_contract(contract_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✓ Downloaded to temp file: %s", doc_path)
+                logger.debug("  File size: %s bytes", format(doc_path.stat().st_size, ','))
         except FileNotFoundError:
-            print(f"✗ ERROR: Original document not found")
+            logger.error("✗ Original document not found")
             return jsonify({'error': 'Original document not found'}), 404
         except PermissionError as e:
             if 'SESSION_EXPIRED' in str(e):
-                print(f"✗ ERROR: Session expired")
+                logger.error("✗ Session expired")
                 return jsonify({'error': 'Session expired', 'message': 'Please sign in again'}), 401
             raise
         
         # Use the downloaded temp file directly
-        print(f"\nStep 3: Using downloaded temp file for processing...")
+        logger.debug("Step 3: Using downloaded temp file for processing...")
         original_path = doc_path
-        print(f"✓ Original path ready: {original_path}")
+        logger.debug("✓ Original path ready: %s", original_path)
         
         try:
             # Get all standards for style detection
-            print(f"\nStep 4: Getting preferred standards for style detection...")
+            logger.debug("Step 4: Getting preferred standards for style detection...")
             try:
-                all_standards = get_preferred_standards()
+                all_standards = standards_future.result()
                 known_standard_names = [s['standard'] for s in all_standards if 'standard' in s]
-                print(f"✓ Found {len(known_standard_names)} known standards")
+                logger.debug("✓ Found %s known standards", len(known_standard_names))
             except PermissionError as e:
                 # Token expired - show session expiration message
                 if 'SESSION_EXPIRED' in str(e):
-                    print(f"✗ ERROR: Token expired while loading standards")
+                    logger.error("✗ Token expired while loading standards")
                     return jsonify({'error': 'Session expired', 'message': 'Your session has expired. Please log in again.'}), 401
                 raise
             
             # Apply suggestions to document
-            print(f"\nStep 5: Appending {len(items)} standards to document...")
-            edited_path = doc_editor.append_suggested_standards(
+            logger.debug("Step 5: Appending %s standards to document...", len(items))
+            edited_buffer = doc_editor.append_suggested_standards_to_buffer(
                 original_path,
                 items,
                 known_standards=known_standard_names
             )
-            print(f"✓ Document editing complete")
-            
-            # Read edited content
-            print(f"\nStep 6: Reading edited document...")
-            with open(edited_path, 'rb') as f:
-                edited_content = f.read()
-            print(f"✓ Read {len(edited_content):,} bytes")
+            logger.debug("✓ Document editing complete")
             
-            # Generate edited filename using original document name (without ContractID prefix)
-            edited_filename = sp_upload.generate_edited_filename(original_doc_name)
-            print(f"✓ Generated edited filename: {edited_filename}")
+            # Edited filename from the original document name (without ContractID prefix)
+            edited_filename = _edited_filename(uploaded_filename)
+            logger.debug("✓ Generated edited filename: %s", edited_filename)
             
-            # Upload to SharePoint
-            print(f"\nStep 7: Uploading edited document to SharePoint...")
+            # Upload to SharePoint straight from the in-memory document (no temp file round trip)
+            logger.debug("Step 7: Uploading edited document to SharePoint...")
             try:
                 upload_result = sp_upload.upload_file(
                     drive_id=drive_id,
                     folder_path='',  # Same folder as original (root of ContractFiles)
                     filename=edited_filename,
-                    content=edited_content,
+                    content=edited_buffer,
                     user_email=session.get('user_email'),  # Attribute to user applying suggestions
                     site_id=os.getenv('O365_SITE_ID')  # SharePoint site ID
                 )
-                print(f"✓ Upload successful: {upload_result.get('name')}")
+                logger.debug("✓ Upload successful: %s", upload_result.get('name'))
             except PermissionError as e:
                 # Log failed edited contract upload
                 try:
@@ -1199,9 +1468,9 @@ def apply_suggestions_action(contract_id):
                     user_name = session.get('user_name')
                     activity_logger.log_failed_edited_contract_upload(user_email=user_email, user_display_name=user_name)
                 except Exception as log_err:
-                    print(f"[ActivityLogger] Failed to log failed edited contract upload: {log_err}")
+                    logger.warning("[ActivityLogger] Failed to log failed edited contract upload: %s", log_err)
                 
-                print(f"✗ PermissionError during upload: {e}")
+                logger.error("✗ PermissionError during upload: %s", e)
                 if 'SESSION_EXPIRED' in str(e):
                     return jsonify({'error': 'Session expired', 'message': 'Please sign in again'}), 401
                 raise
@@ -1212,21 +1481,22 @@ def apply_suggestions_action(contract_id):
                     user_name = session.get('user_name')
                     activity_logger.log_failed_edited_contract_upload(user_email=user_email, user_display_name=user_name)
                 except Exception as log_err:
-                    print(f"[ActivityLogger] Failed to log failed edited contract upload: {log_err}")
+                    logger.warning("[ActivityLogger] Failed to log failed edited contract upload: %s", log_err)
                 
-                print(f"✗ UploadError: {str(e)}")
+                logger.error("✗ UploadError: %s", str(e))
                 return jsonify({'error': 'Upload failed', 'message': str(e)}), 502
             
-            # Update status to "Analyzed" in SharePoint (matches SharePoint choice field)
-            print(f"\nStep 8: Updating status to 'Analyzed' for contract {contract_id}...")
+            # Update status to "Analyzed" in SharePoint (matches SharePoint choice field);
+            # only once the upload succeeded, but alongside the activity log write below
+            logger.debug("Step 8: Updating status to 'Analyzed' for contract %s...", contract_id)
+            status_future = None
             if sharepoint_item_id:
-                status_updated = sharepoint_service.update_contract_field(sharepoint_item_id, 'Status', 'Analyzed')
-                if status_updated:
-                    print(f"✓ Status updated to 'Analyzed'")
-                else:
-                    print(f"⚠ Failed to update status (non-critical)")
+                status_future = io_executor.submit(
+                    copy_current_request_context(sharepoint_service.update_contract_field),
+                    sharepoint_item_id, 'Status', 'Analyzed'
+                )
             else:
-                print(f"⚠ SharePoint item ID not available for status update (non-critical)")
+                logger.warning("⚠ SharePoint item ID not available for status update (non-critical)")
             
             # Log successful edited contract upload
             try:
@@ -1234,17 +1504,21 @@ def apply_suggestions_action(contract_id):
                 user_name = session.get('user_name')
                 activity_logger.log_successful_edited_contract_upload(user_email=user_email, user_display_name=user_name)
             except Exception as log_err:
-                print(f"[ActivityLogger] Failed to log successful edited contract upload: {log_err}")
+                logger.warning("[ActivityLogger] Failed to log successful edited contract upload: %s", log_err)
+            
+            if status_future is not None:
+                if status_future.result():
+                    logger.debug("✓ Status updated to 'Analyzed'")
+                else:
+                    logger.warning("⚠ Failed to update status (non-critical)")
             
             # Generate signed download path (relative URL, 5-minute TTL)
             # This allows download even if session expires within the TTL window
-            from app.utils.signed_url import make_signed_path
             download_path = make_signed_path(contract_id, ttl_sec=300)
             
-            print(f"\n✓✓✓ SUCCESS ✓✓✓")
-            print(f"  Standards applied: {len(items)}")
-            print(f"  Download path: {download_path}")
-            print(f"{'='*70}\n")
+            logger.debug("✓✓✓ SUCCESS ✓✓✓")
+            logger.debug("  Standards applied: %s", len(items))
+            logger.debug("  Download path: %s", download_path)
             
             return jsonify({
                 'success': True,
@@ -1254,11 +1528,8 @@ def apply_suggestions_action(contract_id):
             })
         
         finally:
-            # Cleanup temp files
-            if original_path.exists():
-                original_path.unlink()
-            if 'edited_path' in locals() and edited_path.exists():
-                edited_path.unlink()
+            # Cleanup temp file
+            original_path.unlink(missing_ok=True)
     
     except PermissionError as e:
         # Log failed edited contract upload
@@ -1267,7 +1538,7 @@ def apply_suggestions_action(contract_id):
             user_name = session.get('user_name')
             activity_logger.log_failed_edited_contract_upload(user_email=user_email, user_display_name=user_name)
         except Exception as log_err:
-            print(f"[ActivityLogger] Failed to log failed edited contract upload: {log_err}")
+            logger.warning("[ActivityLogger] Failed to log failed edited contract upload: %s", log_err)
         
         if 'SESSION_EXPIRED' in str(e):
             return jsonify({'error': 'Session expired', 'message': 'Please sign in again'}), 401
@@ -1279,11 +1550,9 @@ def apply_suggestions_action(contract_id):
             user_name = session.get('user_name')
             activity_logger.log_failed_edited_contract_upload(user_email=user_email, user_display_name=user_name)
         except Exception as log_err:
-            print(f"[ActivityLogger] Failed to log failed edited contract upload: {log_err}")
+            logger.warning("[ActivityLogger] Failed to log failed edited contract upload: %s", log_err)
         
-        print(f"Error applying suggestions: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error applying suggestions: %s", str(e))
         return jsonify({'error': 'Internal server error', 'message': str(e)}), 500
 
 
@@ -1300,14 +1569,7 @@ def download_edited_contract(contract_id):
         exp: Expiration timestamp (seconds since epoch)
         sig: HMAC-SHA256 signature
     """
-    from flask import send_file, request
-    from io import BytesIO
-    from app.services.sharepoint_service import sharepoint_service
-    from app.utils.signed_url import verify_signed
-    
-    print(f"\n{'='*70}")
-    print(f"DOWNLOAD EDITED: Contract {contract_id}")
-    print(f"{'='*70}")
+    logger.debug("DOWNLOAD EDITED: Contract %s", contract_id)
     
     # Check authentication: session OR signed URL
     authenticated = False
@@ -1320,9 +1582,9 @@ def download_edited_contract(contract_id):
         if verify_signed(contract_id, exp, sig):
             authenticated = True
             auth_method = 'signed_url'
-            print(f"✓ Authenticated via signed URL (expires: {exp})")
+            logger.debug("✓ Authenticated via signed URL (expires: %s)", exp)
         else:
-            print(f"✗ Invalid or expired signed URL")
+            logger.warning("✗ Invalid or expired signed URL")
             return jsonify({'error': 'Invalid or expired download link'}), 403
     
     # Method 2: Check session (fallback)
@@ -1330,68 +1592,72 @@ def download_edited_contract(contract_id):
         if 'user_email' in session:
             authenticated = True
             auth_method = 'session'
-            print(f"✓ Authenticated via session: {session.get('user_email')}")
+            logger.debug("✓ Authenticated via session: %s", session.get('user_email'))
         else:
-            print(f"✗ No authentication provided (no session, no signature)")
+            logger.warning("✗ No authentication provided (no session, no signature)")
             return jsonify({'error': 'Authentication required'}), 401
     
-    print(f"Auth method: {auth_method}")
+    logger.debug("Auth method: %s", auth_method)
     
     try:
-        # Get contract metadata from SharePoint (session-independent)
-        print(f"\nFetching contract metadata from SharePoint...")
-        contract = sharepoint_service.get_contract_by_id(contract_id)
-        if not contract:
-            print(f"✗ ERROR: Contract not found: {contract_id}")
-            return jsonify({'error': 'Contract not found'}), 404
-        
-        # Get original filename and construct edited filename
-        uploaded_filename = contract.get('file_name', 'contract_uploaded.docx')
-        print(f"Original uploaded filename: {uploaded_filename}")
-        
-        # Extract base name and construct edited filename
-        import re
-        base_filename = uploaded_filename.rsplit('.', 1)[0] if '.' in uploaded_filename else uploaded_filename
-        base_filename = re.sub(r'_(uploaded|edited|completed)$', '', base_filename)
-        edited_filename = f"{base_filename}_edited.docx"
-        
-        print(f"Looking for edited file: {edited_filename}")
+        target = edited_download_targets.get(contract_id)
+        if target is None:
+            # Get contract metadata from SharePoint (session-independent)
+            logger.debug("Fetching contract metadata from SharePoint...")
+            contract = _sharepoint_service().get_contract_by_id(contract_id)
+            if not contract:
+                logger.error("✗ Contract not found: %s", contract_id)
+                return jsonify({'error': 'Contract not found'}), 404
+            
+            # Get original filename and construct edited filename
+            uploaded_filename = contract.get('file_name', 'contract_uploaded.docx')
+            logger.debug("Original uploaded filename: %s", uploaded_filename)
+            
+            target = {
+                'filename': _edited_filename(uploaded_filename),
+                'drive_id': contract.get('DriveId') or os.getenv('DRIVE_ID')
+            }
+            edited_download_targets.set(contract_id, target, ttl=EDITED_DOWNLOAD_TTL_SECONDS)
         
-        drive_id = contract.get('DriveId') or os.getenv('DRIVE_ID')
-        print(f"Drive ID: {drive_id}")
+        edited_filename = target['filename']
+        drive_id = target['drive_id']
+        logger.debug("Looking for edited file: %s", edited_filename)
+        logger.debug("Drive ID: %s", drive_id)
         
         # Download edited file from SharePoint
-        print(f"\nDownloading edited file from SharePoint...")
+        logger.debug("Downloading edited file from SharePoint...")
         try:
-            from app.services.sp_download import download_contract_by_filename
-            content = download_contract_by_filename(drive_id, edited_filename)
-            print(f"✓ Downloaded {len(content):,} bytes")
+            graph_response = stream_contract_by_filename(drive_id, edited_filename)
         except FileNotFoundError:
-            print(f"✗ ERROR: Edited file not found in SharePoint")
+            logger.error("✗ Edited file not found in SharePoint")
             return jsonify({
                 'error': 'Edited file not found',
                 'message': 'The edited document may not have been created yet. Please try applying suggestions again.'
             }), 404
         except PermissionError as e:
-            print(f"✗ ERROR: Permission denied - {e}")
+            logger.error("✗ Permission denied - %s", e)
             if 'SESSION_EXPIRED' in str(e):
                 return jsonify({'error': 'Session expired', 'message': 'Please sign in again'}), 401
             raise
         
-        # Send file as attachment
-        print(f"✓ Sending file to user: {edited_filename}")
-        print(f"{'='*70}\n")
-        return send_file(
-            BytesIO(content),
-            mimetype='application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        # Stream the Graph body straight through as the attachment (no in-memory copy)
+        logger.debug("✓ Streaming file to user: %s", edited_filename)
+        graph_response.raw.decode_content = True
+        response = send_file(
+            graph_response.raw,
+            mimetype=sp_upload.DOCX_MIMETYPE,
             as_attachment=True,
             download_name=edited_filename
         )
+        # Pass Graph's length through so the browser can show download progress
+        # (only when the body isn't content-encoded, since decoding changes its size)
+        content_length = graph_response.headers.get('Content-Length')
+        if content_length and 'Content-Encoding' not in graph_response.headers:
+            response.content_length = int(content_length)
+        return response
     
     except Exception as e:
-        print(f"Error downloading edited contract: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error downloading edited contract: %s", str(e))
         return jsonify({'error': 'Download failed', 'message': str(e)}), 500
 
 @app.route('/contracts/<contract_id>/open_word_url')
@@ -1414,13 +1680,8 @@ def get_word_open_url(contract_id):
             'filename': 'Contract_edited.docx'
         }
     """
-    from flask import request, jsonify
-    from app.utils.signed_url import verify_signed
-    from app.services.sp_download import get_file_metadata_by_filename
     
-    print(f"\n{'='*70}")
-    print(f"GET WORD OPEN URL: Contract {contract_id}")
-    print(f"{'='*70}")
+    logger.debug("GET WORD OPEN URL: Contract %s", contract_id)
     
     # Check authentication: session OR signed URL
     authenticated = False
@@ -1433,55 +1694,51 @@ def get_word_open_url(contract_id):
         if verify_signed(contract_id, exp, sig):
             authenticated = True
             auth_method = "signed_url"
-            print(f"✓ Authenticated via signed_url (expires: {exp})")
+            logger.debug("✓ Authenticated via signed_url (expires: %s)", exp)
     
     # Method 2: Check session
     if not authenticated and session.get('access_token'):
         authenticated = True
         auth_method = "session"
-        print(f"✓ Authenticated via session")
+        logger.debug("✓ Authenticated via session")
     
     if not authenticated:
-        print(f"✗ ERROR: Unauthorized access attempt")
+        logger.warning("✗ Unauthorized access attempt")
         return jsonify({'error': 'Unauthorized'}), 401
     
-    print(f"Auth method: {auth_method}")
+    logger.debug("Auth method: %s", auth_method)
     
     try:
         # Get contract from SharePoint
-        print(f"\nFetching contract metadata from SharePoint...")
+        logger.debug("Fetching contract metadata from SharePoint...")
         contract = get_contract_by_id(contract_id)
         if not contract:
-            print(f"✗ ERROR: Contract not found: {contract_id}")
+            logger.error("✗ Contract not found: %s", contract_id)
             return jsonify({'error': 'Contract not found'}), 404
         
         # Get original filename and construct edited filename (same logic as download_edited)
         uploaded_filename = contract.get('file_name', 'contract_uploaded.docx')
-        print(f"Original uploaded filename: {uploaded_filename}")
+        logger.debug("Original uploaded filename: %s", uploaded_filename)
         
-        # Extract base name and construct edited filename
-        import re
-        base_filename = uploaded_filename.rsplit('.', 1)[0] if '.' in uploaded_filename else uploaded_filename
-        base_filename = re.sub(r'_(uploaded|edited|completed)$', '', base_filename)
-        edited_filename = f"{base_filename}_edited.docx"
+        edited_filename = _edited_filename(uploaded_filename)
         
-        print(f"Looking for edited file: {edited_filename}")
+        logger.debug("Looking for edited file: %s", edited_filename)
         
         drive_id = contract.get('DriveId') or os.getenv('DRIVE_ID')
-        print(f"Drive ID: {drive_id}")
+        logger.debug("Drive ID: %s", drive_id)
         
         # Get file metadata (including webUrl) from SharePoint
-        print(f"\nFetching file metadata from SharePoint...")
+        logger.debug("Fetching file metadata from SharePoint...")
         try:
             metadata = get_file_metadata_by_filename(drive_id, edited_filename)
         except FileNotFoundError:
-            print(f"✗ ERROR: Edited file not found in SharePoint")
+            logger.error("✗ Edited file not found in SharePoint")
             return jsonify({
                 'error': 'Edited file not found',
                 'message': 'The edited document may not have been created yet. Please try applying suggestions again.'
             }), 404
         except PermissionError as e:
-            print(f"✗ ERROR: Permission denied - {e}")
+            logger.error("✗ Permission denied - %s", e)
             if 'SESSION_EXPIRED' in str(e):
                 return jsonify({'error': 'Session expired', 'message': 'Please sign in again'}), 401
             raise
@@ -1489,19 +1746,18 @@ def get_word_open_url(contract_id):
         # Extract SharePoint webUrl
         web_url = metadata.get('webUrl', '')
         if not web_url:
-            print(f"✗ ERROR: No webUrl in metadata")
+            logger.error("✗ No webUrl in metadata")
             return jsonify({'error': 'File URL not available'}), 500
         
-        print(f"✓ Got SharePoint webUrl")
+        logger.debug("✓ Got SharePoint webUrl")
         
         # Construct Word protocol URL: ms-word:ofe|u|{sharepoint_url}
         word_url = f"ms-word:ofe|u|{web_url}"
         
-        print(f"\n✓✓✓ SUCCESS ✓✓✓")
-        print(f"  WebUrl: {web_url[:80]}...")
-        print(f"  WordUrl: {word_url[:80]}...")
-        print(f"  Filename: {edited_filename}")
-        print(f"{'='*70}\n")
+        logger.debug("✓✓✓ SUCCESS ✓✓✓")
+        logger.debug("  WebUrl: %s...", web_url[:80])
+        logger.debug("  WordUrl: %s...", word_url[:80])
+        logger.debug("  Filename: %s", edited_filename)
         
         return jsonify({
             'success': True,
@@ -1511,9 +1767,7 @@ def get_word_open_url(contract_id):
         })
     
     except Exception as e:
-        print(f"Error getting Word open URL: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error getting Word open URL: %s", str(e))
         return jsonify({'error': 'Failed to get Word URL', 'message': str(e)}), 500
 
 if __name__ == '__main__':
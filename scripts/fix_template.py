@@ -0,0 +1,24 @@
+# Fix render_template party_info parameter
+from pathlib import Path
+
+MAIN_PY = Path(__file__).resolve().parent.parent / 'main.py'
+
+
+def main():
+    with open(MAIN_PY, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    # Fix the malformed render_template call
+    content = content.replace(
+        "        ,`n            party_info=party_info`n        )",
+        ",\n            party_info=party_info\n        )"
+    )
+
+    with open(MAIN_PY, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+    print("✓ Fixed render_template party_info parameter")
+
+
+if __name__ == '__main__':
+    main()
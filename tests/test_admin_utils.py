@@ -0,0 +1,226 @@
+"""
+Unit tests for admin_utils module.
+Tests the SharePoint admin list lookup with mocked Graph API calls.
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from flask import Flask
+
+from app.cache import TTLCache
+from app.utils import admin_utils
+
+
+@pytest.fixture
+def app():
+    """Minimal Flask app carrying the admin list configuration."""
+    flask_app = Flask(__name__)
+    flask_app.config['SP_ADMIN_LIST_ID'] = 'admin-list-id'
+    flask_app.config['SP_ADMIN_EMAIL_COLUMN'] = 'Email'
+    flask_app.config['SP_ADMIN_ACTIVE_COLUMN'] = 'Active'
+    with flask_app.app_context():
+        yield flask_app
+
+
+def _batch_response(responses, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = {'responses': responses}
+    response.text = ''
+    return response
+
+
+def _graph_response(items, status_code=200):
+    """$batch reply answering a single admin list query."""
+    return _batch_response([{'id': '0', 'status': 200, 'body': {'value': items}}], status_code)
+
+
+@pytest.fixture(autouse=True)
+def clear_admin_cache():
+    """Start every test with an empty admin status cache."""
+    with patch.object(admin_utils, '_admin_cache', TTLCache()):
+        yield
+
+
+@pytest.fixture
+def graph():
+    """Patch token/site lookups and the admin list $batch query."""
+    with patch.object(admin_utils, '_get_access_token', return_value='app-token'), \
+         patch.object(admin_utils, '_get_site_id', return_value='site-id'), \
+         patch.object(admin_utils._http, 'post') as mock_post:
+        yield mock_post
+
+
+class TestIsAdmin:
+    """Test suite for is_admin."""
+
+    def test_active_admin(self, app, graph):
+        graph.return_value = _graph_response([{'fields': {'Email': 'Admin@Example.com', 'Active': True}}])
+        assert admin_utils.is_admin('admin@example.com') is True
+
+    def test_inactive_admin(self, app, graph):
+        graph.return_value = _graph_response([{'fields': {'Email': 'admin@example.com', 'Active': 'No'}}])
+        assert admin_utils.is_admin('admin@example.com') is False
+
+    def test_not_in_list(self, app, graph):
+        graph.return_value = _graph_response([])
+        assert admin_utils.is_admin('user@example.com') is False
+
+    def test_filters_server_side(self, app, graph):
+        graph.return_value = _graph_response([])
+        admin_utils.is_admin("o'brien@example.com")
+
+        [sub_request] = graph.call_args.kwargs['json']['requests']
+        assert "$filter=fields/Email%20eq%20%27o%27%27brien%40example.com%27" in sub_request['url']
+        assert sub_request['headers']['Prefer'] == 'HonorNonIndexedQueriesWarningMayFailRandomly'
+        assert graph.call_args.kwargs['timeout'] == admin_utils.GRAPH_TIMEOUT_SECONDS
+
+    def test_graph_error(self, app, graph):
+        graph.return_value = _graph_response([], status_code=500)
+        assert admin_utils.is_admin('admin@example.com') is False
+
+    def test_result_cached_per_email(self, app, graph):
+        graph.return_value = _graph_response([{'fields': {'Email': 'admin@example.com', 'Active': True}}])
+        assert admin_utils.is_admin('admin@example.com') is True
+        assert admin_utils.is_admin('ADMIN@example.com') is True
+        graph.assert_called_once()
+
+    def test_errors_not_cached(self, app, graph):
+        graph.return_value = _graph_response([], status_code=500)
+        admin_utils.is_admin('admin@example.com')
+        graph.return_value = _graph_response([{'fields': {'Email': 'admin@example.com', 'Active': True}}])
+        assert admin_utils.is_admin('admin@example.com') is True
+        assert graph.call_count == 2
+
+    def test_no_email(self, app, graph):
+        assert admin_utils.is_admin('') is False
+        graph.assert_not_called()
+
+    def test_clear_forces_recheck(self, app, graph):
+        graph.return_value = _graph_response([{'fields': {'Email': 'admin@example.com', 'Active': True}}])
+        admin_utils.is_admin('admin@example.com')
+        admin_utils.clear_admin_cache()
+        admin_utils.is_admin('admin@example.com')
+        assert graph.call_count == 2
+
+
+class TestAdminRequired:
+    """Test suite for the admin_required decorator."""
+
+    @pytest.fixture
+    def client(self, app, graph):
+        app.secret_key = 'test-secret'
+        app.add_url_rule('/login', 'auth.login', lambda: 'login')
+        app.add_url_rule('/', 'index', lambda: 'index')
+        app.add_url_rule('/admin', 'admin', admin_utils.admin_required(lambda: 'admin page'))
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess.update(access_token='tok', user_email='admin@example.com',
+                        is_admin=True, admin_check_email='admin@example.com')
+        return client
+
+    def test_cached_admin_allowed(self, client, graph):
+        graph.return_value = _graph_response([{'fields': {'Email': 'admin@example.com', 'Active': True}}])
+        assert client.get('/admin').data == b'admin page'
+        assert client.get('/admin').data == b'admin page'
+        graph.assert_called_once()
+
+    def test_revocation_applies_after_cache_clear(self, client, graph):
+        graph.return_value = _graph_response([{'fields': {'Email': 'admin@example.com', 'Active': True}}])
+        assert client.get('/admin').status_code == 200
+
+        graph.return_value = _graph_response([{'fields': {'Email': 'admin@example.com', 'Active': False}}])
+        admin_utils.clear_admin_cache()
+        assert client.get('/admin').status_code == 302
+        with client.session_transaction() as sess:
+            assert sess['is_admin'] is False
+
+
+class TestTokenAndSiteCaching:
+    """Test suite for the cached app token and site ID lookups."""
+
+    @pytest.fixture(autouse=True)
+    def reset_caches(self):
+        with patch.object(admin_utils, '_msal_app', None), \
+             patch.dict(admin_utils._token_cache, {'token': None, 'exp': 0}), \
+             patch.dict(admin_utils._site_id_cache, clear=True), \
+             patch.dict('os.environ', {
+                 'O365_CLIENT_ID': 'client', 'O365_CLIENT_SECRET': 'secret', 'O365_TENANT_ID': 'tenant'
+             }):
+            yield
+
+    def test_token_reused_until_near_expiry(self):
+        with patch.object(admin_utils.msal, 'ConfidentialClientApplication') as mock_cca, \
+             patch.object(admin_utils.time, 'time', return_value=1000):
+            mock_cca.return_value.acquire_token_for_client.return_value = {
+                'access_token': 'tok-1', 'expires_in': 3600
+            }
+            assert admin_utils._get_access_token() == 'tok-1'
+            assert admin_utils._get_access_token() == 'tok-1'
+
+            mock_cca.assert_called_once()
+            mock_cca.return_value.acquire_token_for_client.assert_called_once()
+
+    def test_token_refreshed_near_expiry(self):
+        with patch.object(admin_utils.msal, 'ConfidentialClientApplication') as mock_cca, \
+             patch.object(admin_utils.time, 'time', return_value=1000) as mock_time:
+            acquire = mock_cca.return_value.acquire_token_for_client
+            acquire.return_value = {'access_token': 'tok-1', 'expires_in': 3600}
+            admin_utils._get_access_token()
+
+            mock_time.return_value = 1000 + 3600 - 30
+            acquire.return_value = {'access_token': 'tok-2', 'expires_in': 3600}
+            assert admin_utils._get_access_token() == 'tok-2'
+            assert acquire.call_count == 2
+            mock_cca.assert_called_once()
+
+    def test_site_id_cached(self):
+        with patch.object(admin_utils._http, 'get') as mock_get:
+            mock_get.return_value = MagicMock(status_code=200, json=MagicMock(return_value={'id': 'site-1'}))
+            assert admin_utils._get_site_id('tok') == 'site-1'
+            assert admin_utils._get_site_id('tok') == 'site-1'
+            mock_get.assert_called_once()
+
+
+class TestIsAdminBatch:
+    """Test suite for is_admin_graph."""
+
+    def test_one_round_trip_for_several_emails(self, app, graph):
+        graph.return_value = _batch_response([
+            {'id': '0', 'status': 200, 'body': {'value': [{'fields': {'Active': True}}]}},
+            {'id': '1', 'status': 200, 'body': {'value': []}},
+        ])
+        result = admin_utils.is_admin_batch(['a@example.com', "o'b@example.com"])
+
+        assert result == {'a@example.com': True, "o'b@example.com": False}
+        graph.assert_called_once()
+        requests_sent = graph.call_args.kwargs['json']['requests']
+        assert [r['id'] for r in requests_sent] == ['0', '1']
+        assert "fields/Email%20eq%20%27o%27%27b%40example.com%27" in requests_sent[1]['url']
+        assert requests_sent[1]['headers']['Prefer'] == 'HonorNonIndexedQueriesWarningMayFailRandomly'
+
+    def test_chunks_at_batch_limit(self, app, graph):
+        emails = [f'user{i}@example.com' for i in range(admin_utils.GRAPH_BATCH_LIMIT + 5)]
+        graph.side_effect = lambda *args, **kwargs: _batch_response([
+            {'id': r['id'], 'status': 200, 'body': {'value': []}} for r in kwargs['json']['requests']
+        ])
+        result = admin_utils.is_admin_batch(emails)
+
+        assert graph.call_count == 2
+        assert result == {email: False for email in emails}
+
+    def test_uses_and_fills_cache(self, app, graph):
+        graph.return_value = _graph_response([{'fields': {'Email': 'a@example.com', 'Active': True}}])
+        admin_utils.is_admin('a@example.com')
+        graph.return_value = _graph_response([{'fields': {'Active': 'Yes'}}])
+
+        assert admin_utils.is_admin_batch(['A@example.com', 'b@example.com']) == {
+            'A@example.com': True, 'b@example.com': True
+        }
+        assert len(graph.call_args.kwargs['json']['requests']) == 1
+        assert admin_utils.is_admin('b@example.com') is True
+        assert graph.call_count == 2
+
+    def test_failed_sub_request_not_cached(self, app, graph):
+        graph.return_value = _batch_response([{'id': '0', 'status': 429, 'body': {}}])
+        assert admin_utils.is_admin_batch(['a@example.com']) == {'a@example.com': False}
+        assert admin_utils._admin_cache.get('a@example.com') is None
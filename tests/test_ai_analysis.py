@@ -6,9 +6,12 @@ import pytest
 from unittest.mock import patch, MagicMock, Mock
 from flask import session, Flask
 from datetime import datetime
+import io
 import tempfile
 import os
 
+from app.services import doc_cache
+
 
 @pytest.fixture
 def app():
@@ -44,7 +47,7 @@ class TestAnalyzeContract:
     
     def test_empty_standards_returns_400_with_flash(self, authenticated_session):
         """Test that submitting no standards returns 400 and flashes warning."""
-        with patch('main.download_contract') as mock_download:
+        with patch('main.download_contract_content') as mock_download:
             # POST with no standards selected
             response = authenticated_session.post(
                 '/contract/TEST-001/analyze',
@@ -81,7 +84,7 @@ class TestAnalyzeContract:
     
     def test_expired_token_redirects_to_login_with_flash(self, authenticated_session):
         """Test that expired/invalid token redirects to login with flash message."""
-        with patch('main.download_contract') as mock_download:
+        with patch('main.download_contract_content') as mock_download:
             # Mock download_contract to raise PermissionError with SESSION_EXPIRED
             mock_download.side_effect = PermissionError('SESSION_EXPIRED')
             
@@ -101,7 +104,7 @@ class TestAnalyzeContract:
     
     def test_download_404_flashes_not_found_and_redirects(self, authenticated_session):
         """Test that FileNotFoundError flashes 'not found' and redirects back."""
-        with patch('main.download_contract') as mock_download:
+        with patch('main.download_contract_content') as mock_download:
             # Mock download_contract to raise FileNotFoundError
             mock_download.side_effect = FileNotFoundError('Contract file not found')
             
@@ -121,13 +124,13 @@ class TestAnalyzeContract:
     
     def test_extractor_raises_flashes_could_not_process(self, authenticated_session):
         """Test that RuntimeError from extractor flashes 'Could not process' and redirects."""
-        with patch('main.download_contract') as mock_download, \
+        with patch('main.download_contract_content') as mock_download, \
              patch('main.extract_text') as mock_extract:
             
             # Mock successful download
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
             temp_file.close()
-            mock_download.return_value = temp_file.name
+            mock_download.return_value = (open(temp_file.name, 'rb'), '.pdf')
             
             # Mock extract_text to raise RuntimeError
             mock_extract.side_effect = RuntimeError('PDF parsing failed')
@@ -155,7 +158,7 @@ class TestAnalyzeContract:
         """
         Test happy path: successful analysis populates cache and redirects to apply_suggestions_new.
         """
-        with patch('main.download_contract') as mock_download, \
+        with patch('main.download_contract_content') as mock_download, \
              patch('main.extract_text') as mock_extract, \
              patch('main.get_preferred_standards') as mock_get_standards, \
              patch('main.run_analysis') as mock_run_analysis, \
@@ -164,7 +167,7 @@ class TestAnalyzeContract:
             # Mock successful download
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
             temp_file.close()
-            mock_download.return_value = temp_file.name
+            mock_download.return_value = (open(temp_file.name, 'rb'), '.docx')
             
             # Mock successful text extraction
             mock_extract.return_value = "This is the contract text with an indemnification clause."
@@ -235,7 +238,7 @@ class TestApplySuggestionsNew:
     def test_renders_with_correct_present_missing_counts(self, authenticated_session):
         """Test that GET renders rows with correct present/missing counts from cache."""
         with patch('main.analysis_cache') as mock_cache, \
-             patch('app.services.sharepoint_service.SharePointService') as mock_sp_class:
+             patch('app.services.sharepoint_service.get_sharepoint_service') as mock_get_sp:
             
             # Mock cache data
             cached_data = {
@@ -282,7 +285,7 @@ class TestApplySuggestionsNew:
                 'name': 'Test Contract.docx',
                 'contract_id': 'TEST-001'
             }
-            mock_sp_class.return_value = mock_sp_instance
+            mock_get_sp.return_value = mock_sp_instance
             
             # GET the results page
             response = authenticated_session.get('/apply_suggestions_new/TEST-001')
@@ -342,7 +345,7 @@ class TestCustomStandardsParsing:
     
     def test_custom_standards_parsing_from_comma_separated(self, authenticated_session):
         """Test that custom standards are correctly parsed from comma-separated input."""
-        with patch('main.download_contract') as mock_download, \
+        with patch('main.download_contract_content') as mock_download, \
              patch('main.extract_text') as mock_extract, \
              patch('main.get_preferred_standards') as mock_get_standards, \
              patch('main.run_analysis') as mock_run_analysis, \
@@ -351,7 +354,7 @@ class TestCustomStandardsParsing:
             # Mock successful flow
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
             temp_file.close()
-            mock_download.return_value = temp_file.name
+            mock_download.return_value = (open(temp_file.name, 'rb'), '.pdf')
             mock_extract.return_value = "Contract text"
             mock_get_standards.return_value = {}
             mock_run_analysis.return_value = {}
@@ -387,9 +390,24 @@ class TestCustomStandardsParsing:
 class TestErrorHandling:
     """Test suite for various error scenarios."""
     
+    def test_oversized_upload_rejected_as_json(self, app, authenticated_session):
+        """Bodies over MAX_CONTENT_LENGTH get a JSON 413 before the form is parsed."""
+        with patch.dict(app.config, {'MAX_CONTENT_LENGTH': 1024 * 1024}):
+            response = authenticated_session.post(
+                '/api/upload-completed-contract',
+                data=b'x' * (1024 * 1024 + 1),
+                content_type='application/octet-stream'
+            )
+        
+        assert response.status_code == 413
+        assert response.get_json() == {
+            'success': False,
+            'message': 'File is too large. Maximum upload size is 1 MB.'
+        }
+    
     def test_general_exception_flashes_and_redirects(self, authenticated_session):
         """Test that unexpected exceptions flash error and redirect."""
-        with patch('main.download_contract') as mock_download:
+        with patch('main.download_contract_content') as mock_download:
             # Mock unexpected exception
             mock_download.side_effect = ValueError('Unexpected error occurred')
             
@@ -409,7 +427,7 @@ class TestErrorHandling:
     
     def test_permission_error_without_session_expired(self, authenticated_session):
         """Test that PermissionError without SESSION_EXPIRED shows permission message."""
-        with patch('main.download_contract') as mock_download:
+        with patch('main.download_contract_content') as mock_download:
             # Mock permission error without SESSION_EXPIRED
             mock_download.side_effect = PermissionError('Access denied')
             
@@ -433,7 +451,7 @@ class TestCacheIntegration:
     
     def test_cache_stores_correct_structure(self, authenticated_session):
         """Test that cache stores results, selected standards, and timestamp."""
-        with patch('main.download_contract') as mock_download, \
+        with patch('main.download_contract_content') as mock_download, \
              patch('main.extract_text') as mock_extract, \
              patch('main.get_preferred_standards') as mock_get_standards, \
              patch('main.run_analysis') as mock_run_analysis, \
@@ -442,7 +460,7 @@ class TestCacheIntegration:
             # Setup mocks
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
             temp_file.close()
-            mock_download.return_value = temp_file.name
+            mock_download.return_value = (open(temp_file.name, 'rb'), '.docx')
             mock_extract.return_value = "Contract text"
             mock_get_standards.return_value = {}
             
@@ -476,16 +494,44 @@ class TestCacheIntegration:
                 assert 'ts' in cache_data
                 assert cache_data['results'] == analysis_results
                 assert cache_data['selected'] == ['Standard 1', 'Standard 2']
+                assert [item['standard'] for item in cache_data['summary']] == ['Standard 1', 'Standard 2']
                 assert ttl == 1800  # 30 minutes
                 
             finally:
                 if os.path.exists(temp_file.name):
                     os.unlink(temp_file.name)
     
+    def test_analyzed_document_kept_for_apply(self, authenticated_session):
+        """The downloaded contract is cached per user so the apply step can skip the download."""
+        with patch('main.download_contract_content') as mock_download, \
+             patch('main.extract_text', return_value="Contract text"), \
+             patch('main.get_preferred_standards_dict', return_value={}), \
+             patch('main.run_analysis', return_value={'standards': {}, 'grammar': None}), \
+             patch('main.detect_contract_parties', return_value={'found': False}), \
+             patch('main.analysis_cache'), \
+             patch('main._sharepoint_service'), \
+             patch('main.activity_logger'):
+            mock_download.return_value = (io.BytesIO(b'original docx bytes'), '.docx')
+            
+            try:
+                response = authenticated_session.post(
+                    '/contract/TEST-001/analyze',
+                    data={'standards': ['Standard 1']},
+                    follow_redirects=False
+                )
+                
+                assert response.status_code == 302
+                cached_doc = doc_cache.get('test@example.com', 'TEST-001')
+                assert cached_doc.read_bytes() == b'original docx bytes'
+                cached_doc.unlink()
+                assert doc_cache.get('someone-else@example.com', 'TEST-001') is None
+            finally:
+                doc_cache.clear()
+    
     def test_cache_retrieval_in_apply_suggestions(self, authenticated_session):
         """Test that apply_suggestions_new correctly retrieves from cache."""
         with patch('main.analysis_cache') as mock_cache, \
-             patch('app.services.sharepoint_service.SharePointService') as mock_sp_class:
+             patch('app.services.sharepoint_service.get_sharepoint_service') as mock_get_sp:
             
             # Mock cache data
             cached_data = {
@@ -508,7 +554,7 @@ class TestCacheIntegration:
             mock_sp_instance.get_contract_by_id.return_value = {
                 'name': 'Test.docx'
             }
-            mock_sp_class.return_value = mock_sp_instance
+            mock_get_sp.return_value = mock_sp_instance
             
             response = authenticated_session.get('/apply_suggestions_new/TEST-001')
             
@@ -519,6 +565,20 @@ class TestCacheIntegration:
             assert response.status_code == 200
 
 
+class TestTimestampFilter:
+    """Test suite for the ts_to_iso template filter."""
+    
+    def test_formats_nanosecond_timestamp_as_utc_iso(self, app):
+        """Epoch-nanosecond timestamps render in the same format utcnow().isoformat() used to."""
+        ts_to_iso = app.jinja_env.filters['ts_to_iso']
+        assert ts_to_iso(1762855200_123456000) == '2025-11-11T10:00:00.123456'
+    
+    def test_iso_string_from_older_cache_entry_passes_through(self, app):
+        """Cache entries written before the change still hold an ISO string."""
+        ts_to_iso = app.jinja_env.filters['ts_to_iso']
+        assert ts_to_iso('2025-11-11T10:00:00') == '2025-11-11T10:00:00'
+
+
 # Run tests with: pytest tests/test_ai_analysis.py -v
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '-s'])
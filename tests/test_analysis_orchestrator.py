@@ -0,0 +1,73 @@
+"""
+Unit tests for analysis_orchestrator module.
+Tests the concurrent per-standard analysis with a mocked LLM client.
+"""
+import threading
+import time
+from unittest.mock import patch
+
+from app.services.analysis_orchestrator import analyze_contract
+
+
+def _fake_analyze(text, standard):
+    time.sleep(0.05)
+    return {'found': standard == 'Notices', 'excerpt': None, 'location': None, 'suggestion': f'AI {standard}'}
+
+
+class TestAnalyzeContract:
+    """Test suite for analyze_contract standards fan-out."""
+
+    def test_results_keep_standard_order_and_sources(self):
+        standards = ['Indemnification', 'Notices', 'Custom Term']
+        preferred = {'Indemnification': 'SP clause', 'Notices': 'SP notices'}
+
+        with patch('app.services.llm_client.analyze_standard', side_effect=_fake_analyze):
+            output = analyze_contract('contract text', standards, preferred, check_grammar=False)
+
+        results = output['standards']
+        assert list(results) == standards
+        assert results['Indemnification']['suggestion'] == 'SP clause'
+        assert results['Indemnification']['source'] == 'sharepoint'
+        assert results['Notices']['source'] == 'sharepoint'
+        assert results['Custom Term'] == {**_fake_analyze('', 'Custom Term'), 'source': 'ai'}
+
+    def test_standards_analyzed_concurrently(self):
+        threads = set()
+
+        def record_thread(text, standard):
+            threads.add(threading.get_ident())
+            return _fake_analyze(text, standard)
+
+        with patch('app.services.llm_client.analyze_standard', side_effect=record_thread):
+            analyze_contract('contract text', [f'Standard {i}' for i in range(6)], {}, check_grammar=False)
+
+        assert len(threads) > 1
+
+    def test_failed_standard_falls_back(self):
+        with patch('app.services.llm_client.analyze_standard', side_effect=RuntimeError('boom')):
+            output = analyze_contract('contract text', ['Notices', 'Custom'], {'Notices': 'SP notices'},
+                                      check_grammar=False)
+
+        assert output['standards']['Notices']['suggestion'] == 'SP notices'
+        assert output['standards']['Custom']['source'] == 'error'
+
+    def test_grammar_checked_alongside_standards(self):
+        events = []
+
+        def slow_grammar(text, max_words):
+            events.append('grammar start')
+            time.sleep(0.1)
+            events.append('grammar end')
+            return '[{"error_text": "teh", "suggestion": "the"}]'
+
+        def record_standard(text, standard):
+            events.append('standard')
+            return _fake_analyze(text, standard)
+
+        with patch('app.services.llm_client.analyze_standard', side_effect=record_standard), \
+             patch('app.services.llm_client.check_grammar', side_effect=slow_grammar):
+            output = analyze_contract('contract text', ['Notices'], {})
+
+        assert events.index('standard') < events.index('grammar end')
+        assert output['grammar']['grammar_count'] == 1
+        assert output['grammar']['errors'][0]['error_text'] == 'teh'
@@ -141,6 +141,22 @@ class TestAppendSuggestedStandards(unittest.TestCase):
         # Cleanup
         result_path.unlink()
     
+    def test_append_to_buffer_matches_file_output(self):
+        """Should produce the same edited document in memory, rewound for upload."""
+        buffer = doc_editor.append_suggested_standards_to_buffer(
+            self.temp_path,
+            self.items
+        )
+        
+        self.assertEqual(buffer.tell(), 0)
+        doc = Document(buffer)
+        text = ' '.join([p.text for p in doc.paragraphs])
+        
+        self.assertIn('Appendix — Suggested Standards', text)
+        for item in self.items:
+            self.assertIn(item['standard'], text)
+            self.assertIn(item['suggestion'], text)
+    
     def test_file_not_found_raises(self):
         """Should raise FileNotFoundError for missing file."""
         fake_path = Path('/nonexistent/file.docx')
@@ -170,7 +186,7 @@ class TestSpUpload(unittest.TestCase):
         self.app = app
         self.app.config['TESTING'] = True
     
-    @patch('app.services.sp_upload.requests.put')
+    @patch('app.services.sp_upload.http_session.put')
     def test_upload_success(self, mock_put):
         """Should upload file successfully."""
         with self.app.test_request_context():
@@ -192,6 +208,23 @@ class TestSpUpload(unittest.TestCase):
             self.assertEqual(result['id'], '123')
             self.assertEqual(result['name'], 'test.docx')
     
+    @patch('app.services.sp_upload.http_session.put')
+    def test_upload_streams_file_object(self, mock_put):
+        """Should pass a file object straight through as the request body."""
+        with self.app.test_request_context():
+            from flask import session
+            session['access_token'] = 'fake_token'
+            
+            mock_response = Mock()
+            mock_response.status_code = 201
+            mock_response.json.return_value = {'id': '123', 'name': 'test.docx'}
+            mock_put.return_value = mock_response
+            
+            content = BytesIO(b'fake content')
+            sp_upload.upload_file('drive123', '', 'test.docx', content)
+            
+            self.assertIs(mock_put.call_args.kwargs['data'], content)
+    
     def test_upload_no_token_raises(self):
         """Should raise PermissionError when no token."""
         with self.app.test_request_context():
@@ -200,7 +233,7 @@ class TestSpUpload(unittest.TestCase):
             
             self.assertIn('SESSION_EXPIRED', str(ctx.exception))
     
-    @patch('app.services.sp_upload.requests.put')
+    @patch('app.services.sp_upload.http_session.put')
     def test_upload_401_raises_permission_error(self, mock_put):
         """Should raise PermissionError on 401 response."""
         with self.app.test_request_context():
@@ -214,7 +247,7 @@ class TestSpUpload(unittest.TestCase):
             with self.assertRaises(PermissionError):
                 sp_upload.upload_file('drive123', '', 'test.docx', b'content')
     
-    @patch('app.services.sp_upload.requests.put')
+    @patch('app.services.sp_upload.http_session.put')
     def test_upload_other_error_raises_upload_error(self, mock_put):
         """Should raise UploadError on non-401 errors."""
         with self.app.test_request_context():
@@ -297,7 +330,7 @@ class TestApplySuggestionsRoute(unittest.TestCase):
         data = json.loads(response.data)
         self.assertIn('error', data)
     
-    @patch('app.services.sharepoint_service.requests.post')
+    @patch('app.services.sharepoint_service.http_session.post')
     def test_apply_suggestions_contract_not_found(self, mock_post):
         """Should return 404 for missing contract."""
         with self.client.session_transaction() as sess:
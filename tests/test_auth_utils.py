@@ -0,0 +1,66 @@
+"""
+Unit tests for auth_utils module.
+Tests the login_required decorator's authentication and absolute session timeout checks.
+"""
+import pytest
+from unittest.mock import patch
+from flask import Flask, session, get_flashed_messages
+
+from app.utils import auth_utils
+from app.utils.auth_utils import login_required
+
+
+@pytest.fixture
+def app():
+    """Minimal Flask app with a login route and one protected route."""
+    flask_app = Flask(__name__)
+    flask_app.secret_key = 'test-secret'
+    flask_app.add_url_rule('/login', 'auth.login', lambda: 'login')
+
+    @flask_app.route('/protected')
+    @login_required
+    def protected():
+        return 'ok'
+
+    return flask_app
+
+
+def _request(app, **session_data):
+    """Run the protected view with the given session contents."""
+    with app.test_request_context('/protected'):
+        session.update({'access_token': 'tok', 'user_email': 'user@peakmade.com'}, **session_data)
+        response = app.view_functions['protected']()
+        return response, dict(session), get_flashed_messages()
+
+
+class TestLoginRequired:
+    """Test suite for login_required."""
+
+    def test_unauthenticated_redirects(self, app):
+        with app.test_request_context('/protected'):
+            response = app.view_functions['protected']()
+            assert response.status_code == 302
+            assert session['next_url'].endswith('/protected')
+
+    def test_within_session_lifetime(self, app):
+        with patch.object(auth_utils.time, 'time', return_value=10_000):
+            response, _, _ = _request(app, login_time_ts=10_000 - 60)
+        assert response == 'ok'
+
+    def test_session_lifetime_exceeded(self, app):
+        with patch.object(auth_utils.time, 'time', return_value=100_000):
+            response, data, flashed = _request(app, login_time_ts=100_000 - auth_utils.MAX_SESSION_SECONDS - 1)
+        assert response.status_code == 302
+        assert 'access_token' not in data
+        assert flashed
+
+    def test_legacy_iso_login_time_backfilled(self, app):
+        with patch.object(auth_utils.time, 'time', return_value=1_700_000_060):
+            response, data, _ = _request(app, login_time='2023-11-14T22:13:20+00:00')
+        assert response == 'ok'
+        assert data['login_time_ts'] == 1_700_000_000
+
+    def test_unparseable_login_time_clears_session(self, app):
+        response, data, _ = _request(app, login_time='not-a-date')
+        assert response.status_code == 302
+        assert 'access_token' not in data
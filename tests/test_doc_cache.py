@@ -0,0 +1,73 @@
+"""
+Unit tests for the local contract document cache.
+"""
+import io
+from unittest.mock import patch
+
+import pytest
+
+from app.services import doc_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    doc_cache.clear()
+    yield
+    doc_cache.clear()
+
+
+class TestDocCache:
+    """Test suite for doc_cache put/get."""
+
+    def test_put_path_moves_file_and_get_returns_owned_copy(self, tmp_path):
+        downloaded = tmp_path / 'download.docx'
+        downloaded.write_bytes(b'contract bytes')
+
+        assert doc_cache.put('user@peakmade.com', 'C1', downloaded) is True
+        assert not downloaded.exists()
+
+        copy = doc_cache.get('user@peakmade.com', 'C1')
+        assert copy.suffix == '.docx'
+        assert copy.read_bytes() == b'contract bytes'
+
+        # The caller unlinks its copy (as with download_contract); the cached one stays
+        copy.unlink()
+        second = doc_cache.get('user@peakmade.com', 'C1')
+        assert second.read_bytes() == b'contract bytes'
+        second.unlink()
+
+    def test_put_file_object_copies_from_start(self):
+        buffer = io.BytesIO(b'in-memory download')
+        buffer.read()
+
+        assert doc_cache.put('user@peakmade.com', 'C1', buffer, suffix='.pdf') is True
+        assert not buffer.closed
+
+        copy = doc_cache.get('user@peakmade.com', 'C1')
+        assert copy.suffix == '.pdf'
+        assert copy.read_bytes() == b'in-memory download'
+        copy.unlink()
+
+    def test_entries_are_per_user(self):
+        doc_cache.put('owner@peakmade.com', 'C1', io.BytesIO(b'x'))
+
+        assert doc_cache.get('other@peakmade.com', 'C1') is None
+        assert doc_cache.get(None, 'C1') is None
+        assert doc_cache.put(None, 'C2', io.BytesIO(b'x')) is False
+
+    def test_expired_entries_miss(self):
+        doc_cache.put('user@peakmade.com', 'C1', io.BytesIO(b'x'), ttl=60)
+
+        with patch('app.services.doc_cache.time.time', return_value=doc_cache.time.time() + 61):
+            assert doc_cache.get('user@peakmade.com', 'C1') is None
+
+    def test_least_recently_used_evicted_past_cap(self):
+        with patch.object(doc_cache, 'DOC_CACHE_MAX_FILES', 2):
+            doc_cache.put('user@peakmade.com', 'C1', io.BytesIO(b'1'))
+            doc_cache.put('user@peakmade.com', 'C2', io.BytesIO(b'2'))
+            doc_cache.get('user@peakmade.com', 'C1').unlink()  # C1 now most recently used
+            doc_cache.put('user@peakmade.com', 'C3', io.BytesIO(b'3'))
+
+        assert doc_cache.get('user@peakmade.com', 'C2') is None
+        assert doc_cache.get('user@peakmade.com', 'C1') is not None
+        assert doc_cache.get('user@peakmade.com', 'C3') is not None
@@ -0,0 +1,44 @@
+"""
+Unit tests for error_utils module.
+Tests the json_errors route decorator.
+"""
+import pytest
+from flask import Flask, jsonify
+
+from app.utils.error_utils import json_errors
+
+
+@pytest.fixture
+def client():
+    """Minimal Flask app with one healthy and one failing JSON route."""
+    flask_app = Flask(__name__)
+
+    @flask_app.route('/ok')
+    @json_errors
+    def ok():
+        return jsonify({'success': True})
+
+    @flask_app.route('/boom')
+    @json_errors
+    def boom():
+        raise RuntimeError('Graph unavailable')
+
+    return flask_app.test_client()
+
+
+class TestJsonErrors:
+    """Test suite for the json_errors decorator."""
+
+    def test_passes_through_normal_response(self, client):
+        response = client.get('/ok')
+        assert response.status_code == 200
+        assert response.get_json() == {'success': True}
+
+    def test_exception_becomes_json_500(self, client, caplog):
+        response = client.get('/boom')
+
+        assert response.status_code == 500
+        assert response.get_json() == {'success': False, 'error': 'Graph unavailable'}
+        record = next(r for r in caplog.records if r.name == 'app.utils.error_utils')
+        assert 'boom' in record.getMessage()
+        assert record.exc_info is not None
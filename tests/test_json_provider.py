@@ -0,0 +1,47 @@
+"""
+Unit tests for the orjson JSON provider.
+Checks that responses match Flask's default provider.
+"""
+import decimal
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask, jsonify
+from flask.json.provider import DefaultJSONProvider
+
+pytest.importorskip('orjson')
+from app.utils.json_provider import OrjsonProvider
+
+
+PAYLOAD = {
+    'success': True,
+    'contracts': [{'name': 'Lease – Ünïcode', 'id': 7, 'status': None}],
+    'ts': datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    'amount': decimal.Decimal('1.50'),
+}
+
+
+def _body(provider_class):
+    app = Flask(__name__)
+    app.json = provider_class(app)
+    with app.app_context():
+        response = jsonify(PAYLOAD)
+        return response.get_data(), response.mimetype, app.json.loads(response.get_data())
+
+
+class TestOrjsonProvider:
+    """Test suite for OrjsonProvider."""
+
+    def test_response_matches_default_provider(self):
+        fast_body, fast_mimetype, fast_data = _body(OrjsonProvider)
+        default_body, _, default_data = _body(DefaultJSONProvider)
+
+        assert fast_mimetype == 'application/json'
+        assert fast_data == default_data
+        assert fast_body.endswith(b'\n')
+        assert fast_data['ts'] == 'Thu, 02 Jan 2025 03:04:05 GMT'
+
+    def test_dumps_returns_str_for_templates(self):
+        app = Flask(__name__)
+        app.json = OrjsonProvider(app)
+        assert app.json.dumps({'b': 1, 'a': [1, 2]}) == '{"a":[1,2],"b":1}'
@@ -0,0 +1,118 @@
+"""
+Unit tests for party_replacer module.
+Tests contractor/customer term replacement in suggestion text.
+"""
+import pytest
+from app.utils.party_replacer import replace_party_terms, transform_suggestions
+
+
+@pytest.fixture
+def party_info():
+    """Party info with both roles resolved."""
+    return {
+        'found': True,
+        'party1': {'legal_name': 'HIS Holdings LLC', 'defined_as': 'HIS', 'role': 'contractor'},
+        'party2': {'legal_name': 'Partner Inc.', 'defined_as': 'Partner', 'role': 'customer'}
+    }
+
+
+class TestReplacePartyTerms:
+    """Test suite for replace_party_terms."""
+
+    def test_replaces_both_roles(self, party_info):
+        text = "Contractor shall notify Customer within 30 days."
+        assert replace_party_terms(text, party_info) == "HIS shall notify Partner within 30 days."
+
+    def test_replaces_possessive_forms(self, party_info):
+        text = "Contractor's obligations survive Customer's termination."
+        assert replace_party_terms(text, party_info) == "HIS's obligations survive Partner's termination."
+
+    def test_possessive_for_name_ending_in_s(self, party_info):
+        party_info['party2']['defined_as'] = 'Residents'
+        assert replace_party_terms("Customer's rights", party_info) == "Residents' rights"
+
+    def test_case_insensitive(self, party_info):
+        assert replace_party_terms("the CONTRACTOR and the customer", party_info) == "the HIS and the Partner"
+
+    def test_respects_word_boundaries(self, party_info):
+        text = "Subcontractors and Customers are unaffected."
+        assert replace_party_terms(text, party_info) == text
+
+    def test_not_found_returns_original(self):
+        text = "Contractor shall indemnify Customer."
+        assert replace_party_terms(text, {'found': False}) == text
+        assert replace_party_terms(text, None) == text
+
+    def test_only_one_role_resolved(self, party_info):
+        party_info['party2']['role'] = 'unknown'
+        assert replace_party_terms("Contractor and Customer", party_info) == "HIS and Customer"
+
+    def test_roles_swapped(self, party_info):
+        party_info['party1']['role'] = 'customer'
+        party_info['party2']['role'] = 'contractor'
+        assert replace_party_terms("Contractor pays Customer", party_info) == "Partner pays HIS"
+
+    def test_replacement_names_are_not_rescanned(self, party_info):
+        party_info['party1']['defined_as'] = 'Customer Care Co'
+        assert replace_party_terms("Contractor serves Customer", party_info) == "Customer Care Co serves Partner"
+
+
+class TestTransformSuggestions:
+    """Test suite for transform_suggestions."""
+
+    def test_transforms_each_item(self, party_info):
+        items = [
+            {'standard': 'Indemnification', 'suggestion': 'Contractor shall indemnify Customer.'},
+            {'standard': 'Notices', 'suggestion': 'All notices must be in writing.'},
+            {'standard': 'Insurance', 'suggestion': None},
+        ]
+        result = transform_suggestions(items, party_info)
+
+        assert [item['suggestion'] for item in result] == [
+            'HIS shall indemnify Partner.',
+            'All notices must be in writing.',
+            None,
+        ]
+        assert [item['standard'] for item in result] == ['Indemnification', 'Notices', 'Insurance']
+
+    def test_does_not_mutate_input(self, party_info):
+        items = [{'standard': 'Indemnification', 'suggestion': 'Contractor shall indemnify Customer.'}]
+        transform_suggestions(items, party_info)
+        assert items[0]['suggestion'] == 'Contractor shall indemnify Customer.'
+
+    def test_not_found_returns_items_unchanged(self):
+        items = [{'standard': 'Indemnification', 'suggestion': 'Contractor shall indemnify Customer.'}]
+        assert transform_suggestions(items, {'found': False}) is items
+
+    def test_unchanged_items_are_not_copied(self, party_info):
+        items = [
+            {'standard': 'Notices', 'suggestion': 'All notices must be in writing.'},
+            {'standard': 'Indemnification', 'suggestion': 'Contractor shall indemnify Customer.'},
+        ]
+        result = transform_suggestions(items, party_info)
+        assert result[0] is items[0]
+        assert result[1] is not items[1]
+
+    def test_batch_path_matches_per_item_path(self, party_info):
+        texts = [
+            "Contractor's fee is payable by Customer.",
+            None,
+            "No party terms here.",
+            "CUSTOMER may terminate; Contractor shall cooperate.",
+            "Subcontractors excluded.",
+            "Customer's approval is required.",
+        ]
+        items = [{'standard': f'S{i}', 'suggestion': text} for i, text in enumerate(texts)]
+        result = transform_suggestions(items, party_info)
+
+        assert [item['suggestion'] for item in result] == [
+            replace_party_terms(text, party_info) if text else text for text in texts
+        ]
+        assert result[1] is items[1]
+        assert result[2] is items[2]
+        assert result[4] is items[4]
+
+    def test_batch_path_with_separator_in_text(self, party_info):
+        items = [{'standard': f'S{i}', 'suggestion': 'Contractor\x1eCustomer'} for i in range(6)]
+        result = transform_suggestions(items, party_info)
+        assert all(item['suggestion'] == 'HIS\x1ePartner' for item in result)
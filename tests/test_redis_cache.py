@@ -0,0 +1,72 @@
+"""
+Unit tests for the Redis-backed analysis cache.
+Uses an in-memory stand-in for the redis client.
+"""
+from unittest.mock import patch
+
+from app import cache
+from app.cache import RedisCache, TTLCache
+
+
+class FakeRedis:
+    """Records SETEX calls and serves stored bytes back."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value.encode('utf-8')
+        self.ttls[key] = ttl
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip('*')
+        return iter([key for key in self.store if key.startswith(prefix)])
+
+
+class TestRedisCache:
+    """Test suite for RedisCache."""
+
+    def test_round_trip_as_json(self):
+        client = FakeRedis()
+        redis_cache = RedisCache(client)
+        redis_cache.set('c1', {'results': {'Notices': 'ok'}, 'ts': '2024-01-01'}, ttl=1800)
+
+        assert client.ttls == {'analysis:c1': 1800}
+        assert redis_cache.get('c1') == {'results': {'Notices': 'ok'}, 'ts': '2024-01-01'}
+
+    def test_missing_and_deleted_keys(self):
+        redis_cache = RedisCache(FakeRedis())
+        assert redis_cache.get('missing') is None
+        redis_cache.set('c1', {'a': 1}, ttl=60)
+        redis_cache.delete('c1')
+        assert redis_cache.get('c1') is None
+
+    def test_clear_only_touches_own_prefix(self):
+        client = FakeRedis()
+        RedisCache(client, prefix='is_admin:').set('a@example.com', True, ttl=600)
+        RedisCache(client).set('c1', {'a': 1}, ttl=60)
+
+        RedisCache(client, prefix='is_admin:').clear()
+        assert list(client.store) == ['analysis:c1']
+
+    def test_factory_with_redis_client(self):
+        with patch.object(cache, 'get_redis_client', return_value=FakeRedis()):
+            shared = cache.create_shared_cache('is_admin:')
+        shared.set('user@peakmade.com', False, ttl=300)
+        assert shared.get('user@peakmade.com') is False
+
+    def test_factory_without_redis_url(self):
+        with patch.dict('os.environ', {}, clear=True):
+            assert isinstance(cache.create_shared_cache('analysis:'), TTLCache)
+
+    def test_no_redis_client_without_redis_url(self):
+        with patch.dict('os.environ', {}, clear=True), patch.object(cache, '_redis_client', None):
+            assert cache.get_redis_client() is None
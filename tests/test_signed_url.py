@@ -0,0 +1,83 @@
+"""
+Unit tests for signed_url module.
+Tests HMAC-signed download paths and their verification.
+"""
+import time
+import pytest
+from urllib.parse import urlparse, parse_qs
+from flask import Flask
+
+from app.utils.signed_url import make_signed_path, verify_signed
+
+
+@pytest.fixture
+def app():
+    """Minimal Flask app exposing the download route used by make_signed_path."""
+    flask_app = Flask(__name__)
+
+    @flask_app.route('/contracts/<contract_id>/download_edited')
+    def download_edited_contract(contract_id):
+        return ''
+
+    with flask_app.test_request_context():
+        yield flask_app
+
+
+def _parse(path):
+    parsed = urlparse(path)
+    query = parse_qs(parsed.query)
+    return parsed.path, query['exp'][0], query['sig'][0]
+
+
+class TestSignedUrl:
+    """Test suite for make_signed_path / verify_signed."""
+
+    def test_round_trip(self, app):
+        path, exp, sig = _parse(make_signed_path('ABC123', ttl_sec=300))
+        assert path == '/contracts/ABC123/download_edited'
+        assert verify_signed('ABC123', exp, sig) is True
+
+    def test_expiration_in_future(self, app):
+        _, exp, _ = _parse(make_signed_path('ABC123', ttl_sec=300))
+        assert int(time.time()) < int(exp) <= int(time.time()) + 300
+
+    def test_wrong_contract_rejected(self, app):
+        _, exp, sig = _parse(make_signed_path('ABC123'))
+        assert verify_signed('XYZ999', exp, sig) is False
+
+    def test_tampered_signature_rejected(self, app):
+        _, exp, sig = _parse(make_signed_path('ABC123'))
+        tampered = ('0' if sig[0] != '0' else '1') + sig[1:]
+        assert verify_signed('ABC123', exp, tampered) is False
+
+    def test_tampered_expiration_rejected(self, app):
+        _, exp, sig = _parse(make_signed_path('ABC123'))
+        assert verify_signed('ABC123', str(int(exp) + 3600), sig) is False
+
+    def test_expired_rejected(self, app):
+        _, exp, sig = _parse(make_signed_path('ABC123', ttl_sec=-10))
+        assert verify_signed('ABC123', exp, sig) is False
+
+    def test_malformed_expiration_rejected(self):
+        assert verify_signed('ABC123', 'not-a-number', 'abc') is False
+        assert verify_signed('ABC123', None, 'abc') is False
+
+    def test_malformed_signature_rejected(self, app):
+        _, exp, _ = _parse(make_signed_path('ABC123'))
+        assert verify_signed('ABC123', exp, None) is False
+        assert verify_signed('ABC123', exp, 'sïg') is False
+
+    def test_non_ascii_contract_id_round_trip(self, app):
+        _, exp, sig = _parse(make_signed_path('Résumé-1'))
+        assert verify_signed('Résumé-1', exp, sig) is True
+
+    def test_cached_template_matches_url_for(self, app):
+        from flask import url_for
+
+        path = make_signed_path('ABC-123.v2')
+        _, exp, sig = _parse(path)
+        assert path == url_for('download_edited_contract', contract_id='ABC-123.v2', exp=exp, sig=sig)
+
+    def test_id_needing_encoding_uses_url_for(self, app):
+        path = make_signed_path('A B/1')
+        assert urlparse(path).path == '/contracts/A%20B/1/download_edited'
@@ -0,0 +1,88 @@
+"""
+Unit tests for sp_download module.
+Tests streaming a Graph download into a temporary file or memory.
+"""
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from app.services import sp_download
+
+
+def _streamed_response(chunks):
+    response = MagicMock(status_code=200, ok=True)
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
+class TestDownloadToFile:
+    """Test suite for _download_to_file."""
+
+    def test_streams_chunks_to_temp_file(self):
+        response = _streamed_response([b'PK\x03\x04', b'rest of docx'])
+        with patch.object(sp_download.http_session, 'get', return_value=response) as mock_get:
+            path = sp_download._download_to_file('https://graph/content', 'tok', '.docx')
+        try:
+            assert path.suffix == '.docx'
+            assert path.read_bytes() == b'PK\x03\x04rest of docx'
+            assert mock_get.call_args.kwargs['stream'] is True
+        finally:
+            path.unlink()
+
+    def test_broken_stream_removes_partial_file(self, tmp_path):
+        def chunks():
+            yield b'partial'
+            raise requests.ConnectionError('reset')
+
+        response = _streamed_response(chunks())
+        with patch.object(sp_download.http_session, 'get', return_value=response), \
+             patch.object(sp_download, 'NamedTemporaryFile',
+                          side_effect=lambda **kw: open(tmp_path / 'dl.docx', 'wb')):
+            with pytest.raises(RuntimeError):
+                sp_download._download_to_file('https://graph/content', 'tok', '.docx')
+
+        assert not (tmp_path / 'dl.docx').exists()
+
+
+class TestDownloadToBuffer:
+    """Test suite for _download_to_buffer."""
+
+    def test_streams_chunks_into_rewound_buffer(self):
+        response = _streamed_response([b'PK\x03\x04', b'rest of docx'])
+        with patch.object(sp_download.http_session, 'get', return_value=response):
+            buffer = sp_download._download_to_buffer('https://graph/content', 'tok', '.docx')
+        with buffer:
+            assert buffer.read() == b'PK\x03\x04rest of docx'
+            assert sp_download._downloaded_size(buffer) == 16
+            assert buffer.tell() == 0
+
+    def test_broken_stream_raises_runtime_error(self):
+        def chunks():
+            yield b'partial'
+            raise requests.ConnectionError('reset')
+
+        with patch.object(sp_download.http_session, 'get', return_value=_streamed_response(chunks())):
+            with pytest.raises(RuntimeError):
+                sp_download._download_to_buffer('https://graph/content', 'tok', '.docx')
+
+
+class TestStreamContractByFilename:
+    """Test suite for stream_contract_by_filename."""
+
+    @pytest.fixture(autouse=True)
+    def token(self):
+        with patch.object(sp_download, '_get_bearer_token', return_value='tok'):
+            yield
+
+    def test_returns_unread_streamed_response(self):
+        response = _streamed_response([b'docx'])
+        with patch.object(sp_download.http_session, 'get', return_value=response) as mock_get:
+            assert sp_download.stream_contract_by_filename('drive', 'a_edited.docx') is response
+        assert mock_get.call_args.kwargs['stream'] is True
+        response.iter_content.assert_not_called()
+
+    def test_not_found(self):
+        response = MagicMock(status_code=404)
+        with patch.object(sp_download.http_session, 'get', return_value=response):
+            with pytest.raises(FileNotFoundError):
+                sp_download.stream_contract_by_filename('drive', 'a_edited.docx')
@@ -0,0 +1,72 @@
+"""
+Unit tests for sp_preferred_standards module.
+Tests loading and caching of preferred standards with a mocked SharePoint fetch.
+"""
+import pytest
+import requests
+from unittest.mock import patch
+from flask import Flask, session
+
+from app.services import sp_preferred_standards
+
+
+def _list_response(*names):
+    return {'value': [{'fields': {'Standard': name, 'Clause': f'{name} clause'}} for name in names]}
+
+
+@pytest.fixture
+def request_ctx():
+    """Request context with a delegated token and a configured list ID."""
+    flask_app = Flask(__name__)
+    flask_app.secret_key = 'test-secret'
+    with flask_app.test_request_context(), \
+         patch.dict('os.environ', {'PREFERRED_STANDARDS_LIST_ID': 'list-id'}), \
+         patch.object(sp_preferred_standards, '_standards_cache', sp_preferred_standards.TTLCache()):
+        session['access_token'] = 'tok'
+        yield
+
+
+@pytest.fixture
+def fetch():
+    with patch.object(sp_preferred_standards, '_fetch_preferred_standards_list') as mock_fetch:
+        yield mock_fetch
+
+
+class TestPreferredStandardsCache:
+    """Test suite for the preferred standards TTL cache."""
+
+    def test_second_call_served_from_cache(self, request_ctx, fetch):
+        fetch.return_value = _list_response('Indemnification', 'Notices')
+
+        first = sp_preferred_standards.get_preferred_standards()
+        second = sp_preferred_standards.get_preferred_standards_dict()
+
+        fetch.assert_called_once()
+        assert [s['standard'] for s in first] == ['Indemnification', 'Notices']
+        assert second == {'Indemnification': 'Indemnification clause', 'Notices': 'Notices clause'}
+
+    def test_returned_list_is_a_copy(self, request_ctx, fetch):
+        fetch.return_value = _list_response('Indemnification')
+        sp_preferred_standards.get_preferred_standards().clear()
+        assert len(sp_preferred_standards.get_preferred_standards()) == 1
+
+    def test_fallback_not_cached(self, request_ctx, fetch):
+        fetch.side_effect = [requests.ConnectionError(), _list_response('Indemnification')]
+
+        fallback = sp_preferred_standards.get_preferred_standards()
+        assert fallback == sp_preferred_standards._get_fallback_standards()
+        assert [s['standard'] for s in sp_preferred_standards.get_preferred_standards()] == ['Indemnification']
+
+    def test_clear_forces_refetch(self, request_ctx, fetch):
+        fetch.return_value = _list_response('Indemnification')
+        sp_preferred_standards.get_preferred_standards()
+        sp_preferred_standards.clear_preferred_standards_cache()
+        sp_preferred_standards.get_preferred_standards()
+        assert fetch.call_count == 2
+
+    def test_no_token_skips_cache_and_fetch(self, request_ctx, fetch):
+        fetch.return_value = _list_response('Indemnification')
+        sp_preferred_standards.get_preferred_standards()
+        session.pop('access_token')
+        assert sp_preferred_standards.get_preferred_standards() == []
+        fetch.assert_called_once()
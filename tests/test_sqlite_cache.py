@@ -0,0 +1,58 @@
+"""
+Unit tests for the SQLite-backed shared cache.
+Uses a throwaway database file per test.
+"""
+from unittest.mock import patch
+
+from app import cache
+from app.cache import SQLiteCache
+
+
+class TestSQLiteCache:
+    """Test suite for SQLiteCache."""
+
+    def test_round_trip_as_json(self, tmp_path):
+        db_cache = SQLiteCache(str(tmp_path / 'cache.db'))
+        db_cache.set('c1', {'results': {'Notices': 'ok'}, 'ts': 1700000000000000000}, ttl=1800)
+
+        assert db_cache.get('c1') == {'results': {'Notices': 'ok'}, 'ts': 1700000000000000000}
+
+    def test_visible_to_another_connection(self, tmp_path):
+        path = str(tmp_path / 'cache.db')
+        SQLiteCache(path).set('c1', {'a': 1}, ttl=60)
+
+        # A second instance stands in for another gunicorn worker or a restarted one
+        assert SQLiteCache(path).get('c1') == {'a': 1}
+
+    def test_expired_missing_and_deleted_keys(self, tmp_path):
+        db_cache = SQLiteCache(str(tmp_path / 'cache.db'))
+        assert db_cache.get('missing') is None
+
+        db_cache.set('c1', {'a': 1}, ttl=60)
+        db_cache.delete('c1')
+        assert db_cache.get('c1') is None
+
+        db_cache.set('c2', {'a': 2}, ttl=60)
+        with patch('app.cache.time.time', return_value=cache.time.time() + 61):
+            assert db_cache.get('c2') is None
+
+    def test_clear_only_touches_own_prefix(self, tmp_path):
+        path = str(tmp_path / 'cache.db')
+        SQLiteCache(path, prefix='edited_download:').set('c1', {'a': 1}, ttl=60)
+        # '_' must not act as a LIKE wildcard when clearing 'edited_download:'
+        SQLiteCache(path, prefix='editedXdownload:').set('c1', {'b': 2}, ttl=60)
+        SQLiteCache(path).set('c1', {'c': 3}, ttl=60)
+
+        SQLiteCache(path, prefix='edited_download:').clear()
+        assert SQLiteCache(path, prefix='edited_download:').get('c1') is None
+        assert SQLiteCache(path, prefix='editedXdownload:').get('c1') == {'b': 2}
+        assert SQLiteCache(path).get('c1') == {'c': 3}
+
+    def test_factory_with_cache_db_path(self, tmp_path):
+        path = str(tmp_path / 'cache.db')
+        with patch.dict('os.environ', {'CACHE_DB_PATH': path}, clear=True), \
+                patch.object(cache, '_redis_client', None):
+            shared = cache.create_shared_cache('is_admin:')
+        assert isinstance(shared, SQLiteCache)
+        shared.set('user@peakmade.com', False, ttl=300)
+        assert shared.get('user@peakmade.com') is False
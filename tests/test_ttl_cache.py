@@ -0,0 +1,54 @@
+"""
+Unit tests for the in-process TTLCache under concurrent access.
+"""
+import threading
+
+from app.cache import TTLCache
+
+
+class TestTTLCacheThreadSafety:
+    """TTLCache is shared by gthread request threads and io_executor."""
+
+    def test_concurrent_set_get_delete(self):
+        ttl_cache = TTLCache()
+        errors = []
+        start = threading.Barrier(8)
+
+        def worker(n):
+            try:
+                start.wait()
+                for i in range(2000):
+                    key = f"{n}:{i % 50}"
+                    # ttl=0 entries expire at once, so every call also purges
+                    ttl_cache.set(key, i, ttl=0 if i % 2 else 60)
+                    ttl_cache.get(key)
+                    if i % 7 == 0:
+                        ttl_cache.delete(key)
+                    if i % 500 == 0:
+                        ttl_cache.clear()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+    def test_get_set_delete_clear(self):
+        ttl_cache = TTLCache()
+        ttl_cache.set('c1', {'a': 1}, ttl=60)
+        assert ttl_cache.get('c1') == {'a': 1}
+
+        ttl_cache.delete('c1')
+        ttl_cache.delete('missing')
+        assert ttl_cache.get('c1') is None
+
+        ttl_cache.set('c2', 2, ttl=0)
+        assert ttl_cache.get('c2') is None
+
+        ttl_cache.set('c3', 3, ttl=60)
+        ttl_cache.clear()
+        assert ttl_cache.get('c3') is None